@@ -0,0 +1,23 @@
+"""
+Performance benchmarks of Magic List.
+
+Every public method of the magic list is timed for input sizes ranging from
+10 to 10^7 items, along with equivalent code using built-in lists and
+`itertools`. For example:
+
+```sh
+python -m benchmarks                          # everything (takes a while)
+python -m benchmarks sum sorted --sizes 1000  # only some methods and sizes
+python -m benchmarks -o new.json --compare old.json
+```
+
+The JSON reports have a stable layout so that runs of different versions can
+be diffed or compared with `--compare`.
+"""
+
+from benchmarks.cases import CASES
+from benchmarks.cases import Case
+from benchmarks.runner import Measure
+from benchmarks.runner import run
+
+__all__ = ["CASES", "Case", "Measure", "run"]
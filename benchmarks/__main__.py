@@ -0,0 +1,117 @@
+"""
+Command-line entry point of the benchmarks: `python -m benchmarks --help`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import pathlib
+import sys
+import typing
+
+from benchmarks.cases import CASES
+from benchmarks.runner import DEFAULT_SIZES
+from benchmarks.runner import compare
+from benchmarks.runner import load_report
+from benchmarks.runner import run
+from benchmarks.runner import save_report
+
+if typing.TYPE_CHECKING:
+    import collections.abc
+
+    from benchmarks.runner import Measure
+
+
+def _parse_arguments(
+    arguments: collections.abc.Sequence[str] | None,
+) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Time the methods of magic lists against built-in lists "
+        "and itertools.",
+    )
+    parser.add_argument(
+        "cases",
+        nargs="*",
+        metavar="CASE",
+        help="names of the methods to benchmark (default: all of them)",
+    )
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        type=int,
+        default=DEFAULT_SIZES,
+        metavar="SIZE",
+        help="input sizes (default: powers of 10 from 10 to 10^7)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="number of timed batches, the best one is kept (default: 5)",
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.2,
+        help="minimum duration of a timed batch in seconds (default: 0.2)",
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        type=pathlib.Path,
+        help="file to write the JSON report to",
+    )
+    parser.add_argument(
+        "--compare",
+        type=pathlib.Path,
+        metavar="REPORT",
+        help="JSON report of a previous run to compare the results with",
+    )
+
+    return parser.parse_args(arguments)
+
+
+def _print_measure(measure: Measure) -> None:
+    print(
+        f"{measure.case:<16}{measure.size:>10}  {measure.implementation:<12}"
+        f"{measure.seconds * 1e6:>16.3f} µs",
+    )
+
+
+def main(arguments: collections.abc.Sequence[str] | None = None) -> int:
+    options = _parse_arguments(arguments)
+    known_cases = {case.name: case for case in CASES}
+    unknown_cases = [name for name in options.cases if name not in known_cases]
+
+    if unknown_cases:
+        print(f"unknown cases: {', '.join(unknown_cases)}", file=sys.stderr)
+
+        return 2
+
+    cases = [known_cases[name] for name in options.cases] or CASES
+    measures = run(
+        cases,
+        options.sizes,
+        repeat=options.repeat,
+        min_time=options.min_time,
+        on_measure=_print_measure,
+    )
+
+    if options.output is not None:
+        save_report(measures, options.output)
+
+    if options.compare is not None:
+        print()
+
+        for measure, speedup in compare(load_report(options.compare), measures):
+            print(
+                f"{measure.case:<16}{measure.size:>10}  "
+                f"{measure.implementation:<12}{speedup:>10.2f}x",
+            )
+
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
@@ -0,0 +1,592 @@
+"""
+Benchmark cases: one per public method of the magic list, along with the
+equivalent code using built-in lists and `itertools`.
+"""
+
+from __future__ import annotations
+
+import array
+import asyncio
+import atexit
+import builtins
+import csv
+import dataclasses
+import functools
+import itertools
+import operator
+import pathlib
+import pickle
+import random
+import tempfile
+import typing
+from multiprocessing import shared_memory
+
+from magic_list import list
+
+if typing.TYPE_CHECKING:
+    import collections.abc
+
+__all__ = [
+    "CASES",
+    "Case",
+    "make_input",
+]
+
+_RANDOM_SEED = 0
+_SHIFT = 3
+_BATCH_SIZE = 1000
+_PARTS = 10
+_INPUT_DIRECTORY = tempfile.TemporaryDirectory()
+
+# quadratic operations (or ones that create a task per item) are not run on
+# the largest inputs
+_SMALL_MAX_SIZE = 10**5
+
+
+@dataclasses.dataclass(frozen=True)
+class Case:
+    """
+    A method to benchmark, and the equivalent implementations to compare it
+    with. Each function takes the input list (a magic list for `magic`, a
+    built-in list for the others) and is timed as a whole.
+    """
+
+    name: str
+    magic: collections.abc.Callable[[list[typing.Any]], object]
+    baselines: dict[str, collections.abc.Callable[[builtins.list[typing.Any]], object]]
+    make_input: collections.abc.Callable[[int], builtins.list[typing.Any]] = (
+        dataclasses.field(default_factory=lambda: make_input)
+    )
+    max_size: int = 10**7
+
+
+@functools.lru_cache(maxsize=1)
+def make_input(size: int) -> builtins.list[int]:
+    """
+    Return `size` random integers between 0 and `size`, the same ones for
+    every run.
+    """
+
+    generator = random.Random(_RANDOM_SEED)  # noqa: S311
+
+    return [generator.randrange(size) for _ in range(size)]
+
+
+def _make_nested_input(size: int) -> builtins.list[builtins.list[int]]:
+    items = make_input(size)
+
+    return [items[start : start + 10] for start in range(0, size, 10)]
+
+
+def _double(n: int) -> int:
+    return n * 2
+
+
+def _is_odd(n: int) -> bool:
+    return n % 2 == 1
+
+
+async def _async_double(n: int) -> int:
+    return n * 2
+
+
+async def _async_is_odd(n: int) -> bool:
+    return n % 2 == 1
+
+
+def _copied(
+    function: collections.abc.Callable[[typing.Any], object],
+) -> collections.abc.Callable[[typing.Any], object]:
+    # in-place operations are timed on a copy, so that each run gets the
+    # same input
+    def wrapper(items: typing.Any) -> object:
+        items = items.copy()
+        function(items)
+
+        return items
+
+    return wrapper
+
+
+async def _gather_map(items: builtins.list[int]) -> builtins.list[int]:
+    return builtins.list(await asyncio.gather(*map(_async_double, items)))
+
+
+async def _gather_filter(items: builtins.list[int]) -> builtins.list[int]:
+    bits = await asyncio.gather(*map(_async_is_odd, items))
+
+    return builtins.list(itertools.compress(items, bits))
+
+
+def _interleave(items: builtins.list[int]) -> builtins.list[int]:
+    result = builtins.list(
+        itertools.chain.from_iterable(zip(items, itertools.repeat(0))),
+    )
+    del result[-1:]
+
+    return result
+
+
+def _batched(
+    items: builtins.list[int],
+    n: int,
+) -> collections.abc.Iterator[tuple[int, ...]]:
+    # `itertools.batched` is only available since Python 3.12
+    iterator = iter(items)
+
+    return iter(lambda: tuple(itertools.islice(iterator, n)), ())
+
+
+@functools.cache
+def _input_file(size: int, suffix: str) -> pathlib.Path:
+    # the input is written once per size, in a directory removed at exit
+    path = pathlib.Path(_INPUT_DIRECTORY.name) / f"{size}{suffix}"
+    items = make_input(size)
+
+    if suffix == ".csv":
+        path.write_text("".join(f"{n},{n}\n" for n in items), encoding="utf-8")
+    else:
+        path.write_text("".join(f"{n}\n" for n in items), encoding="utf-8")
+
+    return path
+
+
+@functools.lru_cache(maxsize=1)
+def _serialized(size: int) -> bytes:
+    return list(make_input(size)).to_bytes()
+
+
+@functools.lru_cache(maxsize=1)
+def _pickled(size: int) -> bytes:
+    return pickle.dumps(make_input(size), protocol=5)
+
+
+def _to_shared(items: list[int]) -> None:
+    with items.to_shared() as shared:
+        shared.unlink()
+
+
+def _to_shareable(items: builtins.list[int]) -> None:
+    shareable = shared_memory.ShareableList(items)
+    shareable.shm.close()
+    shareable.shm.unlink()
+
+
+@functools.cache
+def _shared_input(size: int) -> str:
+    # the blocks are created once per size, and unlinked at exit
+    shared = list(make_input(size)).to_shared()
+    atexit.register(shared.unlink)
+
+    return typing.cast("str", shared.name)
+
+
+@functools.cache
+def _shareable_input(size: int) -> str:
+    shareable = shared_memory.ShareableList(make_input(size))
+    atexit.register(shareable.shm.unlink)
+
+    return shareable.shm.name
+
+
+def _sum_shared(items: list[int]) -> int:
+    with list.attach_shared(_shared_input(len(items))) as shared:
+        return shared.sum()
+
+
+def _sum_shareable(items: builtins.list[int]) -> int:
+    shareable = shared_memory.ShareableList(name=_shareable_input(len(items)))
+    total = sum(shareable)
+    shareable.shm.close()
+
+    return total
+
+
+def _read_lines(items: builtins.list[int]) -> builtins.list[int]:
+    with _input_file(len(items), ".txt").open(encoding="utf-8") as file:
+        return [int(line) for line in file]
+
+
+def _read_csv(items: builtins.list[int]) -> builtins.list[int]:
+    with _input_file(len(items), ".csv").open(encoding="utf-8", newline="") as file:
+        return [int(row[0]) for row in csv.reader(file)]
+
+
+def _first_field(row: builtins.list[str]) -> int:
+    return int(row[0])
+
+
+def _half(items: typing.Sized) -> int:
+    return len(items) // 2
+
+
+def _method_case(
+    name: str,
+    args: tuple[typing.Any, ...],
+    baselines: dict[str, collections.abc.Callable[[builtins.list[typing.Any]], object]],
+    **options: typing.Any,
+) -> Case:
+    # most cases time a single call of the method they are named after
+    return Case(name, operator.methodcaller(name, *args), baselines, **options)
+
+
+CASES: tuple[Case, ...] = (
+    # *- properties -* #
+    Case("head", operator.attrgetter("head"), {"builtin": lambda xs: xs[0]}),
+    Case("tail", operator.attrgetter("tail"), {"builtin": lambda xs: xs[1:]}),
+    Case("init", operator.attrgetter("init"), {"builtin": lambda xs: xs[:-1]}),
+    Case("last", operator.attrgetter("last"), {"builtin": lambda xs: xs[-1]}),
+    # *- ordering -* #
+    Case(
+        "prepend",
+        _copied(lambda xs: xs.prepend(0)),
+        {"builtin": _copied(lambda xs: xs.insert(0, 0))},
+    ),
+    _method_case(
+        "reversed",
+        (),
+        {
+            "builtin": lambda xs: xs[::-1],
+            "itertools": lambda xs: builtins.list(reversed(xs)),
+        },
+    ),
+    _method_case("sorted", (), {"builtin": sorted}),
+    Case(
+        "keep_sorted",
+        lambda xs: xs.sorted(keep_sorted=True),
+        {"builtin": sorted},
+    ),
+    _method_case(
+        "shuffled",
+        (),
+        {"builtin": lambda xs: random.sample(xs, len(xs))},
+    ),
+    _method_case(
+        "rotate",
+        (_SHIFT,),
+        {"builtin": lambda xs: xs[-_SHIFT:] + xs[:-_SHIFT]},
+    ),
+    Case(
+        "rotate_inplace",
+        _copied(lambda xs: xs.rotate_inplace(_SHIFT)),
+        {
+            "builtin": _copied(
+                lambda xs: xs.__setitem__(slice(None), xs[-_SHIFT:] + xs[:-_SHIFT])
+            )
+        },
+    ),
+    Case(
+        "irotate",
+        lambda xs: builtins.list(xs.irotate(_SHIFT)),
+        {
+            "itertools": lambda xs: builtins.list(
+                itertools.chain(xs[-_SHIFT:], xs[:-_SHIFT]),
+            ),
+        },
+    ),
+    # *- other representations -* #
+    Case(
+        "lazy",
+        lambda xs: xs.lazy().map(_double).filter(_is_odd).collect(),
+        {
+            "builtin": lambda xs: [n * 2 for n in xs if n * 2 % 2 == 1],
+            "itertools": lambda xs: builtins.list(filter(_is_odd, map(_double, xs))),
+        },
+    ),
+    Case("view", lambda xs: xs.view().tail.tail, {"builtin": lambda xs: xs[2:]}),
+    _method_case(
+        "typed",
+        (),
+        {"builtin": lambda xs: array.array("q", xs)},
+    ),
+    _method_case(
+        "cached",
+        (),
+        {"builtin": builtins.list},
+    ),
+    Case(
+        "indexed",
+        lambda xs: xs.indexed().count(0),
+        {"builtin": lambda xs: xs.count(0)},
+    ),
+    Case(
+        "paged",
+        lambda xs: xs.paged().sum(),
+        {"builtin": sum},
+    ),
+    _method_case(
+        "to_bytes",
+        (),
+        {"pickle": lambda xs: pickle.dumps(xs, protocol=5)},
+    ),
+    Case(
+        "from_bytes",
+        lambda xs: list.from_bytes(_serialized(len(xs))),
+        {"pickle": lambda xs: pickle.loads(_pickled(len(xs)))},  # noqa: S301
+    ),
+    Case(
+        "to_shared",
+        _to_shared,
+        {"shareable_list": _to_shareable},
+    ),
+    Case(
+        "attach_shared",
+        _sum_shared,
+        {
+            "pickle": lambda xs: sum(pickle.loads(_pickled(len(xs)))),  # noqa: S301
+            "shareable_list": _sum_shareable,
+        },
+    ),
+    Case(
+        "from_lines",
+        lambda xs: list.from_lines(_input_file(len(xs), ".txt"), parse=int),
+        {"builtin": _read_lines},
+    ),
+    Case(
+        "from_csv",
+        lambda xs: list.from_csv(_input_file(len(xs), ".csv"), parse=_first_field),
+        {"builtin": _read_csv},
+    ),
+    # *- higher-order functions -* #
+    _method_case(
+        "map",
+        (_double,),
+        {
+            "builtin": lambda xs: [n * 2 for n in xs],
+            "itertools": lambda xs: builtins.list(map(_double, xs)),
+        },
+    ),
+    Case(
+        "amap",
+        lambda xs: asyncio.run(xs.amap(_async_double)),
+        {"builtin": lambda xs: asyncio.run(_gather_map(xs))},
+        max_size=_SMALL_MAX_SIZE,
+    ),
+    _method_case(
+        "filter",
+        (_is_odd,),
+        {
+            "builtin": lambda xs: [n for n in xs if n % 2 == 1],
+            "itertools": lambda xs: builtins.list(filter(_is_odd, xs)),
+        },
+    ),
+    Case(
+        "afilter",
+        lambda xs: asyncio.run(xs.afilter(_async_is_odd)),
+        {"builtin": lambda xs: asyncio.run(_gather_filter(xs))},
+        max_size=_SMALL_MAX_SIZE,
+    ),
+    Case(
+        "mask",
+        lambda xs: xs.mask(xs.map(_is_odd)),
+        {
+            "builtin": lambda xs: [n for n, bit in zip(xs, map(_is_odd, xs)) if bit],
+            "itertools": lambda xs: builtins.list(
+                itertools.compress(xs, builtins.list(map(_is_odd, xs))),
+            ),
+        },
+    ),
+    _method_case(
+        "deduplicate",
+        (),
+        {"builtin": lambda xs: builtins.list(dict.fromkeys(xs))},
+    ),
+    _method_case(
+        "reduce",
+        (operator.add,),
+        {"itertools": lambda xs: functools.reduce(operator.add, xs)},
+    ),
+    _method_case(
+        "reduce_right",
+        (operator.add,),
+        {"itertools": lambda xs: functools.reduce(operator.add, reversed(xs))},
+    ),
+    _method_case(
+        "fold",
+        (
+            operator.add,
+            0,
+        ),
+        {"itertools": lambda xs: functools.reduce(operator.add, xs, 0)},
+    ),
+    _method_case(
+        "fold_right",
+        (
+            operator.add,
+            0,
+        ),
+        {"itertools": lambda xs: functools.reduce(operator.add, reversed(xs), 0)},
+    ),
+    _method_case(
+        "scan",
+        (
+            operator.add,
+            0,
+        ),
+        {
+            "itertools": lambda xs: builtins.list(
+                itertools.accumulate(xs, operator.add, initial=0),
+            ),
+        },
+    ),
+    _method_case(
+        "scan_right",
+        (
+            operator.add,
+            0,
+        ),
+        {
+            "itertools": lambda xs: builtins.list(
+                itertools.accumulate(reversed(xs), operator.add, initial=0),
+            ),
+        },
+    ),
+    Case(
+        "iscan",
+        lambda xs: builtins.list(xs.iscan(operator.add, 0)),
+        {
+            "itertools": lambda xs: builtins.list(
+                itertools.accumulate(xs, operator.add, initial=0),
+            ),
+        },
+    ),
+    Case(
+        "iscan_right",
+        lambda xs: builtins.list(xs.iscan_right(operator.add, 0)),
+        {
+            "itertools": lambda xs: builtins.list(
+                itertools.accumulate(reversed(xs), operator.add, initial=0),
+            ),
+        },
+    ),
+    Case(
+        "merge",
+        lambda xs: xs.merge(operator.add, xs),
+        {
+            "builtin": lambda xs: [a + b for a, b in zip(xs, xs)],
+            "itertools": lambda xs: builtins.list(map(operator.add, xs, xs)),
+        },
+    ),
+    _method_case(
+        "flatten",
+        (),
+        {
+            "builtin": lambda xs: [item for sublist in xs for item in sublist],
+            "itertools": lambda xs: builtins.list(itertools.chain.from_iterable(xs)),
+        },
+        make_input=_make_nested_input,
+    ),
+    Case(
+        "iflatten",
+        lambda xs: builtins.list(xs.iflatten()),
+        {"itertools": lambda xs: builtins.list(itertools.chain.from_iterable(xs))},
+        make_input=_make_nested_input,
+    ),
+    # *- numeric methods -* #
+    _method_case("sum", (), {"builtin": sum}),
+    _method_case("mean", (), {"builtin": lambda xs: sum(xs) / len(xs)}),
+    _method_case("min", (), {"builtin": min}),
+    _method_case("max", (), {"builtin": max}),
+    # *- filling -* #
+    Case(
+        "fill_left",
+        lambda xs: xs.fill_left(0, len(xs)),
+        {"builtin": lambda xs: [0] * len(xs) + xs},
+        max_size=_SMALL_MAX_SIZE,
+    ),
+    Case(
+        "fill_right",
+        lambda xs: xs.fill_right(0, len(xs)),
+        {"builtin": lambda xs: xs + [0] * len(xs)},
+    ),
+    _method_case(
+        "interleave",
+        (0,),
+        {"itertools": _interleave},
+    ),
+    _method_case(
+        "gap_fill",
+        (0,),
+        {"itertools": _interleave},
+    ),
+    # *- selection -* #
+    Case(
+        "select",
+        lambda xs: xs.select(range(len(xs) - 1, -1, -1)),
+        {
+            "builtin": lambda xs: [xs[i] for i in range(len(xs) - 1, -1, -1)],
+            "itertools": lambda xs: builtins.list(
+                map(xs.__getitem__, range(len(xs) - 1, -1, -1)),
+            ),
+        },
+    ),
+    Case(
+        "take", lambda xs: xs.take(_half(xs)), {"builtin": lambda xs: xs[: _half(xs)]}
+    ),
+    Case(
+        "take_right",
+        lambda xs: xs.take_right(_half(xs)),
+        {"builtin": lambda xs: xs[len(xs) - _half(xs) :]},
+    ),
+    Case(
+        "drop", lambda xs: xs.drop(_half(xs)), {"builtin": lambda xs: xs[_half(xs) :]}
+    ),
+    Case(
+        "drop_right",
+        lambda xs: xs.drop_right(_half(xs)),
+        {"builtin": lambda xs: xs[: len(xs) - _half(xs)]},
+    ),
+    Case(
+        "slice",
+        lambda xs: xs.slice(1, _half(xs)),
+        {"builtin": lambda xs: xs[1 : _half(xs) + 1]},
+    ),
+    Case(
+        "partition",
+        lambda xs: xs.partition(_half(xs)),
+        {"builtin": lambda xs: (xs[: _half(xs)], xs[_half(xs)], xs[_half(xs) + 1 :])},
+    ),
+    Case(
+        "bisect",
+        lambda xs: xs.bisect(_half(xs)),
+        {"builtin": lambda xs: (xs[: _half(xs)], xs[_half(xs) :])},
+    ),
+    Case(
+        "trisect",
+        lambda xs: xs.trisect(1, _half(xs)),
+        {"builtin": lambda xs: (xs[:1], xs[1 : _half(xs)], xs[_half(xs) :])},
+    ),
+    # *- batches -* #
+    Case(
+        "chunks",
+        lambda xs: [chunk.last for chunk in xs.chunks(_BATCH_SIZE)],
+        {
+            "builtin": lambda xs: [
+                xs[start : start + _BATCH_SIZE][-1]
+                for start in range(0, len(xs), _BATCH_SIZE)
+            ],
+            "itertools": lambda xs: [batch[-1] for batch in _batched(xs, _BATCH_SIZE)],
+        },
+    ),
+    Case(
+        "windows",
+        lambda xs: [window.last for window in xs.windows(_BATCH_SIZE)],
+        {
+            "builtin": lambda xs: [
+                xs[start : start + _BATCH_SIZE][-1]
+                for start in range(len(xs) - _BATCH_SIZE + 1)
+            ],
+        },
+        max_size=_SMALL_MAX_SIZE,
+    ),
+    Case(
+        "split_even",
+        lambda xs: [part.last for part in xs.split_even(_PARTS)],
+        {
+            "builtin": lambda xs: [
+                xs[i * len(xs) // _PARTS : (i + 1) * len(xs) // _PARTS][-1]
+                for i in range(_PARTS)
+            ],
+        },
+    ),
+)
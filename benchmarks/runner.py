@@ -0,0 +1,205 @@
+"""
+Timing of the benchmark cases, and JSON reports.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import importlib.metadata
+import json
+import platform
+import time
+import typing
+
+from magic_list import _numpy
+from magic_list import list
+
+if typing.TYPE_CHECKING:
+    import builtins
+    import collections.abc
+    import pathlib
+
+    from benchmarks.cases import Case
+
+__all__ = [
+    "DEFAULT_SIZES",
+    "Measure",
+    "compare",
+    "load_report",
+    "run",
+    "save_report",
+    "time_function",
+]
+
+DEFAULT_SIZES = tuple(10**exponent for exponent in range(1, 8))
+
+MAGIC_LIST = "magic_list"
+
+
+@dataclasses.dataclass(frozen=True)
+class Measure:
+    """
+    Best time of one implementation of a case, for one input size.
+    """
+
+    case: str
+    implementation: str
+    size: int
+    seconds: float
+
+
+def time_function(
+    function: collections.abc.Callable[[typing.Any], object],
+    argument: object,
+    *,
+    repeat: int,
+    min_time: float,
+) -> float:
+    """
+    Return the best time of a call to `function(argument)`, in seconds.
+
+    The calls are done in batches lasting at least `min_time` seconds, to
+    reduce the impact of the clock resolution, and the best of `repeat`
+    batches is kept.
+    """
+
+    number = 1
+
+    # like `timeit.Timer.autorange`, but with a configurable duration
+    while True:
+        elapsed = _time_batch(function, argument, number)
+
+        if elapsed >= min_time:
+            break
+
+        number *= 2
+
+    best = min(
+        [elapsed, *(_time_batch(function, argument, number) for _ in range(repeat - 1))]
+    )
+
+    return best / number
+
+
+def _time_batch(
+    function: collections.abc.Callable[[typing.Any], object],
+    argument: object,
+    number: int,
+) -> float:
+    start = time.perf_counter()
+
+    for _ in range(number):
+        function(argument)
+
+    return time.perf_counter() - start
+
+
+def run(
+    cases: collections.abc.Iterable[Case],
+    sizes: collections.abc.Iterable[int],
+    *,
+    repeat: int = 5,
+    min_time: float = 0.2,
+    on_measure: collections.abc.Callable[[Measure], object] | None = None,
+) -> builtins.list[Measure]:
+    """
+    Time each case for each size (up to the maximum size of the case), with
+    the magic list and the baselines.
+    """
+
+    measures: builtins.list[Measure] = []
+
+    for case in cases:
+        for size in sizes:
+            if size > case.max_size:
+                continue
+
+            items = case.make_input(size)
+            implementations = {MAGIC_LIST: case.magic, **case.baselines}
+
+            for implementation, function in implementations.items():
+                argument = list(items) if implementation == MAGIC_LIST else items
+                seconds = time_function(
+                    function,
+                    argument,
+                    repeat=repeat,
+                    min_time=min_time,
+                )
+                measure = Measure(case.name, implementation, size, seconds)
+                measures.append(measure)
+
+                if on_measure is not None:
+                    on_measure(measure)
+
+    return measures
+
+
+def _environment() -> dict[str, typing.Any]:
+    try:
+        version = importlib.metadata.version("magic-list")
+    except importlib.metadata.PackageNotFoundError:
+        version = None
+
+    return {
+        "magic_list": version,
+        "numpy": _numpy.np is not None,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+    }
+
+
+def save_report(
+    measures: collections.abc.Iterable[Measure], path: pathlib.Path
+) -> None:
+    """
+    Write the measures to `path` as JSON, in a stable order so that reports
+    of different versions can be diffed.
+    """
+
+    report = {
+        "environment": _environment(),
+        "measures": sorted(
+            (dataclasses.asdict(measure) for measure in measures),
+            key=lambda measure: (
+                measure["case"],
+                measure["size"],
+                measure["implementation"],
+            ),
+        ),
+    }
+
+    path.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+
+
+def load_report(path: pathlib.Path) -> builtins.list[Measure]:
+    """
+    Read the measures of a report written by `save_report`.
+    """
+
+    report = json.loads(path.read_text())
+
+    return [Measure(**measure) for measure in report["measures"]]
+
+
+def compare(
+    old: collections.abc.Iterable[Measure],
+    new: collections.abc.Iterable[Measure],
+) -> builtins.list[tuple[Measure, float]]:
+    """
+    Pair each new measure with its speedup relative to the same measure in
+    `old` (greater than 1 if it got faster). Measures that are not in both
+    are skipped.
+    """
+
+    old_times = {
+        (measure.case, measure.implementation, measure.size): measure.seconds
+        for measure in old
+    }
+
+    return [
+        (measure, old_times[key] / measure.seconds)
+        for measure in new
+        if (key := (measure.case, measure.implementation, measure.size)) in old_times
+        and measure.seconds > 0
+    ]
@@ -1,9 +1,29 @@
 """
-This module contains two symbols:
+This module contains the following symbols:
 
 - `list`, a type that extends the built-in equivalent
 - `L`, a pseudo-literal which can be used to create magic lists similarly to \
     built-in ones.
+- `deque`, a magic list backed by `collections.deque`, with constant-time \
+    operations on both ends
+- `LazyList`, the deferred chain of transformations returned by `list.lazy()`
+- `ListView`, the zero-copy view returned by `list.view()`
+- `RangeList`, the constant-memory list of integers returned by \
+    `L[start:stop:step]`
+- `TypedList`, a compact numeric list stored in an `array.array`
+- `CachedList`, the list returned by `list.cached()`, which memoizes its \
+    aggregates until it is mutated (see `CacheInfo`)
+- `IndexedList`, the list returned by `list.indexed()`, which keeps a map \
+    from its items to their positions for constant-time lookups
+- `PagedList`, the list returned by `list.paged()`, which spills its items \
+    to disk in pages of which only the most recently used stay in memory
+- `SharedList`, the list returned by `list.to_shared()` and \
+    `list.attach_shared()`, stored in shared memory that other processes \
+    read without copying it
+- `SortedList`, the list returned by `list.sorted(keep_sorted=True)`, which \
+    keeps its items sorted and supports binary search
+- `instrument`, a context manager recording statistics about the calls to \
+    magic list methods, which `stats` returns as `MethodStats`
 
 They can be imported as following:
 
@@ -12,7 +32,38 @@ from magic_list import list, L
 ```
 """
 
+from magic_list._cached import CachedList
+from magic_list._cached import CacheInfo
+from magic_list._deque import deque
+from magic_list._indexed import IndexedList
+from magic_list._instrument import MethodStats
+from magic_list._instrument import instrument
+from magic_list._instrument import stats
+from magic_list._lazy import LazyList
+from magic_list._paged import PagedList
+from magic_list._range import RangeList
+from magic_list._shared import SharedList
+from magic_list._sorted import SortedList
+from magic_list._typed import TypedList
+from magic_list._view import ListView
 from magic_list.prelude import L
 from magic_list.prelude import list
 
-__all__ = ["list", "L"]
+__all__ = [
+    "list",
+    "L",
+    "deque",
+    "LazyList",
+    "ListView",
+    "RangeList",
+    "TypedList",
+    "CachedList",
+    "CacheInfo",
+    "IndexedList",
+    "PagedList",
+    "SharedList",
+    "SortedList",
+    "instrument",
+    "stats",
+    "MethodStats",
+]
@@ -0,0 +1,199 @@
+"""
+Compact binary layout of homogeneous magic lists, used by `list.to_bytes`,
+`list.from_bytes` and the pickling of typed lists (protocol 5 and above).
+
+The layout is a header followed by the items, in little-endian order:
+
+- numbers are stored as an `array.array`, whose typecode and item size are
+  recorded in the header (`q` and `d` for lists of `int` and `float`) ;
+- byte strings are stored as their lengths (unsigned 64-bit integers)
+  followed by their concatenation.
+"""
+
+from __future__ import annotations
+
+import array
+import builtins
+import itertools
+import pickle
+import struct
+import sys
+import typing
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import collections.abc
+
+    import _typeshed
+
+    from magic_list._typed import TypedList
+
+__all__ = [
+    "from_bytes",
+    "pack",
+    "rebuild",
+    "reduce_buffer",
+    "to_bytes",
+]
+
+_MAGIC = b"MLST"
+_VERSION = 1
+# magic, version, kind, item size, number of items
+_HEADER = struct.Struct("<4sBcBQ")
+_BYTES_KIND = b"y"
+_LENGTH_TYPECODE = "Q"
+
+
+def pack(items: builtins.list[typing.Any]) -> array.array[typing.Any] | None:
+    """
+    Return `items` packed in an array if they are all `int` or all `float`,
+    or `None` otherwise.
+    """
+
+    # only lists of exactly `int` or `float` are packed, since `bool` and
+    # other subclasses would not survive the trip
+    types = set(map(type, items))
+
+    if types <= {int}:
+        packed = array.array("q")
+    elif types == {float}:
+        packed = array.array("d")
+    else:
+        return None
+
+    # `fromlist` is faster than the constructor, which appends each item
+    packed.fromlist(items)
+
+    return packed
+
+
+def _little_endian(items: array.array[typing.Any]) -> array.array[typing.Any]:
+    # swapping twice gives the items back, so this also reads them
+    if sys.byteorder == "big":  # pragma: no cover
+        items = array.array(items.typecode, items)
+        items.byteswap()
+
+    return items
+
+
+def to_bytes(data: collections.abc.Iterable[typing.Any]) -> bytes:
+    if isinstance(data, array.array):
+        packed: array.array[typing.Any] | None = data
+    else:
+        items = data if type(data) is builtins.list else builtins.list(data)
+
+        if items and all(type(item) is bytes for item in items):
+            lengths = array.array(_LENGTH_TYPECODE, map(len, items))
+            header = _HEADER.pack(
+                _MAGIC,
+                _VERSION,
+                _BYTES_KIND,
+                lengths.itemsize,
+                len(items),
+            )
+
+            return b"".join((header, _little_endian(lengths), *items))
+
+        try:
+            packed = pack(items)
+        except OverflowError:
+            msg = "the integers of the list do not fit in 64 bits"
+            raise ValueError(msg) from None
+
+    if packed is None:
+        msg = "only lists of int, float or bytes can be converted to bytes"
+        raise TypeError(msg)
+
+    header = _HEADER.pack(
+        _MAGIC,
+        _VERSION,
+        packed.typecode.encode(),
+        packed.itemsize,
+        len(packed),
+    )
+
+    return b"".join((header, _little_endian(packed)))
+
+
+def from_bytes(data: _typeshed.ReadableBuffer) -> collections.abc.Sequence[typing.Any]:
+    view = memoryview(data).cast("B")
+    invalid = "invalid magic list bytes"
+
+    try:
+        magic, version, kind, itemsize, size = _HEADER.unpack_from(view)
+    except struct.error:
+        raise ValueError(invalid) from None
+
+    if magic != _MAGIC or version != _VERSION:
+        raise ValueError(invalid)
+
+    # byte strings are preceded by their lengths
+    is_bytes = kind == _BYTES_KIND
+
+    try:
+        items = array.array(_LENGTH_TYPECODE if is_bytes else kind.decode())
+    except (UnicodeDecodeError, ValueError):
+        raise ValueError(invalid) from None
+
+    payload = view[_HEADER.size :]
+    length = size * itemsize
+
+    if items.itemsize != itemsize or len(payload) < length:
+        raise ValueError(invalid)
+
+    items.frombytes(payload[:length])
+    items = _little_endian(items)
+    contents = payload[length:]
+
+    if not is_bytes:
+        if contents:
+            raise ValueError(invalid)
+
+        return items
+
+    offsets = builtins.list(itertools.accumulate(items, initial=0))
+
+    if offsets[-1] != len(contents):
+        raise ValueError(invalid)
+
+    return [contents[start:stop].tobytes() for start, stop in zip(offsets, offsets[1:])]
+
+
+def reduce_buffer(instance: TypedList[typing.Any]) -> tuple[typing.Any, ...]:
+    """
+    Return the arguments of `__reduce_ex__` that pickle the array of
+    `instance` as a buffer, which can be sent out-of-band.
+    """
+
+    state = {name: value for name, value in vars(instance).items() if name != "data"}
+
+    return (
+        rebuild,
+        (
+            instance.__class__,
+            instance.data.typecode,
+            sys.byteorder,
+            pickle.PickleBuffer(instance.data),
+            state,
+        ),
+    )
+
+
+def rebuild(
+    cls: type[TypedList[typing.Any]],
+    typecode: str,
+    byteorder: str,
+    buffer: _typeshed.ReadableBuffer,
+    state: dict[str, typing.Any],
+) -> TypedList[typing.Any]:
+    items = array.array(typecode)
+    # out-of-band buffers keep the format of the array they come from
+    items.frombytes(memoryview(buffer).cast("B"))
+
+    if byteorder != sys.byteorder:
+        items.byteswap()
+
+    result = cls.__new__(cls)
+    result.__dict__.update(state)
+    result.data = items
+
+    return result
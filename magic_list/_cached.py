@@ -0,0 +1,323 @@
+from __future__ import annotations
+
+import collections
+import collections.abc
+import copy
+import functools
+import threading
+import typing
+
+from magic_list import _sum
+from magic_list.prelude import list
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import concurrent.futures
+
+    import _typeshed
+    import typing_extensions
+
+    from magic_list._sorted import SortedList
+
+__all__ = [
+    "CacheInfo",
+    "CachedList",
+]
+
+_T = typing.TypeVar("_T")
+
+DEFAULT_MAXSIZE = 128
+
+
+class CacheInfo(typing.NamedTuple):
+    """
+    Statistics of the cache of a `CachedList`.
+    """
+
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+
+class CachedList(list[_T]):
+    """
+    Magic list that memoizes the results of `sorted`, `deduplicate`, `min`,
+    `max`, `sum` and `mean` until it is mutated.
+
+    Every mutating method bumps the `version` of the list, which discards
+    the memoized results. Results are memoized per method and arguments,
+    and the least recently used ones are evicted once there are more than
+    `maxsize` of them (or never, if `maxsize` is `None`). Calls with
+    unhashable arguments are not memoized.
+
+    The lists returned by `sorted` and `deduplicate`, and the result of
+    `sum`, are copies of the memoized ones, so that they can be mutated
+    safely.
+
+    .. warning:: Mutating `data` directly does not bump the version.
+
+    >>> l = L[3, 5, 2].cached()
+    >>> l.sum(), l.sum()
+    (10, 10)
+    >>> l.cache_info()
+    CacheInfo(hits=1, misses=1, maxsize=128, currsize=1)
+    >>> l.append(4)
+    >>> l.sum()
+    14
+    """
+
+    def __init__(
+        self,
+        initlist: collections.abc.Iterable[_T] | None = None,
+        maxsize: int | None = DEFAULT_MAXSIZE,
+    ) -> None:
+        if maxsize is not None and maxsize < 0:
+            msg = "the cache size cannot be negative"
+            raise ValueError(msg)
+
+        super().__init__(initlist)
+        self._maxsize = maxsize
+        self._reset_cache()
+
+    def _reset_cache(self) -> None:
+        self._version = 0
+        self._cache: collections.OrderedDict[typing.Any, typing.Any] = (
+            collections.OrderedDict()
+        )
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        # the memoized results are not worth pickling (and may not be
+        # picklable)
+        return (self.__class__, (self.data, self._maxsize))
+
+    def __copy__(self) -> typing_extensions.Self:
+        return self._with_data(self.data[:])
+
+    def _with_data(self, data: typing.Any) -> typing_extensions.Self:
+        result = super()._with_data(data)
+        result._reset_cache()  # noqa: SLF001
+
+        return result
+
+    @property
+    def version(self) -> int:
+        """
+        Number of mutations of the list since it was created.
+
+        >>> l = L[3, 5, 2].cached()
+        >>> l.append(4)
+        >>> l.version
+        1
+        """
+
+        return self._version
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Return the statistics of the cache, like `functools.lru_cache` does.
+        """
+
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._maxsize, len(self._cache))
+
+    def cache_clear(self) -> None:
+        """
+        Discard the memoized results and reset the statistics.
+        """
+
+        with self._lock:
+            self._cache.clear()
+            self._hits = self._misses = 0
+
+    def _bump_version(self) -> None:
+        with self._lock:
+            self._version += 1
+            self._cache.clear()
+
+    def _memoize(
+        self,
+        compute: collections.abc.Callable[[], typing.Any],
+        name: str,
+        **arguments: typing.Any,
+    ) -> typing.Any:
+        key = (name, *arguments.items())
+
+        try:
+            hash(key)
+        except TypeError:
+            return compute()
+
+        with self._lock:
+            version = self._version
+
+            if key in self._cache:
+                self._hits += 1
+                self._cache.move_to_end(key)
+
+                return self._cache[key]
+
+            self._misses += 1
+
+        result = compute()
+
+        with self._lock:
+            # the list may have been mutated while the result was computed
+            if version == self._version and self._maxsize != 0:
+                self._cache[key] = result
+
+                if self._maxsize is not None and len(self._cache) > self._maxsize:
+                    self._cache.popitem(last=False)
+
+        return result
+
+    # *- memoized methods -* #
+
+    def sorted(
+        self,
+        *,
+        key: collections.abc.Callable[[_T], _typeshed.SupportsRichComparison]
+        | None = None,
+        reverse: bool = False,
+        keep_sorted: bool = False,
+    ) -> typing_extensions.Self | SortedList[_T]:
+        return self._memoize(
+            functools.partial(
+                super().sorted,
+                key=key,
+                reverse=reverse,
+                keep_sorted=keep_sorted,
+            ),
+            "sorted",
+            key=key,
+            reverse=reverse,
+            keep_sorted=keep_sorted,
+        ).copy()
+
+    def deduplicate(
+        self,
+        *,
+        key: collections.abc.Callable[[_T], typing.Any] | None = None,
+    ) -> typing_extensions.Self:
+        return self._memoize(
+            functools.partial(super().deduplicate, key=key),
+            "deduplicate",
+            key=key,
+        ).copy()
+
+    def min(self) -> typing.Any:  # pyright: ignore[reportIncompatibleMethodOverride]
+        return self._memoize(super().min, "min")
+
+    def max(self) -> typing.Any:  # pyright: ignore[reportIncompatibleMethodOverride]
+        return self._memoize(super().max, "max")
+
+    def mean(self) -> typing.Any:  # pyright: ignore[reportIncompatibleMethodOverride]
+        return self._memoize(super().mean, "mean")
+
+    def sum(
+        self,
+        *,
+        start: typing.Any = _sum.NO_START,
+        strategy: _sum.Strategy | None = None,
+        associative: bool = False,
+        workers: int | None = None,
+        executor: concurrent.futures.Executor | None = None,
+    ) -> typing.Any:
+        arguments = {
+            "start": start,
+            "strategy": strategy,
+            "associative": associative,
+            "workers": workers,
+            "executor": executor,
+        }
+
+        # the sum of mutable items (e.g. lists) is mutable too
+        return copy.copy(
+            self._memoize(
+                functools.partial(super().sum, **arguments),
+                "sum",
+                **arguments,
+            ),
+        )
+
+    # *- mutating methods: they all bump the version -* #
+
+    def __setitem__(self, i: typing.Any, item: typing.Any) -> None:
+        try:
+            super().__setitem__(i, item)
+        finally:
+            self._bump_version()
+
+    def __delitem__(self, i: typing.SupportsIndex | slice) -> None:
+        try:
+            super().__delitem__(i)
+        finally:
+            self._bump_version()
+
+    def __iadd__(self, other: collections.abc.Iterable[_T]) -> typing_extensions.Self:
+        try:
+            return super().__iadd__(other)
+        finally:
+            self._bump_version()
+
+    def __imul__(self, n: int) -> typing_extensions.Self:
+        try:
+            return super().__imul__(n)
+        finally:
+            self._bump_version()
+
+    def append(self, item: _T) -> None:
+        try:
+            super().append(item)
+        finally:
+            self._bump_version()
+
+    def insert(self, i: int, item: _T) -> None:
+        try:
+            super().insert(i, item)
+        finally:
+            self._bump_version()
+
+    def pop(self, i: int = -1) -> _T:
+        try:
+            return super().pop(i)
+        finally:
+            self._bump_version()
+
+    def remove(self, item: _T) -> None:
+        try:
+            super().remove(item)
+        finally:
+            self._bump_version()
+
+    def clear(self) -> None:
+        try:
+            super().clear()
+        finally:
+            self._bump_version()
+
+    def reverse(self) -> None:
+        try:
+            super().reverse()
+        finally:
+            self._bump_version()
+
+    def sort(self, /, *args: typing.Any, **kwds: typing.Any) -> None:
+        try:
+            super().sort(*args, **kwds)
+        finally:
+            self._bump_version()
+
+    def extend(self, other: collections.abc.Iterable[_T]) -> None:
+        try:
+            super().extend(other)
+        finally:
+            self._bump_version()
+
+    def rotate_inplace(self, n: int = 1) -> None:
+        try:
+            super().rotate_inplace(n)
+        finally:
+            self._bump_version()
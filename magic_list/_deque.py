@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import builtins
+import collections
+import collections.abc
+import itertools
+import random
+import typing
+
+from magic_list.prelude import list
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import typing_extensions
+
+__all__ = [
+    "deque",
+]
+
+_T = typing.TypeVar("_T")
+
+
+class deque(list[_T]):  # noqa: N801
+    """
+    Mutable homogeneous sequence backed by a `collections.deque`.
+
+    It provides the same methods as the magic `list`, but adding or removing
+    items at either end takes constant time, which makes `prepend` and
+    `fill_left` cheap. In exchange, accessing items by index is slower towards
+    the middle of the sequence.
+
+    >>> d = deque([3, 5, 2])
+    >>> d.prepend(-2)
+    >>> d
+    deque([-2, 3, 5, 2])
+    """
+
+    data: collections.deque[_T]  # pyright: ignore[reportIncompatibleVariableOverride]
+
+    __hash__ = None
+
+    def __init__(self, initlist: collections.abc.Iterable[_T] | None = None) -> None:
+        if initlist is None:
+            self.data = collections.deque()
+        elif isinstance(initlist, collections.UserList):
+            self.data = collections.deque(
+                typing.cast("collections.UserList[_T]", initlist).data,
+            )
+        else:
+            self.data = collections.deque(initlist)
+
+    # *- sequence protocol -* #
+
+    @typing.overload
+    def __getitem__(self, i: typing.SupportsIndex) -> _T: ...
+    @typing.overload
+    def __getitem__(self, i: slice) -> typing_extensions.Self: ...
+    def __getitem__(
+        self,
+        i: typing.SupportsIndex | slice,
+    ) -> _T | typing_extensions.Self:
+        if not isinstance(i, slice):
+            return self.data[i]
+
+        size = len(self.data)
+        indexes = range(size)[i]
+
+        if indexes.step > 0:
+            return self.__class__(
+                itertools.islice(self.data, indexes.start, indexes.stop, indexes.step),
+            )
+
+        # walking backwards: the indexes are mirrored on the reversed deque
+        return self.__class__(
+            itertools.islice(
+                reversed(self.data),
+                size - 1 - indexes.start,
+                size - 1 - indexes.stop,
+                -indexes.step,
+            ),
+        )
+
+    def __setitem__(self, i: typing.Any, item: typing.Any) -> None:
+        if not isinstance(i, slice):
+            self.data[i] = item
+            return
+
+        items = builtins.list(self.data)
+        items[i] = item
+        self.data = collections.deque(items)
+
+    def __delitem__(self, i: typing.SupportsIndex | slice) -> None:
+        if not isinstance(i, slice):
+            del self.data[i]
+            return
+
+        items = builtins.list(self.data)
+        del items[i]
+        self.data = collections.deque(items)
+
+    # *- comparisons and arithmetic -* #
+
+    def _cast(self, other: typing.Any) -> typing.Any:
+        if isinstance(other, collections.UserList):
+            other = typing.cast("collections.UserList[typing.Any]", other).data
+
+        if isinstance(other, collections.deque):
+            return builtins.list(typing.cast("collections.deque[typing.Any]", other))
+
+        return other
+
+    def __eq__(self, other: object) -> bool:
+        return builtins.list(self.data) == self._cast(other)
+
+    def __lt__(self, other: typing.Any) -> bool:
+        return builtins.list(self.data) < self._cast(other)
+
+    def __le__(self, other: typing.Any) -> bool:
+        return builtins.list(self.data) <= self._cast(other)
+
+    def __gt__(self, other: typing.Any) -> bool:
+        return builtins.list(self.data) > self._cast(other)
+
+    def __ge__(self, other: typing.Any) -> bool:
+        return builtins.list(self.data) >= self._cast(other)
+
+    def __add__(self, other: collections.abc.Iterable[_T]) -> typing_extensions.Self:
+        result = self.copy()
+        result.extend(other)
+
+        return result
+
+    def __radd__(self, other: collections.abc.Iterable[_T]) -> typing_extensions.Self:
+        result = self.__class__(other)
+        result.extend(self.data)
+
+        return result
+
+    def __iadd__(self, other: collections.abc.Iterable[_T]) -> typing_extensions.Self:
+        self.extend(other)
+
+        return self
+
+    def __copy__(self) -> typing_extensions.Self:
+        return self._with_data(self.data.copy())
+
+    # *- pre-existing methods -* #
+
+    def pop(self, i: int = -1) -> _T:
+        size = len(self.data)
+
+        if i in {-1, size - 1}:
+            return self.data.pop()
+
+        if i in {0, -size}:
+            return self.data.popleft()
+
+        item = self.data[i]
+        del self.data[i]
+
+        return item
+
+    def sort(self, /, *args: typing.Any, **kwds: typing.Any) -> None:
+        items = builtins.list(self.data)
+        items.sort(*args, **kwds)
+        self.data = collections.deque(items)
+
+    # *- magic methods -* #
+
+    def prepend(self, item: _T) -> None:
+        """
+        Add an item at the beginning of the deque, in constant time.
+
+        >>> d = deque([3, 5, 2])
+        >>> d.prepend(-2)
+        >>> print(d)
+        deque([-2, 3, 5, 2])
+        """
+
+        self.data.appendleft(item)
+
+    def shuffled(self) -> typing_extensions.Self:
+        """
+        Return a shuffled version of the deque.
+
+        The items are shuffled in a temporary list, as random access in a
+        deque is slow.
+
+        >>> deque([3, 5, 2]).shuffled()
+        deque([5, 2, 3])
+        """
+
+        items = builtins.list(self.data)
+        random.shuffle(items)
+
+        return self.__class__(items)
+
+    def rotate(self, n: int = 1) -> typing_extensions.Self:
+        """
+        Shift the deque `n` times to the right. The items that overflow get
+        prepended.
+
+        If `n` is negative, the shift goes to the left.
+
+        .. warning:: The deque must be non-empty.
+
+        >>> deque([3, 5, 2]).rotate()
+        deque([2, 3, 5])
+        >>> deque().rotate()
+        *- TypeError: empty list cannot be rotated -*
+        """
+
+        result = self.copy()
+        result.rotate_inplace(n)
+
+        return result
+
+    def rotate_inplace(self, n: int = 1) -> None:
+        """
+        Shift the deque `n` times to the right in place. The items that
+        overflow get prepended.
+
+        If `n` is negative, the shift goes to the left.
+
+        .. warning:: The deque must be non-empty.
+
+        >>> d = deque([3, 5, 2])
+        >>> d.rotate_inplace(-1)
+        >>> print(d)
+        deque([5, 2, 3])
+        """
+
+        if not self:
+            msg = "empty list cannot be rotated"
+            raise TypeError(msg)
+
+        self.data.rotate(n % len(self.data))
+
+    def irotate(self, n: int = 1) -> collections.abc.Iterator[_T]:
+        """
+        Return an iterator over the deque shifted `n` times to the right,
+        without copying it.
+
+        If `n` is negative, the shift goes to the left.
+
+        .. warning:: The deque must be non-empty, and must not be mutated \
+            while the iterator is in use.
+
+        >>> [*deque([3, 5, 2]).irotate()]
+        [2, 3, 5]
+        """
+
+        if not self:
+            msg = "empty list cannot be rotated"
+            raise TypeError(msg)
+
+        size = len(self.data)
+        start = size - n % size
+
+        return itertools.islice(
+            itertools.chain(self.data, self.data),
+            start,
+            start + size,
+        )
@@ -0,0 +1,133 @@
+"""
+Re-iterable sources reading the items of a magic list from a file, used by
+`list.from_lines` and `list.from_csv`.
+
+Each iteration opens the file again and reads it in chunks, so that a lazy
+list can run its chain several times while only holding one chunk of the
+file in memory.
+"""
+
+from __future__ import annotations
+
+import csv
+import typing
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import collections.abc
+    import os
+
+__all__ = [
+    "DEFAULT_BUFFER_SIZE",
+    "CsvSource",
+    "LineSource",
+]
+
+_T = typing.TypeVar("_T")
+
+DEFAULT_BUFFER_SIZE = 1 << 16
+
+
+class LineSource(typing.Generic[_T]):
+    """
+    Lines of a text file, without their line terminator, optionally parsed.
+    """
+
+    __slots__ = ("_buffer_size", "_encoding", "_parse", "_path")
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        parse: collections.abc.Callable[[str], _T] | None,
+        encoding: str,
+        buffer_size: int,
+    ) -> None:
+        if buffer_size <= 0:
+            msg = "the buffer size must be positive"
+            raise ValueError(msg)
+
+        self._path = path
+        self._parse = parse
+        self._encoding = encoding
+        self._buffer_size = buffer_size
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._path!r})"
+
+    def __iter__(self) -> collections.abc.Iterator[_T]:
+        with open(  # noqa: PTH123
+            self._path,
+            encoding=self._encoding,
+            buffering=self._buffer_size,
+        ) as file:
+            # the file is read in chunks, which are split on line
+            # terminators (universal newlines mode translates them all to
+            # "\n") ; the last line of a chunk is completed by the next one
+            rest = ""
+
+            while chunk := file.read(self._buffer_size):
+                lines = (rest + chunk).split("\n")
+                rest = lines.pop()
+
+                if self._parse is None:
+                    yield from typing.cast("list[_T]", lines)
+                else:
+                    yield from map(self._parse, lines)
+
+            if rest:
+                yield (
+                    typing.cast("_T", rest)
+                    if self._parse is None
+                    else self._parse(rest)
+                )
+
+
+class CsvSource(typing.Generic[_T]):
+    """
+    Rows of a CSV file, as lists of fields (or dictionaries if the file has
+    a header), optionally parsed.
+    """
+
+    __slots__ = ("_buffer_size", "_encoding", "_header", "_options", "_parse", "_path")
+
+    def __init__(  # noqa: PLR0913
+        self,
+        path: str | os.PathLike[str],
+        parse: collections.abc.Callable[[typing.Any], _T] | None,
+        *,
+        encoding: str,
+        buffer_size: int,
+        header: bool,
+        options: dict[str, typing.Any],
+    ) -> None:
+        if buffer_size <= 0:
+            msg = "the buffer size must be positive"
+            raise ValueError(msg)
+
+        self._path = path
+        self._parse = parse
+        self._encoding = encoding
+        self._buffer_size = buffer_size
+        self._header = header
+        self._options = options
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._path!r})"
+
+    def __iter__(self) -> collections.abc.Iterator[_T]:
+        # the `csv` module handles the line terminators itself
+        with open(  # noqa: PTH123
+            self._path,
+            encoding=self._encoding,
+            newline="",
+            buffering=self._buffer_size,
+        ) as file:
+            rows: collections.abc.Iterator[typing.Any] = (
+                csv.DictReader(file, **self._options)
+                if self._header
+                else csv.reader(file, **self._options)
+            )
+
+            if self._parse is None:
+                yield from rows
+            else:
+                yield from map(self._parse, rows)
@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+import bisect
+import operator
+import sys
+import typing
+
+from magic_list.prelude import list
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import builtins
+    import collections.abc
+
+    import typing_extensions
+
+__all__ = [
+    "IndexedList",
+]
+
+_T = typing.TypeVar("_T")
+
+
+class IndexedList(list[_T]):
+    """
+    Magic list that keeps a map from its items to their positions, so that
+    `in`, `index`, `count`, `remove`, `positions` and `deduplicate` take
+    constant time on average instead of scanning the list.
+
+    The map is built on the first lookup, then kept up to date by
+    `append`, `extend`, `prepend`, `pop`, `insert` and item assignment as
+    long as they operate on the ends of the list (or on a single item). The
+    other mutations discard it, and it is rebuilt on the next lookup.
+
+    .. warning:: Items must be hashable to be indexed ; otherwise, lookups \
+        scan the list like regular lists do. Mutating `data` directly \
+        leaves the map out of date.
+
+    >>> routes = L["/", "/home", "/about"].indexed()
+    >>> "/home" in routes
+    True
+    >>> routes.append("/home")
+    >>> routes.positions("/home")
+    [1, 3]
+    """
+
+    def __init__(self, initlist: collections.abc.Iterable[_T] | None = None) -> None:
+        super().__init__(initlist)
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        # the stored positions are relative to `_base`, so that prepending or
+        # popping the first item does not shift all of them
+        self._index: dict[typing.Any, builtins.list[int]] | None = None
+        self._base = 0
+        self._indexable = True
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        return (self.__class__, (self.data,))
+
+    def __copy__(self) -> typing_extensions.Self:
+        return self._with_data(self.data[:])
+
+    def _with_data(self, data: typing.Any) -> typing_extensions.Self:
+        result = super()._with_data(data)
+        result._invalidate()  # noqa: SLF001
+
+        return result
+
+    def _positions_index(self) -> dict[typing.Any, builtins.list[int]] | None:
+        if self._index is None and self._indexable:
+            index: dict[typing.Any, builtins.list[int]] = {}
+
+            try:
+                for position, item in enumerate(self.data):
+                    index.setdefault(item, []).append(position)
+            except TypeError:
+                # an item is unhashable, we stop trying until the next change
+                self._indexable = False
+            else:
+                self._index = index
+                self._base = 0
+
+        return self._index
+
+    def _stored_positions(self, item: object) -> builtins.list[int] | None:
+        index = self._positions_index()
+
+        if index is None:
+            return None
+
+        try:
+            return index.get(item, [])
+        except TypeError:
+            # unhashable items can still be equal to the indexed ones
+            return None
+
+    # *- index updates -* #
+
+    def _index_add(self, item: _T, position: int) -> None:
+        if self._index is None:
+            return
+
+        try:
+            positions = self._index.setdefault(item, [])
+        except TypeError:
+            self._invalidate()
+            self._indexable = False
+
+            return
+
+        stored = position - self._base
+
+        if not positions or positions[-1] < stored:
+            positions.append(stored)
+        else:
+            bisect.insort(positions, stored)
+
+    def _index_discard(self, item: _T, position: int) -> None:
+        if self._index is None:
+            # the unhashable items may be gone
+            self._indexable = True
+
+            return
+
+        positions = self._index[item]
+        del positions[bisect.bisect_left(positions, position - self._base)]
+
+        if not positions:
+            del self._index[item]
+
+    # *- lookups -* #
+
+    def __contains__(self, item: object) -> bool:
+        positions = self._stored_positions(item)
+
+        if positions is None:
+            return super().__contains__(item)
+
+        return bool(positions)
+
+    def index(
+        self,
+        item: _T,
+        start: typing.SupportsIndex = 0,
+        stop: typing.SupportsIndex = sys.maxsize,
+    ) -> int:
+        positions = self._stored_positions(item)
+
+        if positions is None:
+            return super().index(item, start, stop)
+
+        start, stop, _ = slice(start, stop).indices(len(self.data))
+        i = bisect.bisect_left(positions, start - self._base)
+
+        if i == len(positions) or positions[i] + self._base >= stop:
+            msg = f"{item!r} is not in list"
+            raise ValueError(msg)
+
+        return positions[i] + self._base
+
+    def count(self, item: _T) -> int:
+        positions = self._stored_positions(item)
+
+        if positions is None:
+            return super().count(item)
+
+        return len(positions)
+
+    def positions(self, item: _T) -> list[int]:
+        """
+        Return the indexes of the occurrences of `item`, in increasing order.
+        They can be given to `select`.
+
+        >>> L[3, 5, 3].indexed().positions(3)
+        [0, 2]
+        >>> L[3, 5, 3].indexed().positions(4)
+        []
+        """
+
+        positions = self._stored_positions(item)
+
+        if positions is None:
+            return list(i for i, other in enumerate(self.data) if other == item)
+
+        base = self._base
+
+        return list(position + base for position in positions)
+
+    def deduplicate(
+        self,
+        *,
+        key: collections.abc.Callable[[_T], typing.Any] | None = None,
+    ) -> typing_extensions.Self:
+        index = self._positions_index() if key is None else None
+
+        if index is None:
+            return super().deduplicate(key=key)
+
+        data = self.data
+
+        return self._with_items(
+            data[position + self._base]
+            for position in sorted(positions[0] for positions in index.values())
+        )
+
+    # *- mutating methods: they update the index, or discard it -* #
+
+    def __setitem__(self, i: typing.Any, item: typing.Any) -> None:
+        if isinstance(i, slice):
+            super().__setitem__(i, item)
+            self._invalidate()
+
+            return
+
+        old_item = self.data[i]
+        super().__setitem__(i, item)
+        position = i + len(self.data) if i < 0 else i
+        self._index_discard(old_item, position)
+        self._index_add(item, position)
+
+    def __delitem__(self, i: typing.SupportsIndex | slice) -> None:
+        if isinstance(i, slice):
+            super().__delitem__(i)
+            self._invalidate()
+        else:
+            self.pop(operator.index(i))
+
+    def __iadd__(self, other: collections.abc.Iterable[_T]) -> typing_extensions.Self:
+        self.extend(other)
+
+        return self
+
+    def __imul__(self, n: int) -> typing_extensions.Self:
+        super().__imul__(n)
+        self._invalidate()
+
+        return self
+
+    def append(self, item: _T) -> None:
+        super().append(item)
+        self._index_add(item, len(self.data) - 1)
+
+    def extend(self, other: collections.abc.Iterable[_T]) -> None:
+        start = len(self.data)
+        super().extend(other)
+
+        for position in range(start, len(self.data)):
+            self._index_add(self.data[position], position)
+
+    def insert(self, i: int, item: _T) -> None:
+        size = len(self.data)
+        position = max(0, min(size, i + size if i < 0 else i))
+        super().insert(i, item)
+
+        if position == 0 and self._index is not None:
+            self._base += 1
+            self._index_add(item, 0)
+        elif position == size:
+            self._index_add(item, size)
+        else:
+            self._invalidate()
+
+    def pop(self, i: int = -1) -> _T:
+        size = len(self.data)
+        item = super().pop(i)
+        position = i + size if i < 0 else i
+
+        if position == 0 and self._index is not None:
+            self._index_discard(item, 0)
+            self._base -= 1
+        elif position == size - 1:
+            self._index_discard(item, position)
+        else:
+            self._invalidate()
+
+        return item
+
+    def remove(self, item: _T) -> None:
+        self.pop(self.index(item))
+
+    def clear(self) -> None:
+        super().clear()
+        self._invalidate()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._invalidate()
+
+    def sort(self, /, *args: typing.Any, **kwds: typing.Any) -> None:
+        super().sort(*args, **kwds)
+        self._invalidate()
+
+    def rotate_inplace(self, n: int = 1) -> None:
+        super().rotate_inplace(n)
+        self._invalidate()
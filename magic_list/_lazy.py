@@ -0,0 +1,309 @@
+from __future__ import annotations
+
+import collections.abc
+import itertools
+import typing
+
+# the prelude builds lazy lists, so it imports this module, and `collect`
+# imports it when it is called
+if typing.TYPE_CHECKING:  # pragma: no cover
+    from magic_list.prelude import list
+
+__all__ = [
+    "LazyList",
+]
+
+_T = typing.TypeVar("_T")
+_U = typing.TypeVar("_U")
+
+_Stage = collections.abc.Callable[
+    [collections.abc.Iterator[typing.Any]],
+    collections.abc.Iterator[typing.Any],
+]
+
+_SENTINEL = object()
+
+
+class LazyList(typing.Generic[_T]):
+    """
+    Deferred chain of list transformations.
+
+    Each method records a stage instead of building an intermediate list.
+    The whole chain runs as one single-pass iterator when the lazy list is
+    materialized, i.e. when it is iterated, measured with `len` or collected.
+
+    Since the chain is re-run on each materialization, the source must be
+    re-iterable (which is the case of magic lists).
+
+    >>> L[3, 5, 2].lazy().map(lambda n: n * 2).filter(lambda n: n > 4).collect()
+    [6, 10]
+    """
+
+    __slots__ = ("_source", "_stages")
+
+    def __init__(
+        self,
+        source: collections.abc.Iterable[typing.Any],
+        stages: tuple[_Stage, ...] = (),
+    ) -> None:
+        self._source = source
+        self._stages = stages
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({self._source!r}, stages={len(self._stages)})"
+        )
+
+    def __iter__(self) -> collections.abc.Iterator[_T]:
+        iterator: collections.abc.Iterator[typing.Any] = iter(self._source)
+
+        for stage in self._stages:
+            iterator = stage(iterator)
+
+        return iterator
+
+    def __len__(self) -> int:
+        # this runs the whole chain, but does not keep the items around
+        return sum(1 for _ in self)
+
+    def _then(self, stage: _Stage) -> LazyList[typing.Any]:
+        return LazyList(self._source, (*self._stages, stage))
+
+    def collect(self) -> list[_T]:
+        """
+        Run the chain and return its result as a magic list.
+
+        >>> L[3, 5, 2].lazy().reversed().collect()
+        [2, 5, 3]
+        """
+
+        from magic_list.prelude import list
+
+        # passing the bare iterator prevents the constructor from calling
+        # `__len__` as a length hint, which would run the chain twice
+        return list(iter(self))
+
+    @property
+    def head(self) -> _T:
+        """
+        First item of the lazy list. Only the first item is computed.
+
+        .. warning:: The lazy list must be non-empty.
+
+        >>> L[3, 5, 2].lazy().map(str).head
+        "3"
+        >>> list().lazy().head
+        *- TypeError: empty list has no head -*
+        """
+
+        item = next(iter(self), _SENTINEL)
+
+        if item is _SENTINEL:
+            msg = "empty list has no head"
+            raise TypeError(msg)
+
+        return typing.cast("_T", item)
+
+    @property
+    def tail(self) -> LazyList[_T]:
+        """
+        Lazy list without its first item.
+
+        .. warning:: The lazy list must be non-empty. As the length is not \
+            known in advance, this is only checked on materialization.
+
+        >>> L[3, 5, 2].lazy().tail.collect()
+        [5, 2]
+        >>> list().lazy().tail.collect()
+        *- TypeError: empty list has no tail -*
+        """
+
+        def _tail(
+            iterator: collections.abc.Iterator[_T],
+        ) -> collections.abc.Iterator[_T]:
+            if next(iterator, _SENTINEL) is _SENTINEL:
+                msg = "empty list has no tail"
+                raise TypeError(msg)
+
+            yield from iterator
+
+        return self._then(_tail)
+
+    def map(self, function: collections.abc.Callable[[_T], _U]) -> LazyList[_U]:
+        """
+        Apply `function` on each item of the lazy list.
+
+        >>> L[3, 5, 2].lazy().map(str).collect()
+        ["3", "5", "2"]
+        """
+
+        return self._then(lambda iterator: map(function, iterator))
+
+    def filter(self, function: collections.abc.Callable[[_T], bool]) -> LazyList[_T]:
+        """
+        Discard each item `i` of the lazy list if `function(i)` is `False`.
+
+        >>> L[3, 5, 2].lazy().filter(lambda n: n % 2 == 1).collect()
+        [3, 5]
+        """
+
+        return self._then(lambda iterator: filter(function, iterator))
+
+    def mask(self, mask_seq: collections.abc.Iterable[bool]) -> LazyList[_T]:
+        """
+        Keep every item at index `i` of the lazy list if the corresponding
+        item at index `i` of the mask sequence is `True` ; else, discard it.
+
+        .. warning:: The mask sequence must be of the same length as the \
+            list. As the length is not known in advance, this is only checked \
+            on materialization.
+
+        >>> L[3, 5, 2].lazy().mask([True, False, True]).collect()
+        [3, 2]
+        >>> L[3, 5, 2].lazy().mask([True, False]).collect()
+        *- TypeError: mask length must be the same as the list -*
+        """
+
+        def _mask(
+            iterator: collections.abc.Iterator[_T],
+        ) -> collections.abc.Iterator[_T]:
+            for item, bit in itertools.zip_longest(
+                iterator,
+                mask_seq,
+                fillvalue=_SENTINEL,
+            ):
+                if item is _SENTINEL or bit is _SENTINEL:
+                    msg = "mask length must be the same as the list"
+                    raise TypeError(msg)
+
+                if bit:
+                    yield item
+
+        return self._then(_mask)
+
+    def take(self, n: int) -> LazyList[_T]:
+        """
+        Take `n` items from the lazy list. Upstream stages stop as soon as
+        they have produced `n` items.
+
+        .. warning:: `n` must be non-negative and less than the list length. \
+            The latter is only checked on materialization.
+
+        >>> L[3, 5, 2].lazy().take(2).collect()
+        [3, 5]
+        >>> L[3, 5, 2].lazy().take(-1)
+        *- ValueError: cannot take a negative amount of items -*
+        >>> L[3, 5, 2].lazy().take(5).collect()
+        *- ValueError: cannot take more items than the list contains -*
+        """
+
+        if n < 0:
+            msg = "cannot take a negative amount of items"
+            raise ValueError(msg)
+
+        def _take(
+            iterator: collections.abc.Iterator[_T],
+        ) -> collections.abc.Iterator[_T]:
+            count = 0
+
+            for item in itertools.islice(iterator, n):
+                count += 1
+                yield item
+
+            if count < n:
+                msg = "cannot take more items than the list contains"
+                raise ValueError(msg)
+
+        return self._then(_take)
+
+    def drop(self, n: int) -> LazyList[_T]:
+        """
+        Drop `n` items from the lazy list.
+
+        .. warning:: `n` must be non-negative and less than the list length. \
+            The latter is only checked on materialization.
+
+        >>> L[3, 5, 2].lazy().drop(2).collect()
+        [2]
+        >>> L[3, 5, 2].lazy().drop(-1)
+        *- ValueError: cannot drop a negative amount of items -*
+        >>> L[3, 5, 2].lazy().drop(5).collect()
+        *- ValueError: cannot drop more items than the list contains -*
+        """
+
+        if n < 0:
+            msg = "cannot drop a negative amount of items"
+            raise ValueError(msg)
+
+        def _drop(
+            iterator: collections.abc.Iterator[_T],
+        ) -> collections.abc.Iterator[_T]:
+            for _ in range(n):
+                if next(iterator, _SENTINEL) is _SENTINEL:
+                    msg = "cannot drop more items than the list contains"
+                    raise ValueError(msg)
+
+            yield from iterator
+
+        return self._then(_drop)
+
+    def reversed(self) -> LazyList[_T]:
+        """
+        Reverse the lazy list.
+
+        .. note:: This stage needs to buffer the items produced upstream.
+
+        >>> L[1, 2, 3].lazy().reversed().collect()
+        [3, 2, 1]
+        """
+
+        def _reversed(
+            iterator: collections.abc.Iterator[_T],
+        ) -> collections.abc.Iterator[_T]:
+            return reversed(tuple(iterator))
+
+        return self._then(_reversed)
+
+    def interleave(
+        self,
+        filler: _T | collections.abc.Callable[[_T, _T], _T],
+    ) -> LazyList[_T]:
+        """
+        Fill in-between the items with `filler`.
+
+        If `filler` is a function, it takes the two items surrounding the gap
+        that is about to be filled and produces a new value to be inserted.
+
+        .. warning:: The list must contain at least two items. As the length \
+            is not known in advance, this is only checked on materialization.
+
+        >>> L[3, 5, 2].lazy().interleave(0).collect()
+        [3, 0, 5, 0, 2]
+        >>> L[3, 5, 2].lazy().interleave(operator.add).collect()
+        [3, 8, 5, 7, 2]
+        >>> L[0].lazy().interleave(1).collect()
+        *- ValueError: list has no gap to be filled -*
+        """
+
+        def _interleave(
+            iterator: collections.abc.Iterator[_T],
+        ) -> collections.abc.Iterator[_T]:
+            previous = next(iterator, _SENTINEL)
+            current = next(iterator, _SENTINEL)
+
+            if current is _SENTINEL:
+                msg = "list has no gap to be filled"
+                raise ValueError(msg)
+
+            yield typing.cast("_T", previous)
+
+            while current is not _SENTINEL:
+                yield (
+                    filler(previous, current)  # pyright: ignore[reportArgumentType]
+                    if callable(filler)
+                    else filler
+                )
+                yield typing.cast("_T", current)
+                previous, current = current, next(iterator, _SENTINEL)
+
+        return self._then(_interleave)
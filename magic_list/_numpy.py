@@ -0,0 +1,95 @@
+"""
+Optional NumPy kernels used by the magic list on large numeric lists.
+
+Each kernel takes the storage of a list and returns `None` when it does not
+apply, in which case the caller falls back to its pure Python
+implementation. Kernels only apply when NumPy is installed, when the list
+has at least `THRESHOLD` items and when they are all `int` (that fit in 64
+bits) or all `float`. Their results are the same as the pure Python
+implementation.
+
+Only sorting and shuffling have kernels: the other methods (such as `sum`,
+`min` or `mask`) are a single pass implemented in C by the built-ins, which
+is faster than converting the list to an array.
+"""
+
+from __future__ import annotations
+
+import builtins
+import random
+import typing
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import numpy.typing as npt
+
+__all__ = [
+    "THRESHOLD",
+    "as_array",
+    "shuffled",
+    "sorted",
+]
+
+THRESHOLD = 50_000
+"""
+Minimum length from which the NumPy kernels are used. Below it, converting
+the list to an array and back costs more than it saves.
+"""
+
+
+def as_array(items: typing.Any) -> npt.NDArray[typing.Any] | None:
+    """
+    Return `items` as a NumPy array if the kernels apply to them.
+    """
+
+    if np is None or not isinstance(items, builtins.list) or len(items) < THRESHOLD:  # pyright: ignore[reportUnknownArgumentType]
+        return None
+
+    # the only pass over the items in Python: the array conversion checks
+    # the integers fit in 64 bits
+    types = set(map(type, items))  # pyright: ignore[reportUnknownArgumentType]
+
+    if types == {float}:
+        return np.array(items, dtype=np.float64)
+
+    if types == {int}:
+        try:
+            return np.array(items, dtype=np.int64)
+        except OverflowError:
+            return None
+
+    return None
+
+
+def sorted(  # noqa: A001
+    items: typing.Any,
+    *,
+    reverse: bool,
+) -> builtins.list[typing.Any] | None:
+    array = as_array(items)
+
+    if array is None or (array.dtype.kind == "f" and np.isnan(array).any()):  # pyright: ignore[reportOptionalMemberAccess]
+        # comparisons with NaN make the built-in result order-dependent
+        return None
+
+    # equal items (such as 0.0 and -0.0) keep their order, as with `sorted`
+    if reverse:
+        return np.sort(array[::-1], kind="stable")[::-1].tolist()  # pyright: ignore[reportOptionalMemberAccess]
+
+    return np.sort(array, kind="stable").tolist()  # pyright: ignore[reportOptionalMemberAccess]
+
+
+def shuffled(items: typing.Any) -> builtins.list[typing.Any] | None:
+    array = as_array(items)
+
+    if array is None:
+        return None
+
+    # seeded from `random` so that `random.seed` keeps results reproducible
+    generator = np.random.default_rng(random.getrandbits(128))  # pyright: ignore[reportOptionalMemberAccess]
+
+    return generator.permutation(array).tolist()
@@ -0,0 +1,746 @@
+from __future__ import annotations
+
+import bisect
+import builtins
+import collections
+import collections.abc
+import heapq
+import itertools
+import math
+import operator
+import pathlib
+import pickle
+import random
+import sys
+import tempfile
+import typing
+
+from magic_list import _parallel
+from magic_list._view import _Window
+from magic_list.prelude import list
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import concurrent.futures
+    import os
+
+    import _typeshed
+    import typing_extensions
+
+__all__ = [
+    "PagedList",
+]
+
+_T = typing.TypeVar("_T")
+_U = typing.TypeVar("_U")
+_V = typing.TypeVar("_V")
+
+DEFAULT_PAGE_SIZE = 10_000
+DEFAULT_CACHE_SIZE = 8
+
+
+class _Pages(collections.abc.MutableSequence[_T]):
+    """
+    Mutable sequence whose items are stored in pickled pages, of which at
+    most `cache_size` are held in memory at once.
+
+    Operations on a single item (including appending) only load the page
+    holding it, while iteration streams the pages in order. Operations that
+    move many items (slice assignment and deletion, `reverse`, `sort`)
+    write a new set of pages from a stream of the items.
+    """
+
+    __slots__ = (
+        "_cache",
+        "_directory",
+        "_dirty",
+        "_ids",
+        "_lengths",
+        "_next_id",
+        "_root",
+        "_size",
+        "_starts",
+        "cache_size",
+        "page_size",
+    )
+
+    __hash__ = None
+
+    def __init__(
+        self,
+        items: collections.abc.Iterable[_T],
+        page_size: int,
+        cache_size: int,
+        directory: str | os.PathLike[str] | None,
+    ) -> None:
+        if page_size <= 0:
+            msg = "the page size must be positive"
+            raise ValueError(msg)
+
+        if cache_size <= 0:
+            msg = "the cache size must be positive"
+            raise ValueError(msg)
+
+        self.page_size = page_size
+        self.cache_size = cache_size
+        self._root = directory
+        self._directory = tempfile.TemporaryDirectory(
+            prefix="magic_list_", dir=directory
+        )
+        # identifiers (i.e. file names) and lengths of the pages, in order
+        self._ids: builtins.list[int] = []
+        self._lengths: builtins.list[int] = []
+        # index of the first item of each page, computed when needed
+        self._starts: builtins.list[int] | None = []
+        self._next_id = itertools.count()
+        self._cache: collections.OrderedDict[int, builtins.list[_T]] = (
+            collections.OrderedDict()
+        )
+        self._dirty: set[int] = set()
+        self._size = 0
+
+        self.extend(items)
+
+    def __repr__(self) -> str:
+        return repr(builtins.list(self))
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        # the directory is local to this process
+        return (
+            self.__class__,
+            ((), self.page_size, self.cache_size, None),
+            None,
+            iter(self),
+        )
+
+    @property
+    def directory(self) -> str | os.PathLike[str] | None:
+        """
+        Directory in which the temporary directory of the pages is created,
+        or `None` for the default one.
+        """
+
+        return self._root
+
+    def _with_items(self, items: collections.abc.Iterable[_T]) -> _Pages[_T]:
+        return self.__class__(items, self.page_size, self.cache_size, self._root)
+
+    # *- pages -* #
+
+    def _path(self, page_id: int) -> pathlib.Path:
+        return pathlib.Path(self._directory.name) / str(page_id)
+
+    def _load(self, position: int) -> builtins.list[_T]:
+        page_id = self._ids[position]
+        page = self._cache.get(page_id)
+
+        if page is not None:
+            self._cache.move_to_end(page_id)
+            return page
+
+        page = pickle.loads(self._path(page_id).read_bytes())  # noqa: S301
+        self._cache[page_id] = page
+        self._evict()
+
+        return page
+
+    def _modified(self, position: int) -> None:
+        self._dirty.add(self._ids[position])
+
+    def _evict(self) -> None:
+        while len(self._cache) > self.cache_size:
+            page_id, page = self._cache.popitem(last=False)
+
+            if page_id in self._dirty:
+                self._dirty.discard(page_id)
+                self._path(page_id).write_bytes(
+                    pickle.dumps(page, pickle.HIGHEST_PROTOCOL),
+                )
+
+    def _add_page(self, position: int, page: builtins.list[_T]) -> None:
+        page_id = next(self._next_id)
+
+        if self._starts is not None and position == len(self._ids):
+            self._starts.append(self._size)
+        else:
+            self._starts = None
+
+        self._ids.insert(position, page_id)
+        self._lengths.insert(position, len(page))
+        self._cache[page_id] = page
+        self._dirty.add(page_id)
+        self._size += len(page)
+        self._evict()
+
+    def _drop_page(self, position: int) -> None:
+        page_id = self._ids.pop(position)
+        del self._lengths[position]
+        self._starts = None
+        self._dirty.discard(page_id)
+        self._cache.pop(page_id, None)
+        # pages created in memory may never have been written
+        self._path(page_id).unlink(missing_ok=True)
+
+    def _resize(self, position: int, delta: int) -> None:
+        self._lengths[position] += delta
+        self._size += delta
+
+        if position != len(self._ids) - 1:
+            self._starts = None
+
+        if not self._lengths[position]:
+            self._drop_page(position)
+
+    def _locate(self, i: typing.SupportsIndex) -> tuple[int, int]:
+        # position of the page holding the item at index `i`, and the
+        # index of the item in the page
+        index = operator.index(i)
+
+        if index < 0:
+            index += self._size
+
+        if not 0 <= index < self._size:
+            msg = "list index out of range"
+            raise IndexError(msg)
+
+        if self._starts is None:
+            self._starts = builtins.list(itertools.accumulate(self._lengths, initial=0))
+            del self._starts[-1]
+
+        position = bisect.bisect_right(self._starts, index) - 1
+
+        return position, index - self._starts[position]
+
+    def _replace(self, items: collections.abc.Iterable[_T]) -> None:
+        # the new pages are written in another directory while the items
+        # are read from the current one, which is then removed
+        replacement = self._with_items(items)
+        directory = self._directory
+
+        for name in self.__slots__:
+            setattr(self, name, getattr(replacement, name))
+
+        directory.cleanup()
+
+    # *- sequence protocol -* #
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> collections.abc.Iterator[_T]:
+        for position in range(len(self._ids)):
+            yield from self._load(position)
+
+    def __reversed__(self) -> collections.abc.Iterator[_T]:
+        for position in reversed(range(len(self._ids))):
+            yield from reversed(self._load(position))
+
+    def islice(self, start: int, stop: int) -> collections.abc.Iterator[_T]:
+        """
+        Iterate over the items from index `start` (included) to index `stop`
+        (excluded), which must be in bounds.
+        """
+
+        if start >= stop:
+            return
+
+        position, offset = self._locate(start)
+        remaining = stop - start
+
+        while remaining > 0:
+            page = self._load(position)[offset : offset + remaining]
+            remaining -= len(page)
+            position, offset = position + 1, 0
+
+            yield from page
+
+    @typing.overload
+    def __getitem__(self, i: int) -> _T: ...
+    @typing.overload
+    def __getitem__(self, i: slice) -> _Pages[_T]: ...
+    def __getitem__(self, i: int | slice) -> _T | _Pages[_T]:
+        if not isinstance(i, slice):
+            position, offset = self._locate(i)
+
+            return self._load(position)[offset]
+
+        indexes = range(self._size)[i]
+
+        if indexes.step == 1:
+            return self._with_items(self.islice(indexes.start, indexes.stop))
+
+        return self._with_items(map(self.__getitem__, indexes))
+
+    @typing.overload
+    def __setitem__(self, i: int, item: _T) -> None: ...
+    @typing.overload
+    def __setitem__(self, i: slice, item: collections.abc.Iterable[_T]) -> None: ...
+    def __setitem__(self, i: int | slice, item: typing.Any) -> None:
+        if not isinstance(i, slice):
+            position, offset = self._locate(i)
+            self._load(position)[offset] = item
+            self._modified(position)
+            return
+
+        indexes = range(self._size)[i]
+
+        if indexes.step != 1:
+            items = builtins.list(item)
+
+            if len(items) != len(indexes):
+                msg = (
+                    f"attempt to assign sequence of size {len(items)} "
+                    f"to extended slice of size {len(indexes)}"
+                )
+                raise ValueError(msg)
+
+            for index, value in zip(indexes, items):
+                self[index] = value
+
+            return
+
+        # the stop of an empty range may be before its start
+        stop = max(indexes.start, indexes.stop)
+        items = self[:] if item is self else item
+
+        self._replace(
+            itertools.chain(
+                self.islice(0, indexes.start),
+                items,
+                self.islice(stop, self._size),
+            ),
+        )
+
+    def __delitem__(self, i: int | slice) -> None:
+        if not isinstance(i, slice):
+            position, offset = self._locate(i)
+            del self._load(position)[offset]
+            self._modified(position)
+            self._resize(position, -1)
+            return
+
+        indexes = range(self._size)[i]
+
+        if indexes:
+            self._replace(
+                item for index, item in enumerate(self) if index not in indexes
+            )
+
+    def insert(self, index: int, value: _T) -> None:
+        if index >= self._size or not self._ids:
+            self.append(value)
+            return
+
+        position, offset = self._locate(max(index, -self._size))
+        page = self._load(position)
+        page.insert(offset, value)
+        self._modified(position)
+        self._resize(position, 1)
+
+        # pages grown by insertions are split in two
+        if len(page) > 2 * self.page_size:
+            rest = page[len(page) // 2 :]
+            del page[len(page) // 2 :]
+            self._lengths[position] = len(page)
+            self._size -= len(rest)
+            self._add_page(position + 1, rest)
+
+    def append(self, value: _T) -> None:
+        if not self._ids or self._lengths[-1] >= self.page_size:
+            self._add_page(len(self._ids), [value])
+            return
+
+        self._load(-1).append(value)
+        self._modified(-1)
+        self._resize(len(self._ids) - 1, 1)
+
+    def extend(self, values: collections.abc.Iterable[_T]) -> None:
+        iterator = iter(self[:] if values is self else values)
+
+        # the last page is filled first, then the items are paged at once
+        if self._ids:
+            room = self.page_size - self._lengths[-1]
+
+            if room > 0:
+                items = builtins.list(itertools.islice(iterator, room))
+                self._load(-1).extend(items)
+                self._modified(-1)
+                self._resize(len(self._ids) - 1, len(items))
+
+        while page := builtins.list(itertools.islice(iterator, self.page_size)):
+            self._add_page(len(self._ids), page)
+
+    def pop(self, index: int = -1) -> _T:
+        if not self._size:
+            msg = "pop from empty list"
+            raise IndexError(msg)
+
+        position, offset = self._locate(index)
+        item = self._load(position).pop(offset)
+        self._modified(position)
+        self._resize(position, -1)
+
+        return item
+
+    def clear(self) -> None:
+        self._replace(())
+
+    def index(
+        self,
+        value: typing.Any,
+        start: typing.SupportsIndex = 0,
+        stop: typing.SupportsIndex = sys.maxsize,
+    ) -> int:
+        indexes = range(self._size)[start:stop]
+
+        for index, item in enumerate(self.islice(indexes.start, indexes.stop)):
+            if item is value or item == value:
+                return indexes.start + index
+
+        msg = f"{value!r} is not in list"
+        raise ValueError(msg)
+
+    def reverse(self) -> None:
+        self._replace(reversed(self))
+
+    def sort(self, /, *args: typing.Any, **kwds: typing.Any) -> None:
+        self._replace(self.isorted(*args, **kwds))
+
+    def isorted(
+        self,
+        *,
+        key: collections.abc.Callable[[_T], typing.Any] | None = None,
+        reverse: bool = False,
+    ) -> collections.abc.Iterator[_T]:
+        """
+        Iterate over the items in sorted order, with an external merge sort:
+        runs of as many items as the cache holds are sorted in memory and
+        paged, then merged while holding a page of each run.
+        """
+
+        budget = self.page_size * self.cache_size
+        iterator = iter(self)
+        runs: builtins.list[_Pages[_T]] = []
+
+        while run := builtins.list(itertools.islice(iterator, budget)):
+            run.sort(key=key, reverse=reverse)
+            runs.append(self.__class__(run, self.page_size, 1, self._root))
+
+        # the merge keeps the order of the runs for equal items, so the sort
+        # is stable
+        return heapq.merge(*runs, key=key, reverse=reverse)
+
+    def ishuffled(self) -> collections.abc.Iterator[_T]:
+        """
+        Iterate over the items in a random order: they are dispatched at
+        random in buckets of about as many items as the cache holds, which
+        are then shuffled in memory one after the other.
+        """
+
+        count = math.ceil(self._size / (self.page_size * self.cache_size))
+
+        if count <= 1:
+            items = builtins.list(self)
+            random.shuffle(items)
+
+            yield from items
+            return
+
+        buckets = [
+            self.__class__((), self.page_size, 1, self._root) for _ in range(count)
+        ]
+        iterator = iter(self)
+
+        # the items are dispatched a page at a time
+        while page := builtins.list(itertools.islice(iterator, self.page_size)):
+            parts: builtins.list[builtins.list[_T]] = [[] for _ in buckets]
+            # like `random.shuffle`, this is not meant for cryptography
+            choices = random.choices(range(count), k=len(page))  # noqa: S311
+
+            for item, bucket in zip(page, choices):
+                parts[bucket].append(item)
+
+            for bucket, part in zip(buckets, parts):
+                bucket.extend(part)
+
+        for bucket in buckets:
+            items = builtins.list(bucket)
+            random.shuffle(items)
+
+            yield from items
+
+    # *- comparisons and arithmetic -* #
+
+    @staticmethod
+    def _cast(other: object) -> collections.abc.Sequence[typing.Any] | None:
+        # like windows, pages compare with lists and other pages
+        if isinstance(other, (_Pages, _Window, builtins.list)):
+            return typing.cast("collections.abc.Sequence[typing.Any]", other)
+
+        return None
+
+    def _compare(
+        self,
+        other: object,
+        operation: collections.abc.Callable[[typing.Any, typing.Any], bool],
+    ) -> bool:
+        other_items = self._cast(other)
+
+        if other_items is None:
+            return NotImplemented
+
+        # like lists, the first items that differ decide
+        for item, other_item in zip(self, other_items):
+            if not (item is other_item or item == other_item):
+                return operation(item, other_item)
+
+        return operation(self._size, len(other_items))
+
+    def __eq__(self, other: object) -> bool:
+        other_items = self._cast(other)
+
+        if other_items is None:
+            return NotImplemented
+
+        return self._size == len(other_items) and self._compare(other, operator.eq)
+
+    def __lt__(self, other: object) -> bool:
+        return self._compare(other, operator.lt)
+
+    def __le__(self, other: object) -> bool:
+        return self._compare(other, operator.le)
+
+    def __gt__(self, other: object) -> bool:
+        return self._compare(other, operator.gt)
+
+    def __ge__(self, other: object) -> bool:
+        return self._compare(other, operator.ge)
+
+    def __add__(self, other: collections.abc.Iterable[_T]) -> _Pages[_T]:
+        return self._with_items(itertools.chain(self, other))
+
+    def __radd__(self, other: collections.abc.Iterable[_T]) -> _Pages[_T]:
+        return self._with_items(itertools.chain(other, self))
+
+    def __mul__(self, n: typing.SupportsIndex) -> _Pages[_T]:
+        return self._with_items(
+            itertools.chain.from_iterable(itertools.repeat(self, operator.index(n))),
+        )
+
+    __rmul__ = __mul__
+
+    def __imul__(self, n: typing.SupportsIndex) -> typing_extensions.Self:
+        if operator.index(n) <= 0:
+            self.clear()
+        else:
+            copy = self[:]
+
+            for _ in range(operator.index(n) - 1):
+                self.extend(copy)
+
+        return self
+
+
+class PagedList(list[_T]):
+    """
+    Magic list that spills its items to disk, so that it can grow larger
+    than the memory. This is what `list.paged()` returns.
+
+    The items are split in pages of `page_size` items, each pickled in a
+    file of a temporary directory (created in `directory`, or in the
+    default one). Only the `cache_size` most recently used pages are kept
+    in memory: loading another one evicts the least recently used page,
+    which is written back to its file if it was modified. The directory is
+    removed along with the list.
+
+    It supports the same methods as the magic `list`. Iterating over it,
+    and thus `map`, `filter`, `fold` and the like, streams the pages in
+    order, while `append` and item access only load the page they need.
+    The lists it returns are paged the same way. `sorted` and `shuffled`
+    only hold about `page_size * cache_size` items in memory at once.
+
+    .. warning:: The items must be picklable. Methods that return a \
+        regular value, such as `sum` of strings or `typed`, still build it \
+        in memory.
+
+    >>> l = L[3, 5, 2].paged(page_size=2)
+    >>> l.append(8)
+    >>> l.map(lambda n: n * 2)
+    [6, 10, 4, 16]
+    >>> l.filter(lambda n: n > 2).page_size
+    2
+    """
+
+    data: _Pages[_T]  # pyright: ignore[reportIncompatibleVariableOverride]
+
+    def __init__(
+        self,
+        initlist: collections.abc.Iterable[_T] | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        directory: str | os.PathLike[str] | None = None,
+    ) -> None:
+        # the pages built by the arithmetic operators are adopted as is
+        if isinstance(initlist, _Pages):
+            self.data = typing.cast("_Pages[_T]", initlist)
+            return
+
+        if isinstance(initlist, collections.UserList):
+            initlist = typing.cast("collections.UserList[_T]", initlist).data
+
+        self.data = _Pages(initlist or (), page_size, cache_size, directory)
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        # the items are pickled in batches rather than in a single list, and
+        # the directory is local to this process
+        return (
+            self.__class__,
+            (None, self.page_size, self.cache_size),
+            None,
+            iter(self.data),
+        )
+
+    @property
+    def page_size(self) -> int:
+        """
+        Number of items per page.
+
+        >>> L[3, 5, 2].paged(page_size=2).page_size
+        2
+        """
+
+        return self.data.page_size
+
+    @property
+    def cache_size(self) -> int:
+        """
+        Maximum number of pages held in memory.
+
+        >>> L[3, 5, 2].paged().cache_size
+        8
+        """
+
+        return self.data.cache_size
+
+    def _with_items(
+        self, items: collections.abc.Iterable[_T]
+    ) -> typing_extensions.Self:
+        return self.__class__(
+            items,
+            self.page_size,
+            self.cache_size,
+            self.data.directory,
+        )
+
+    # *- methods returning a new list: it is paged the same way -* #
+
+    def reversed(self) -> typing_extensions.Self:
+        return self._with_items(self.data.__reversed__())
+
+    def sorted(
+        self,
+        *,
+        key: collections.abc.Callable[[_T], _typeshed.SupportsRichComparison]
+        | None = None,
+        reverse: bool = False,
+        keep_sorted: bool = False,
+    ) -> typing.Any:
+        """
+        Return a sorted version of the list, with an external merge sort:
+        runs of `page_size * cache_size` items are sorted in memory, then
+        merged while holding a page of each run.
+
+        >>> L[3, 5, 2].paged(page_size=1, cache_size=1).sorted()
+        [2, 3, 5]
+        """
+
+        if keep_sorted:
+            return super().sorted(key=key, reverse=reverse, keep_sorted=True)
+
+        return self._with_items(self.data.isorted(key=key, reverse=reverse))
+
+    def shuffled(self) -> typing_extensions.Self:
+        return self._with_items(self.data.ishuffled())
+
+    def map(
+        self,
+        function: collections.abc.Callable[[_T], _U],
+        *,
+        executor: concurrent.futures.Executor | None = None,
+        chunksize: int | None = None,
+        ordered: bool = True,
+    ) -> list[_U]:
+        if executor is not None:
+            results = _parallel.map_items(
+                function,
+                self,
+                executor,
+                chunksize,
+                ordered=ordered,
+            )
+
+            return typing.cast("list[_U]", self._with_items(results))
+
+        return typing.cast("list[_U]", self._with_items(map(function, self)))  # pyright: ignore[reportArgumentType]
+
+    def filter(
+        self,
+        function: collections.abc.Callable[[_T], bool],
+        *,
+        executor: concurrent.futures.Executor | None = None,
+        chunksize: int | None = None,
+        ordered: bool = True,
+    ) -> typing_extensions.Self:
+        if executor is not None:
+            return self._with_items(
+                _parallel.filter_items(
+                    function,
+                    self,
+                    executor,
+                    chunksize,
+                    ordered=ordered,
+                ),
+            )
+
+        return self._with_items(filter(function, self))
+
+    def mask(self, mask_seq: collections.abc.Sequence[bool]) -> typing_extensions.Self:
+        if len(self) != len(mask_seq):
+            msg = "mask length must be the same as the list"
+            raise TypeError(msg)
+
+        return self._with_items(itertools.compress(self, mask_seq))
+
+    def deduplicate(
+        self,
+        *,
+        key: collections.abc.Callable[[_T], typing.Any] | None = None,
+    ) -> typing_extensions.Self:
+        return self._with_items(self._ideduplicate(key))
+
+    def scan(
+        self,
+        function: collections.abc.Callable[[_T, _T], _T],
+        initial_value: _T,
+    ) -> typing_extensions.Self:
+        return self._with_items(self.iscan(function, initial_value))
+
+    def scan_right(
+        self,
+        function: collections.abc.Callable[[_T, _T], _T],
+        initial_value: _T,
+    ) -> typing_extensions.Self:
+        return self._with_items(self.iscan_right(function, initial_value))
+
+    def merge(
+        self,
+        function: collections.abc.Callable[[_T, _U], _V],
+        other: collections.abc.Sequence[_U],
+    ) -> list[_V]:
+        if len(self) != len(other):
+            msg = "the length of the two sequences must be equal"
+            raise TypeError(msg)
+
+        return typing.cast(
+            "list[_V]",
+            self._with_items(function(a, b) for a, b in zip(self, other)),  # pyright: ignore[reportArgumentType]
+        )
@@ -0,0 +1,246 @@
+"""
+Helpers to run the callbacks of `map`, `filter` and `reduce` concurrently,
+either on an executor or as asyncio tasks.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import builtins
+import concurrent.futures
+import itertools
+import math
+import os
+import typing
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import collections.abc
+
+__all__ = [
+    "filter_items",
+    "gather_bounded",
+    "map_items",
+    "reduce_items",
+    "tree_reduce",
+]
+
+_T = typing.TypeVar("_T")
+_U = typing.TypeVar("_U")
+
+_CHUNKS_PER_WORKER = 4
+
+
+def _map_chunk(
+    function: collections.abc.Callable[[_T], _U],
+    chunk: builtins.list[_T],
+) -> builtins.list[_U]:
+    return builtins.list(map(function, chunk))
+
+
+def _filter_chunk(
+    function: collections.abc.Callable[[_T], bool],
+    chunk: builtins.list[_T],
+) -> builtins.list[_T]:
+    return builtins.list(filter(function, chunk))
+
+
+def tree_reduce(
+    function: collections.abc.Callable[[_T, _T], _T],
+    items: collections.abc.Iterable[_T],
+) -> _T:
+    """
+    Reduce the non-empty `items` by combining adjacent pairs until one value
+    remains, which is equivalent to a left reduction if `function` is
+    associative.
+    """
+
+    values = builtins.list(items)
+
+    # the depth of the tree is logarithmic, which also keeps the rounding
+    # errors of float additions low
+    while len(values) > 1:
+        paired = builtins.list(map(function, values[::2], values[1::2]))
+
+        if len(values) % 2 == 1:
+            paired.append(values[-1])
+
+        values = paired
+
+    return values[0]
+
+
+def _reduce_chunk(
+    function: collections.abc.Callable[[_T, _T], _T],
+    chunk: builtins.list[_T],
+) -> builtins.list[_T]:
+    return [tree_reduce(function, chunk)]
+
+
+def _split(
+    items: collections.abc.Iterable[_T],
+    chunksize: int | None,
+) -> builtins.list[builtins.list[_T]]:
+    items = builtins.list(items)
+
+    if chunksize is None:
+        # a few chunks per worker balance the load without paying for one
+        # task (and, with processes, one round-trip) per item
+        workers = os.cpu_count() or 1
+        chunksize = max(1, math.ceil(len(items) / (workers * _CHUNKS_PER_WORKER)))
+    elif chunksize <= 0:
+        msg = "chunk size must be positive"
+        raise ValueError(msg)
+
+    return [
+        items[start : start + chunksize] for start in range(0, len(items), chunksize)
+    ]
+
+
+def _run(
+    kernel: collections.abc.Callable[
+        [typing.Any, builtins.list[typing.Any]],
+        builtins.list[typing.Any],
+    ],
+    function: collections.abc.Callable[[typing.Any], typing.Any],
+    chunks: builtins.list[builtins.list[typing.Any]],
+    executor: concurrent.futures.Executor,
+    *,
+    ordered: bool,
+) -> builtins.list[typing.Any]:
+    futures = [executor.submit(kernel, function, chunk) for chunk in chunks]
+
+    try:
+        done = futures if ordered else concurrent.futures.as_completed(futures)
+
+        return builtins.list(
+            itertools.chain.from_iterable(future.result() for future in done),
+        )
+    except BaseException:
+        for future in futures:
+            future.cancel()
+
+        raise
+
+
+def map_items(
+    function: collections.abc.Callable[[_T], _U],
+    items: collections.abc.Iterable[_T],
+    executor: concurrent.futures.Executor,
+    chunksize: int | None,
+    *,
+    ordered: bool,
+) -> builtins.list[_U]:
+    """
+    Return the results of `function` on each item, computed by `executor`.
+    """
+
+    return _run(
+        _map_chunk,
+        function,
+        _split(items, chunksize),
+        executor,
+        ordered=ordered,
+    )
+
+
+def filter_items(
+    function: collections.abc.Callable[[_T], bool],
+    items: collections.abc.Iterable[_T],
+    executor: concurrent.futures.Executor,
+    chunksize: int | None,
+    *,
+    ordered: bool,
+) -> builtins.list[_T]:
+    """
+    Return the items for which `function` is true, computed by `executor`.
+    """
+
+    return _run(
+        _filter_chunk,
+        function,
+        _split(items, chunksize),
+        executor,
+        ordered=ordered,
+    )
+
+
+def reduce_items(
+    function: collections.abc.Callable[[_T, _T], _T],
+    items: collections.abc.Iterable[_T],
+    *,
+    workers: int | None,
+    executor: concurrent.futures.Executor | None,
+) -> _T:
+    """
+    Reduce the non-empty `items` with the associative `function` as a
+    balanced tree. Chunks of items are reduced in parallel by `executor`, or
+    by a pool of `workers` processes, if one of them is provided.
+    """
+
+    if workers is not None and executor is not None:
+        msg = "cannot use both workers and an executor"
+        raise ValueError(msg)
+
+    if workers is not None:
+        with concurrent.futures.ProcessPoolExecutor(workers) as pool:
+            return reduce_items(function, items, workers=None, executor=pool)
+
+    if executor is None:
+        return tree_reduce(function, items)
+
+    partials = _run(
+        _reduce_chunk,
+        function,
+        _split(items, None),
+        executor,
+        ordered=True,
+    )
+
+    return tree_reduce(function, partials)
+
+
+async def gather_bounded(
+    function: collections.abc.Callable[[_T], collections.abc.Awaitable[_U]],
+    items: collections.abc.Iterable[_T],
+    concurrency: int | None,
+) -> builtins.list[_U]:
+    """
+    Await `function` on each item, with at most `concurrency` calls running
+    at the same time. The results are in the order of the items.
+
+    If a call fails, the other ones are cancelled and the exception is
+    re-raised.
+    """
+
+    items = builtins.list(items)
+
+    if concurrency is None:
+        concurrency = max(1, len(items))
+    elif concurrency <= 0:
+        msg = "concurrency must be positive"
+        raise ValueError(msg)
+
+    results: builtins.list[typing.Any] = [None] * len(items)
+    # shared by the workers, so that each item is processed once
+    indexes = iter(range(len(items)))
+
+    async def worker() -> None:
+        for index in indexes:
+            results[index] = await function(items[index])
+
+    # only `concurrency` tasks exist at any time, however long the list is
+    workers = [
+        asyncio.ensure_future(worker()) for _ in range(min(concurrency, len(items)))
+    ]
+
+    try:
+        await asyncio.gather(*workers)
+    except BaseException:
+        for task in workers:
+            task.cancel()
+
+        await asyncio.gather(*workers, return_exceptions=True)
+
+        raise
+
+    return results
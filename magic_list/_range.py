@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import builtins
+import typing
+
+from magic_list import _sum
+from magic_list._view import ListView
+from magic_list._view import _Window
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import collections.abc
+    import concurrent.futures
+
+    import typing_extensions
+
+__all__ = [
+    "RangeList",
+]
+
+
+class RangeList(ListView[int]):
+    """
+    Magic list of evenly spaced integers, read from a `range` instead of
+    being stored. This is what `L[start:stop:step]` returns.
+
+    It takes constant memory until it is mutated (see `ListView`).
+    Slicing, `tail`, `init`, `take`, `drop` and the like produce other
+    range lists, while `in`, `reversed`, `sum`, `mean`, `min` and `max` are
+    computed in constant time.
+
+    >>> r = L[0:10**12:2]
+    >>> len(r), r[-1], r.sum()
+    (500000000000, 999999999998, 249999999999500000000000)
+    >>> r.take(3)
+    [0, 2, 4]
+    >>> r.append(3)
+    >>> r.is_materialized
+    True
+    """
+
+    def __init__(self, initlist: collections.abc.Iterable[int] | None = None) -> None:
+        if isinstance(initlist, range):
+            initlist = _Window(initlist, range(len(initlist)))
+
+        super().__init__(initlist)
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        items = self.range
+
+        return (self.__class__, (builtins.list(self.data) if items is None else items,))
+
+    @property
+    def range(self) -> range | None:
+        """
+        Range of the items, or `None` if the list is materialized.
+
+        >>> L[0:10:3].tail.range
+        range(3, 12, 3)
+        """
+
+        if not isinstance(self.data, _Window) or not isinstance(
+            self.data._buffer,  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+            builtins.range,
+        ):
+            return None
+
+        buffer: range = self.data._buffer  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+        indexes = self.data._indexes  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+        start = buffer.start + buffer.step * indexes.start
+        step = buffer.step * indexes.step
+
+        return builtins.range(start, start + step * len(indexes), step)
+
+    def __contains__(self, item: object) -> bool:
+        items = self.range
+
+        # ranges only look up integers in constant time, they compare the
+        # other values with each item
+        if items is not None and isinstance(item, float):
+            return item.is_integer() and int(item) in items
+
+        if items is None or not isinstance(item, int):
+            return super().__contains__(item)
+
+        return item in items
+
+    def reversed(self) -> typing_extensions.Self:
+        """
+        Return a reversed version of the list.
+
+        >>> L[0:10:3].reversed()
+        [9, 6, 3, 0]
+        """
+
+        if self.range is None:
+            return super().reversed()
+
+        return self[::-1]
+
+    def sum(
+        self,
+        *,
+        start: int = _sum.NO_START,
+        strategy: _sum.Strategy | None = None,
+        associative: bool = False,
+        workers: int | None = None,
+        executor: concurrent.futures.Executor | None = None,
+    ) -> int:
+        """
+        Return the sum of the list.
+
+        .. warning:: The list must be non-empty if there is no `start`.
+
+        >>> L[1:101].sum()
+        5050
+        """
+
+        items = self.range
+
+        if (
+            items is None
+            or (not items and start is _sum.NO_START)
+            or strategy is not None
+            or associative
+            or workers is not None
+            or executor is not None
+        ):
+            return super().sum(
+                start=start,
+                strategy=strategy,
+                associative=associative,
+                workers=workers,
+                executor=executor,
+            )
+
+        total = len(items) * (items[0] + items[-1]) // 2 if items else 0
+
+        return total if start is _sum.NO_START else start + total
+
+    def mean(self) -> float:  # pyright: ignore[reportIncompatibleMethodOverride]
+        """
+        Return the mean of the list.
+
+        .. warning:: The list must be non-empty.
+
+        >>> L[1:101].mean()
+        50.5
+        """
+
+        items = self.range
+
+        if not items:
+            return super().mean()
+
+        return (items[0] + items[-1]) / 2
+
+    def min(self) -> int:  # pyright: ignore[reportIncompatibleMethodOverride]
+        """
+        Return the minimum value of the list.
+
+        .. warning:: The list must be non-empty.
+
+        >>> L[10:0:-3].min()
+        1
+        """
+
+        items = self.range
+
+        if not items:
+            return super().min()
+
+        return min(items[0], items[-1])
+
+    def max(self) -> int:  # pyright: ignore[reportIncompatibleMethodOverride]
+        """
+        Return the maximum value of the list.
+
+        .. warning:: The list must be non-empty.
+
+        >>> L[10:0:-3].max()
+        10
+        """
+
+        items = self.range
+
+        if not items:
+            return super().max()
+
+        return max(items[0], items[-1])
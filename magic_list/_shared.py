@@ -0,0 +1,430 @@
+"""
+Magic lists stored in a `multiprocessing.shared_memory` block, used by
+`list.to_shared` and `list.attach_shared`.
+
+The block starts with a header recording the typecode and the number of
+items, followed by the items in the native layout of an `array.array`.
+Every process attaching the block reads the same memory, which is never
+copied nor pickled.
+"""
+
+from __future__ import annotations
+
+import array
+import builtins
+import struct
+import sys
+import typing
+import weakref
+from multiprocessing import shared_memory
+
+from magic_list import _binary
+from magic_list import _sum
+from magic_list._view import ListView
+from magic_list._view import _Window
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import collections.abc
+    import concurrent.futures
+    import types
+
+    import typing_extensions
+
+__all__ = [
+    "SharedList",
+    "create",
+]
+
+_NumberT = typing.TypeVar("_NumberT", int, float)
+
+_MAGIC = b"MLSM"
+# magic, typecode, padding, number of items: the padding keeps the items
+# aligned on 8 bytes
+_HEADER = struct.Struct("=4sc3xQ")
+_FLOAT_TYPECODES = frozenset("fd")
+_NUMBER_TYPECODES = frozenset("bBhHiIlLqQfd")
+
+
+def _close(
+    memory: shared_memory.SharedMemory,
+    items: weakref.ReferenceType[builtins.memoryview],
+) -> None:
+    view = items()
+
+    # the items are still alive if the interpreter is exiting
+    if view is not None:
+        view.release()
+
+    memory.close()
+
+
+class _Segment:
+    """
+    Shared memory block attached by the current process, along with the
+    memoryview of its items.
+    """
+
+    __slots__ = ("items", "memory")
+
+    def __init__(self, memory: shared_memory.SharedMemory, *, writable: bool) -> None:
+        try:
+            magic, typecode, size = _HEADER.unpack_from(memory.buf)
+        except struct.error:
+            magic, typecode, size = b"", b"", 0
+
+        typecode = typecode.decode("latin-1")
+
+        if magic != _MAGIC or typecode not in _NUMBER_TYPECODES:
+            memory.close()
+            msg = "the shared memory block does not hold a magic list"
+            raise ValueError(msg)
+
+        stop = _HEADER.size + size * array.array(typecode).itemsize
+        items = memory.buf[_HEADER.size : stop].cast(typecode)
+
+        self.memory = memory
+        self.items = items if writable else items.toreadonly()
+        # the lists sliced from a shared list and their iterators may read the
+        # items after the list (and its segment) is gone: the block is closed
+        # along with the items, since they export its memory
+        weakref.finalize(self.items, _close, memory, weakref.ref(self.items))
+
+    def close(self) -> None:
+        self.items.release()
+        self.memory.close()
+
+
+def _create_segment(
+    data: collections.abc.Iterable[typing.Any],
+    name: str | None,
+) -> _Segment:
+    if isinstance(data, array.array):
+        packed: array.array[typing.Any] | None = data
+    else:
+        try:
+            packed = _binary.pack(builtins.list(data))
+        except OverflowError:
+            msg = "the integers of the list do not fit in 64 bits"
+            raise ValueError(msg) from None
+
+    if packed is None or packed.typecode not in _NUMBER_TYPECODES:
+        msg = "only lists of int or float can be shared"
+        raise TypeError(msg)
+
+    items = memoryview(packed).cast("B")
+    memory = shared_memory.SharedMemory(
+        name,
+        create=True,
+        size=_HEADER.size + len(items),
+    )
+
+    _HEADER.pack_into(memory.buf, 0, _MAGIC, packed.typecode.encode(), len(packed))
+    memory.buf[_HEADER.size : _HEADER.size + len(items)] = items
+
+    return _Segment(memory, writable=True)
+
+
+def create(
+    data: collections.abc.Iterable[typing.Any],
+    name: str | None,
+) -> SharedList[typing.Any]:
+    """
+    Return a shared list holding a copy of `data`, stored in a new shared
+    memory block called `name` (or a generated name if it is `None`).
+    """
+
+    return SharedList._from_segment(_create_segment(data, name))  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+
+def _attach(name: str, *, writable: bool) -> _Segment:
+    if sys.version_info >= (3, 13):  # pragma: no cover
+        # the block is left to the resource tracker of its creator
+        memory = shared_memory.SharedMemory(name, track=False)
+    else:
+        memory = shared_memory.SharedMemory(name)
+
+    return _Segment(memory, writable=writable)
+
+
+def _rebuild(name: str, indexes: range, writable: bool) -> SharedList[typing.Any]:  # noqa: FBT001
+    # pickled shared lists attach the block again, with the same window
+    return SharedList._from_segment(_attach(name, writable=writable), indexes)  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+
+class SharedList(ListView[_NumberT]):
+    """
+    Homogeneous numeric list stored in a shared memory block, which other
+    processes can attach by its `name` and read without copying nor
+    pickling it. This is what `list.to_shared` and `list.attach_shared`
+    return.
+
+    It behaves like a view of the block (see `ListView`): slicing it,
+    `take`, `drop` and the like produce other views of the block, and
+    mutating it copies its items first, detaching it from the block. The
+    only exception is item assignment on a writable shared list, which
+    writes in the block and is visible to every process.
+
+    Pickling a shared list only sends the name of the block, which the
+    unpickling process attaches. The block stays in memory until `unlink`
+    is called, usually by the process that created it, while each process
+    should `close` its own attachments (a shared list is also a context
+    manager which closes it).
+
+    .. warning:: Closing a shared list also closes the lists sliced from \
+        it, which cannot be read anymore. Before Python 3.13, a process \
+        that attaches a block must share the resource tracker of the \
+        process that created it (which is the case of the processes it \
+        forks or spawns), otherwise the block is unlinked when it exits.
+
+    >>> shared = L[3, 5, 2].to_shared()
+    >>> other = list.attach_shared(shared.name)
+    >>> other.sum(), other.take(2)
+    (10, [3, 5])
+    >>> other.is_writable
+    False
+    >>> other.close()
+    >>> shared.close()
+    >>> shared.unlink()
+    """
+
+    _segment: _Segment | None = None
+
+    @classmethod
+    def attach(cls, name: str, *, writable: bool = False) -> SharedList[typing.Any]:
+        """
+        Return the list stored in the shared memory block called `name`.
+
+        If `writable` is true, assigning its items writes in the block.
+
+        >>> shared = L[3.5, 2.0].to_shared()
+        >>> SharedList.attach(shared.name)
+        SharedList([3.5, 2.0], name='...')
+        """
+
+        return cls._from_segment(_attach(name, writable=writable))
+
+    @classmethod
+    def _from_segment(
+        cls,
+        segment: _Segment,
+        indexes: range | None = None,
+    ) -> SharedList[typing.Any]:
+        if indexes is None:
+            indexes = range(len(segment.items))
+
+        result = cls(_Window(segment.items, indexes))
+        result._segment = segment
+
+        return result
+
+    @property
+    def name(self) -> str | None:
+        """
+        Name of the shared memory block, or `None` if the list was not
+        created from a block.
+
+        >>> L[3, 5, 2].to_shared().name
+        'psm_...'
+        """
+
+        if self._segment is None:
+            return None
+
+        return self._segment.memory.name
+
+    @property
+    def is_writable(self) -> bool:
+        """
+        Whether assigning the items of the list writes in the block.
+
+        >>> L[3, 5, 2].to_shared().is_writable
+        True
+        """
+
+        items = self._items()
+
+        return items is not None and not items.readonly
+
+    def _items(self) -> builtins.memoryview | None:
+        # memoryview of the items covered by the list, if it reads the block
+        if not isinstance(self.data, _Window):
+            return None
+
+        buffer = self.data._buffer  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+        indexes = self.data._indexes  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+        if not isinstance(buffer, builtins.memoryview):
+            return None
+
+        # the stop of a reversed range is negative when it covers index 0
+        stop = indexes.stop if indexes.stop >= 0 else None
+
+        return buffer[indexes.start : stop : indexes.step]
+
+    def close(self) -> None:
+        """
+        Detach the shared memory block from the current process. The block
+        itself is kept until `unlink` is called.
+
+        >>> shared = L[3, 5, 2].to_shared()
+        >>> shared.close()
+        >>> shared.unlink()
+        """
+
+        if self._segment is not None:
+            self._segment.close()
+
+    def unlink(self) -> None:
+        """
+        Destroy the shared memory block once every process has closed it.
+
+        This should only be called once, usually by the process that created
+        the block.
+        """
+
+        if self._segment is not None:
+            self._segment.memory.unlink()
+
+    def __enter__(self) -> typing_extensions.Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: types.TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({builtins.list(self.data)!r}, "
+            f"name={self.name!r})"
+        )
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        name = self.name
+
+        if name is None or not isinstance(self.data, _Window):
+            return (self.__class__, (builtins.list(self.data),))
+
+        return (
+            _rebuild,
+            (name, self.data._indexes, self.is_writable),  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+        )
+
+    def __setitem__(self, i: typing.Any, item: typing.Any) -> None:
+        if not self.is_writable:
+            super().__setitem__(i, item)
+            return
+
+        window = typing.cast("_Window[_NumberT]", self.data)
+        buffer = typing.cast("builtins.memoryview", window._buffer)  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+        if not isinstance(i, slice):
+            buffer[window._indexes[i]] = item  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+            return
+
+        indexes = window._indexes[i]  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+        items = builtins.list(item)
+
+        if len(items) != len(indexes):
+            msg = "a shared list cannot be resized"
+            raise ValueError(msg)
+
+        for index, value in zip(indexes, items):
+            buffer[index] = value
+
+    # *- aggregates are computed on the memoryview, which is faster to read -* #
+
+    def sum(
+        self,
+        *,
+        start: _NumberT = _sum.NO_START,
+        strategy: _sum.Strategy | None = None,
+        associative: bool = False,
+        workers: int | None = None,
+        executor: concurrent.futures.Executor | None = None,
+    ) -> _NumberT:
+        """
+        Return the sum of the list.
+
+        .. warning:: The list must be non-empty if there is no `start`.
+
+        >>> L[3, 5, 2].to_shared().sum()
+        10
+        """
+
+        items = self._items()
+
+        if (
+            not items
+            or start is not _sum.NO_START
+            or strategy is not None
+            or associative
+            or workers is not None
+            or executor is not None
+        ):
+            return super().sum(
+                start=start,
+                strategy=strategy,
+                associative=associative,
+                workers=workers,
+                executor=executor,
+            )
+
+        if items.format in _FLOAT_TYPECODES:
+            return typing.cast("_NumberT", _sum.fsum(items))
+
+        return typing.cast("_NumberT", builtins.sum(items))
+
+    def mean(self) -> float:  # pyright: ignore[reportIncompatibleMethodOverride]
+        """
+        Return the mean of the list.
+
+        .. warning:: The list must be non-empty.
+
+        >>> L[3, 5, 2].to_shared().mean()
+        3.3333333333333335
+        """
+
+        items = self._items()
+
+        if not items:
+            return super().mean()
+
+        return builtins.sum(items) / len(items)
+
+    def min(self) -> _NumberT:  # pyright: ignore[reportIncompatibleMethodOverride]
+        """
+        Return the minimum value of the list.
+
+        .. warning:: The list must be non-empty.
+
+        >>> L[3, 5, 2].to_shared().min()
+        2
+        """
+
+        items = self._items()
+
+        if not items:
+            return super().min()
+
+        return builtins.min(items)
+
+    def max(self) -> _NumberT:  # pyright: ignore[reportIncompatibleMethodOverride]
+        """
+        Return the maximum value of the list.
+
+        .. warning:: The list must be non-empty.
+
+        >>> L[3, 5, 2].to_shared().max()
+        5
+        """
+
+        items = self._items()
+
+        if not items:
+            return super().max()
+
+        return builtins.max(items)
@@ -0,0 +1,756 @@
+from __future__ import annotations
+
+import bisect
+import builtins
+import collections
+import collections.abc
+import itertools
+import operator
+import sys
+import typing
+
+from magic_list.prelude import list
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import concurrent.futures
+
+    import _typeshed
+    import typing_extensions
+
+__all__ = [
+    "SortedList",
+]
+
+_T = typing.TypeVar("_T")
+_U = typing.TypeVar("_U")
+_V = typing.TypeVar("_V")
+
+# chunks are split in two once they hold twice as many items
+_LOAD = 1000
+
+
+class _Chunks(collections.abc.Sequence[_T]):
+    """
+    Sorted items, stored in chunks of at most `2 * _LOAD` items so that an
+    insertion or a deletion only moves the items of one chunk.
+
+    `_keys[i]` holds the keys of the items of `_lists[i]` (it is `_lists`
+    itself if there is no key function), and `_maxes[i]` is the last of
+    them. `_offsets[i]` is the index of the first item of `_lists[i]` in
+    the whole sequence ; it is rebuilt lazily after a chunk changes.
+    """
+
+    __slots__ = ("_key", "_keys", "_len", "_lists", "_maxes", "_offsets")
+
+    def __init__(
+        self,
+        items: collections.abc.Iterable[_T],
+        key: collections.abc.Callable[[_T], typing.Any] | None,
+        *,
+        presorted: bool = False,
+    ) -> None:
+        items = builtins.list(items)
+
+        if not presorted:
+            items.sort(key=key)
+
+        self._key = key
+        self._lists = [items[i : i + _LOAD] for i in range(0, len(items), _LOAD)]
+        self._keys = (
+            self._lists
+            if key is None
+            else [builtins.list(map(key, chunk)) for chunk in self._lists]
+        )
+        self._maxes = [keys[-1] for keys in self._keys]
+        self._len = len(items)
+        self._offsets: builtins.list[int] | None = None
+
+    def __repr__(self) -> str:
+        return repr(builtins.list(self))
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> collections.abc.Iterator[_T]:
+        return itertools.chain.from_iterable(self._lists)
+
+    def __reversed__(self) -> collections.abc.Iterator[_T]:
+        return itertools.chain.from_iterable(map(reversed, reversed(self._lists)))
+
+    @typing.overload
+    def __getitem__(self, i: int) -> _T: ...
+    @typing.overload
+    def __getitem__(self, i: slice) -> _Chunks[_T]: ...
+    def __getitem__(self, i: int | slice) -> _T | _Chunks[_T]:
+        if isinstance(i, slice):
+            if i.step is not None and i.step < 0:
+                msg = "a sorted list cannot be sliced backwards"
+                raise ValueError(msg)
+
+            return _Chunks(builtins.list(self)[i], self._key, presorted=True)
+
+        # the ends are read in constant time
+        if i == 0 and self._len:
+            return self._lists[0][0]
+
+        if i == -1 and self._len:
+            return self._lists[-1][-1]
+
+        chunk, position = self._locate(i)
+
+        return self._lists[chunk][position]
+
+    # *- positions -* #
+
+    def _offset(self, chunk: int) -> int:
+        if self._offsets is None:
+            self._offsets = builtins.list(
+                itertools.accumulate(map(len, self._lists), initial=0),
+            )
+
+        return self._offsets[chunk]
+
+    def _locate(self, i: int) -> tuple[int, int]:
+        index = i + self._len if i < 0 else i
+
+        if not 0 <= index < self._len:
+            msg = "list index out of range"
+            raise IndexError(msg)
+
+        self._offset(0)
+        offsets = typing.cast("builtins.list[int]", self._offsets)
+        chunk = bisect.bisect_right(offsets, index) - 1
+
+        return chunk, index - offsets[chunk]
+
+    def key_of(self, item: _T) -> typing.Any:
+        return item if self._key is None else self._key(item)
+
+    def bisect_left(self, key: typing.Any) -> int:
+        chunk = bisect.bisect_left(self._maxes, key)
+
+        if chunk == len(self._maxes):
+            return self._len
+
+        return self._offset(chunk) + bisect.bisect_left(self._keys[chunk], key)
+
+    def bisect_right(self, key: typing.Any) -> int:
+        chunk = bisect.bisect_right(self._maxes, key)
+
+        if chunk == len(self._maxes):
+            return self._len
+
+        return self._offset(chunk) + bisect.bisect_right(self._keys[chunk], key)
+
+    def find(self, item: _T) -> int | None:
+        try:
+            return self._find(self.key_of(item), item)
+        except TypeError:
+            # the item cannot be compared with the items of the list
+            return None
+
+    def _find(self, key: typing.Any, item: _T) -> int | None:
+        # items with equal keys are not necessarily equal, so they are
+        # compared one by one
+        chunk = bisect.bisect_left(self._maxes, key)
+
+        while chunk < len(self._maxes):
+            keys = self._keys[chunk]
+            items = self._lists[chunk]
+            position = bisect.bisect_left(keys, key)
+
+            while position < len(keys) and not key < keys[position]:
+                if items[position] == item:
+                    return self._offset(chunk) + position
+
+                position += 1
+
+            if position < len(keys):
+                return None
+
+            chunk += 1
+
+        return None
+
+    def islice(self, start: int, stop: int) -> collections.abc.Iterator[_T]:
+        if start >= stop:
+            return iter(())
+
+        chunk, position = self._locate(start)
+
+        return itertools.islice(
+            itertools.chain.from_iterable(self._lists[chunk:]),
+            position,
+            position + stop - start,
+        )
+
+    # *- mutations -* #
+
+    def add(self, item: _T) -> None:
+        key = self.key_of(item)
+        self._len += 1
+        self._offsets = None
+
+        if not self._maxes:
+            self._lists.append([item])
+
+            if self._key is not None:
+                self._keys.append([key])
+
+            self._maxes.append(key)
+
+            return
+
+        chunk = min(bisect.bisect_right(self._maxes, key), len(self._maxes) - 1)
+        keys = self._keys[chunk]
+        position = bisect.bisect_right(keys, key)
+        self._lists[chunk].insert(position, item)
+
+        if self._key is not None:
+            keys.insert(position, key)
+
+        self._maxes[chunk] = keys[-1]
+
+        if len(keys) >= 2 * _LOAD:
+            self._split(chunk)
+
+    def _split(self, chunk: int) -> None:
+        items = self._lists[chunk]
+        self._lists[chunk : chunk + 1] = [items[:_LOAD], items[_LOAD:]]
+
+        if self._key is not None:
+            keys = self._keys[chunk]
+            self._keys[chunk : chunk + 1] = [keys[:_LOAD], keys[_LOAD:]]
+
+        self._maxes[chunk : chunk + 1] = [
+            self._keys[chunk][-1],
+            self._keys[chunk + 1][-1],
+        ]
+
+    def pop(self, i: int) -> _T:
+        chunk, position = self._locate(i)
+        item = self._lists[chunk].pop(position)
+        self._len -= 1
+        self._offsets = None
+
+        if self._key is not None:
+            del self._keys[chunk][position]
+
+        if self._lists[chunk]:
+            self._maxes[chunk] = self._keys[chunk][-1]
+        else:
+            del self._lists[chunk]
+
+            if self._key is not None:
+                del self._keys[chunk]
+
+            del self._maxes[chunk]
+
+        return item
+
+
+class SortedList(list[_T]):
+    """
+    Magic list that keeps its items sorted (by `key`, if provided) as they
+    are added and removed.
+
+    The items are stored in chunks, so that `add`, `remove` and `pop` only
+    move a small part of them. `in`, `index`, `count`, `irange` and
+    `nearest` use binary search, and `min` and `max` read the ends of the
+    list.
+
+    Sorted lists can be obtained through `list.sorted(keep_sorted=True)`.
+    Methods whose result may not be sorted, such as `map` or `reversed`,
+    return regular magic lists.
+
+    .. warning:: Items can only be inserted with `add` or `update`, since \
+        their position is given by the order.
+
+    >>> scores = SortedList([30, 10, 20])
+    >>> scores.add(15)
+    >>> scores
+    SortedList([10, 15, 20, 30])
+    >>> [*scores.irange(12, 25)]
+    [15, 20]
+    >>> scores.append(5)
+    *- TypeError: sorted list items can only be added with `add` or `update` -*
+    """
+
+    data: _Chunks[_T]  # pyright: ignore[reportIncompatibleVariableOverride]
+
+    __hash__ = None
+
+    def __init__(
+        self,
+        initlist: collections.abc.Iterable[_T] | None = None,
+        key: collections.abc.Callable[[_T], typing.Any] | None = None,
+    ) -> None:
+        if isinstance(initlist, collections.UserList):
+            initlist = typing.cast("collections.UserList[_T]", initlist).data
+
+        self.data = _Chunks(initlist or (), key)
+
+    def __repr__(self) -> str:
+        if self.key is None:
+            return f"{self.__class__.__name__}({builtins.list(self.data)!r})"
+
+        return (
+            f"{self.__class__.__name__}({builtins.list(self.data)!r}, key={self.key!r})"
+        )
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        return (self.__class__, (builtins.list(self.data), self.key))
+
+    @property
+    def key(self) -> collections.abc.Callable[[_T], typing.Any] | None:
+        """
+        Function giving the key that the items are sorted by, if any.
+        """
+
+        return self.data._key  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+    def _from_items(
+        self,
+        items: collections.abc.Iterable[_T],
+        *,
+        presorted: bool = False,
+    ) -> typing_extensions.Self:
+        return self._with_data(_Chunks(items, self.key, presorted=presorted))
+
+    def _unsorted(self) -> list[_T]:
+        return list(self.data)
+
+    # *- sorted operations -* #
+
+    def add(self, item: _T) -> None:
+        """
+        Insert an item at the position given by the order.
+
+        >>> l = SortedList([3, 5])
+        >>> l.add(4)
+        >>> l
+        SortedList([3, 4, 5])
+        """
+
+        self.data.add(item)
+
+    def update(self, items: collections.abc.Iterable[_T]) -> None:
+        """
+        Insert each item of `items` at the position given by the order.
+
+        >>> l = SortedList([3, 5])
+        >>> l.update([6, 2])
+        >>> l
+        SortedList([2, 3, 5, 6])
+        """
+
+        items = builtins.list(items)
+
+        # re-sorting everything is faster when there are many new items
+        if len(items) * 8 > len(self.data):
+            self.data = _Chunks(itertools.chain(self.data, items), self.key)
+            return
+
+        for item in items:
+            self.data.add(item)
+
+    def discard(self, item: _T) -> None:
+        """
+        Remove the first occurrence of `item`, if there is one.
+
+        >>> l = SortedList([3, 5])
+        >>> l.discard(4)
+        >>> l
+        SortedList([3, 5])
+        """
+
+        index = self.data.find(item)
+
+        if index is not None:
+            self.data.pop(index)
+
+    def irange(
+        self,
+        minimum: typing.Any = None,
+        maximum: typing.Any = None,
+        *,
+        inclusive: tuple[bool, bool] = (True, True),
+    ) -> collections.abc.Iterator[_T]:
+        """
+        Return an iterator over the items whose key is between `minimum`
+        and `maximum` (which are left unbounded if they are `None`), in
+        order. `inclusive` tells whether each bound is included.
+
+        >>> [*SortedList([3, 5, 2, 8]).irange(3, 8, inclusive=(True, False))]
+        [3, 5]
+        >>> [*SortedList(["hola", "ciao"], key=len).irange(maximum=4)]
+        ["hola", "ciao"]
+        """
+
+        if minimum is None:
+            start = 0
+        elif inclusive[0]:
+            start = self.data.bisect_left(minimum)
+        else:
+            start = self.data.bisect_right(minimum)
+
+        if maximum is None:
+            stop = len(self.data)
+        elif inclusive[1]:
+            stop = self.data.bisect_right(maximum)
+        else:
+            stop = self.data.bisect_left(maximum)
+
+        return self.data.islice(start, stop)
+
+    def nearest(self, key: typing.Any) -> _T:
+        """
+        Return the item whose key is the closest to `key`. If there are two
+        of them, the smallest one is returned.
+
+        .. warning:: The list must be non-empty, and the keys must support \
+            subtraction.
+
+        >>> SortedList([3, 10, 20]).nearest(14)
+        10
+        >>> SortedList().nearest(14)
+        *- TypeError: empty list has no nearest item -*
+        """
+
+        if not self.data:
+            msg = "empty list has no nearest item"
+            raise TypeError(msg)
+
+        index = self.data.bisect_left(key)
+
+        if index == 0:
+            return self.data[0]
+
+        if index == len(self.data):
+            return self.data[-1]
+
+        before, after = self.data[index - 1], self.data[index]
+        before_distance = abs(key - self.data.key_of(before))
+        after_distance = abs(self.data.key_of(after) - key)
+
+        return before if before_distance <= after_distance else after
+
+    def min(self) -> typing.Any:  # pyright: ignore[reportIncompatibleMethodOverride]
+        """
+        Return the minimum value of the list, in constant time if the list
+        is sorted by the items themselves.
+
+        >>> SortedList([3, 5, 2]).min()
+        2
+        """
+
+        if self.key is not None or not self or not isinstance(self.head, (int, float)):
+            return super().min()
+
+        return self.head
+
+    def max(self) -> typing.Any:  # pyright: ignore[reportIncompatibleMethodOverride]
+        """
+        Return the maximum value of the list, in constant time if the list
+        is sorted by the items themselves.
+
+        >>> SortedList([3, 5, 2]).max()
+        5
+        """
+
+        if self.key is not None or not self or not isinstance(self.last, (int, float)):
+            return super().max()
+
+        return self.last
+
+    # *- sequence protocol -* #
+
+    @typing.overload
+    def __getitem__(self, i: typing.SupportsIndex) -> _T: ...
+    @typing.overload
+    def __getitem__(self, i: slice) -> typing_extensions.Self: ...
+    def __getitem__(
+        self,
+        i: typing.SupportsIndex | slice,
+    ) -> _T | typing_extensions.Self | list[_T]:
+        if isinstance(i, slice) and i.step is not None and i.step < 0:
+            return self._unsorted()[i]
+
+        return super().__getitem__(i)
+
+    def __contains__(self, item: object) -> bool:
+        return self.data.find(typing.cast("_T", item)) is not None
+
+    def index(
+        self,
+        item: _T,
+        start: typing.SupportsIndex = 0,
+        stop: typing.SupportsIndex = sys.maxsize,
+    ) -> int:
+        bounds = range(len(self.data))[start:stop]
+        index = self.data.find(item)
+
+        if index is not None and index < bounds.start:
+            # the first occurrence is before `start`, look for another one
+            index = next(
+                (
+                    i
+                    for i in range(
+                        bounds.start,
+                        self.data.bisect_right(
+                            self.data.key_of(item),
+                        ),
+                    )
+                    if self.data[i] == item
+                ),
+                None,
+            )
+
+        if index is None or index >= bounds.stop:
+            msg = f"{item!r} is not in list"
+            raise ValueError(msg)
+
+        return index
+
+    def count(self, item: _T) -> int:
+        key = self.data.key_of(item)
+        start = self.data.bisect_left(key)
+        stop = self.data.bisect_right(key)
+
+        if self.key is None:
+            return stop - start
+
+        return operator.countOf(self.data.islice(start, stop), item)
+
+    # *- comparisons and arithmetic -* #
+
+    def _cast(self, other: typing.Any) -> typing.Any:
+        if isinstance(other, collections.UserList):
+            other = typing.cast("collections.UserList[typing.Any]", other).data
+
+        if isinstance(other, _Chunks):
+            return builtins.list(typing.cast("_Chunks[typing.Any]", other))
+
+        return other
+
+    def __eq__(self, other: object) -> bool:
+        return builtins.list(self.data) == self._cast(other)
+
+    def __lt__(self, other: typing.Any) -> bool:
+        return builtins.list(self.data) < self._cast(other)
+
+    def __le__(self, other: typing.Any) -> bool:
+        return builtins.list(self.data) <= self._cast(other)
+
+    def __gt__(self, other: typing.Any) -> bool:
+        return builtins.list(self.data) > self._cast(other)
+
+    def __ge__(self, other: typing.Any) -> bool:
+        return builtins.list(self.data) >= self._cast(other)
+
+    def __add__(self, other: collections.abc.Iterable[_T]) -> typing_extensions.Self:
+        result = self.copy()
+        result.update(other)
+
+        return result
+
+    def __radd__(self, other: collections.abc.Iterable[_T]) -> typing_extensions.Self:
+        return self + other
+
+    def __iadd__(self, other: collections.abc.Iterable[_T]) -> typing_extensions.Self:
+        self.update(other)
+
+        return self
+
+    def __mul__(self, n: int) -> typing_extensions.Self:
+        return self._from_items(builtins.list(self.data) * n)
+
+    __rmul__ = __mul__
+
+    def __imul__(self, n: int) -> typing_extensions.Self:
+        self.data = _Chunks(builtins.list(self.data) * n, self.key)
+
+        return self
+
+    # *- pre-existing methods -* #
+
+    def __setitem__(self, i: typing.Any, item: typing.Any) -> None:
+        msg = "sorted list items cannot be assigned"
+        raise TypeError(msg)
+
+    def __delitem__(self, i: typing.SupportsIndex | slice) -> None:
+        if isinstance(i, slice):
+            items = builtins.list(self.data)
+            del items[i]
+            self.data = _Chunks(items, self.key, presorted=True)
+        else:
+            self.data.pop(operator.index(i))
+
+    def append(self, item: _T) -> None:
+        del item
+
+        msg = "sorted list items can only be added with `add` or `update`"
+        raise TypeError(msg)
+
+    def insert(self, i: int, item: _T) -> None:
+        del i, item
+
+        msg = "sorted list items can only be added with `add` or `update`"
+        raise TypeError(msg)
+
+    def extend(self, other: collections.abc.Iterable[_T]) -> None:
+        del other
+
+        msg = "sorted list items can only be added with `add` or `update`"
+        raise TypeError(msg)
+
+    def pop(self, i: int = -1) -> _T:
+        return self.data.pop(i)
+
+    def remove(self, item: _T) -> None:
+        index = self.data.find(item)
+
+        if index is None:
+            msg = f"{item!r} is not in list"
+            raise ValueError(msg)
+
+        self.data.pop(index)
+
+    def clear(self) -> None:
+        self.data = _Chunks((), self.key)
+
+    def reverse(self) -> None:
+        msg = "sorted list cannot be reordered"
+        raise TypeError(msg)
+
+    def sort(self, /, *args: typing.Any, **kwds: typing.Any) -> None:
+        # the list is already sorted by its key
+        if args or kwds:
+            msg = "sorted list cannot be reordered"
+            raise TypeError(msg)
+
+    def rotate_inplace(self, n: int = 1) -> None:
+        del n
+
+        msg = "sorted list cannot be reordered"
+        raise TypeError(msg)
+
+    # *- methods that keep the order -* #
+
+    def filter(
+        self,
+        function: collections.abc.Callable[[_T], bool],
+        *,
+        executor: concurrent.futures.Executor | None = None,
+        chunksize: int | None = None,
+        ordered: bool = True,
+    ) -> typing_extensions.Self:
+        items = self._unsorted().filter(
+            function,
+            executor=executor,
+            chunksize=chunksize,
+            ordered=ordered,
+        )
+
+        return self._from_items(items, presorted=ordered)
+
+    async def afilter(
+        self,
+        function: collections.abc.Callable[[_T], collections.abc.Awaitable[bool]],
+        *,
+        concurrency: int | None = None,
+    ) -> typing_extensions.Self:
+        items = await self._unsorted().afilter(function, concurrency=concurrency)
+
+        return self._from_items(items, presorted=True)
+
+    def mask(self, mask_seq: collections.abc.Sequence[bool]) -> typing_extensions.Self:
+        return self._from_items(self._unsorted().mask(mask_seq), presorted=True)
+
+    def deduplicate(
+        self,
+        *,
+        key: collections.abc.Callable[[_T], typing.Any] | None = None,
+    ) -> typing_extensions.Self:
+        return self._from_items(
+            self._unsorted().deduplicate(key=key),
+            presorted=True,
+        )
+
+    # *- methods that do not keep the order: they return regular lists -* #
+
+    def _with_items(self, items: collections.abc.Iterable[_T]) -> list[_T]:  # pyright: ignore[reportIncompatibleMethodOverride]
+        return list(items)
+
+    def reversed(self) -> list[_T]:  # pyright: ignore[reportIncompatibleMethodOverride]
+        return list(self.data.__reversed__())
+
+    def sorted(  # pyright: ignore[reportIncompatibleMethodOverride]
+        self,
+        *,
+        key: collections.abc.Callable[[_T], _typeshed.SupportsRichComparison]
+        | None = None,
+        reverse: bool = False,
+        keep_sorted: bool = False,
+    ) -> list[_T]:
+        return self._unsorted().sorted(
+            key=key,
+            reverse=reverse,
+            keep_sorted=keep_sorted,
+        )
+
+    def shuffled(self) -> list[_T]:  # pyright: ignore[reportIncompatibleMethodOverride]
+        return self._unsorted().shuffled()
+
+    def map(  # pyright: ignore[reportIncompatibleMethodOverride]
+        self,
+        function: collections.abc.Callable[[_T], _U],
+        *,
+        executor: concurrent.futures.Executor | None = None,
+        chunksize: int | None = None,
+        ordered: bool = True,
+    ) -> list[_U]:
+        return self._unsorted().map(
+            function,
+            executor=executor,
+            chunksize=chunksize,
+            ordered=ordered,
+        )
+
+    def rotate(self, n: int = 1) -> list[_T]:  # pyright: ignore[reportIncompatibleMethodOverride]
+        return self._unsorted().rotate(n)
+
+    def scan(  # pyright: ignore[reportIncompatibleMethodOverride]
+        self,
+        function: collections.abc.Callable[[_T, _T], _T],
+        initial_value: _T,
+    ) -> list[_T]:
+        return self._unsorted().scan(function, initial_value)
+
+    def scan_right(  # pyright: ignore[reportIncompatibleMethodOverride]
+        self,
+        function: collections.abc.Callable[[_T, _T], _T],
+        initial_value: _T,
+    ) -> list[_T]:
+        return self._unsorted().scan_right(function, initial_value)
+
+    def merge(
+        self,
+        function: collections.abc.Callable[[_T, _U], _V],
+        other: collections.abc.Sequence[_U],
+    ) -> list[_V]:
+        return self._unsorted().merge(function, other)
+
+    def fill_left(  # pyright: ignore[reportIncompatibleMethodOverride]
+        self,
+        filler: _T | collections.abc.Callable[[list[_T]], _T],
+        n: int,
+    ) -> list[_T]:
+        return self._unsorted().fill_left(filler, n)
+
+    def fill_right(  # pyright: ignore[reportIncompatibleMethodOverride]
+        self,
+        filler: _T | collections.abc.Callable[[list[_T]], _T],
+        n: int,
+    ) -> list[_T]:
+        return self._unsorted().fill_right(filler, n)
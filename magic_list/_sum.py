@@ -0,0 +1,125 @@
+"""
+Summation strategies used by `list.sum`, picked according to the items.
+"""
+
+from __future__ import annotations
+
+import functools
+import itertools
+import math
+import operator
+import typing
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import collections.abc
+
+__all__ = [
+    "NO_START",
+    "STRATEGIES",
+    "Strategy",
+    "detect_strategy",
+    "fsum",
+    "sum_items",
+]
+
+NO_START: typing.Any = object()
+"""
+Default value of the `start` parameter of `sum`, meaning that the first item
+is used as the start.
+"""
+
+Strategy = typing.Literal["join", "chain", "fsum", "builtin", "reduce"]
+
+STRATEGIES: tuple[Strategy, ...] = typing.get_args(Strategy)
+
+_STRATEGY_PER_TYPE: dict[type, Strategy] = {
+    str: "join",
+    bytes: "join",
+    tuple: "chain",
+    list: "chain",
+    float: "fsum",
+    int: "builtin",
+}
+
+
+def detect_strategy(items: collections.abc.Sequence[typing.Any]) -> Strategy:
+    """
+    Return the fastest strategy to sum the non-empty `items` ; this is
+    `"builtin"` if the first one is an integer, and `"reduce"` unless they
+    are all of one of the other types that have a dedicated strategy.
+    """
+
+    first = type(items[0])
+
+    if first is int:
+        # `0 + items[0]` is `items[0]`, so the builtin `sum` adds the items
+        # exactly like `"reduce"` whatever their types are, without a pass
+        # over them to find out
+        return "builtin"
+
+    strategy = _STRATEGY_PER_TYPE.get(first, "reduce")
+
+    # the types are collected in C, which is faster than stopping at the
+    # first mismatch in Python when the items are homogeneous
+    if strategy == "reduce" or set(map(type, items)) != {first}:
+        return "reduce"
+
+    return strategy
+
+
+def _join(items: collections.abc.Sequence[typing.Any]) -> typing.Any:
+    # the empty separator has the same type as the items
+    return items[0][:0].join(items)
+
+
+def _chain(items: collections.abc.Sequence[typing.Any]) -> typing.Any:
+    return items[0].__class__(itertools.chain.from_iterable(items))
+
+
+def fsum(
+    items: collections.abc.Sequence[float],
+    start: typing.Any = NO_START,
+) -> typing.Any:
+    """
+    Return the correctly rounded sum of the floats `items`, starting from
+    `start` if provided.
+
+    `math.fsum` raises if the sum is not finite, so the builtin `sum` is used
+    instead to give back `inf` or `nan`.
+    """
+
+    try:
+        if start is NO_START:
+            return math.fsum(items)
+
+        return math.fsum(itertools.chain((start,), items))
+    except (ValueError, OverflowError):
+        return sum(items) if start is NO_START else sum(items, start)
+
+
+def sum_items(
+    items: collections.abc.Sequence[typing.Any],
+    strategy: Strategy,
+    start: typing.Any = NO_START,
+) -> typing.Any:
+    """
+    Sum the non-empty `items` using `strategy`, starting from `start` if
+    provided.
+    """
+
+    if strategy == "fsum":
+        return fsum(items, start)
+
+    if strategy == "builtin":
+        return sum(items) if start is NO_START else sum(items, start)
+
+    if strategy == "reduce":
+        if start is NO_START:
+            return functools.reduce(operator.add, items)
+
+        return functools.reduce(operator.add, items, start)
+
+    # concatenations build a single object instead of one per item
+    result = _join(items) if strategy == "join" else _chain(items)
+
+    return result if start is NO_START else start + result
@@ -0,0 +1,580 @@
+from __future__ import annotations
+
+import array
+import builtins
+import collections
+import collections.abc
+import itertools
+import typing
+
+from magic_list import _binary
+from magic_list import _parallel
+from magic_list import _sum
+from magic_list.prelude import list
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import concurrent.futures
+
+    import _typeshed
+    import typing_extensions
+
+    from magic_list._sorted import SortedList
+
+__all__ = [
+    "TypedList",
+]
+
+_U = typing.TypeVar("_U")
+_V = typing.TypeVar("_V")
+_NumberT = typing.TypeVar("_NumberT", int, float)
+
+_DEFAULT_TYPECODE = "d"
+_FLOAT_TYPECODES = frozenset("fd")
+
+
+def _infer_typecode(items: collections.abc.Iterable[typing.Any]) -> str | None:
+    """
+    Return the array typecode able to store `items`, or `None` if they are
+    not all numbers.
+    """
+
+    typecode = "q"
+
+    for item in items:
+        if isinstance(item, float):
+            typecode = "d"
+        elif not isinstance(item, int):
+            return None
+
+    return typecode
+
+
+class TypedList(list[_NumberT]):
+    """
+    Homogeneous numeric list stored in a compact `array.array`.
+
+    Items are stored unboxed according to the `typecode` (see the `array`
+    module), which drastically reduces the memory footprint of large lists
+    of numbers. If it is not provided, the typecode is inferred from the
+    items: `"q"` (64-bit signed integers) if they are all integers, `"d"`
+    (double precision floats) otherwise.
+
+    It supports the same methods as the magic `list`. Storing an item that
+    does not fit in the typecode raises an exception.
+
+    From pickle protocol 5, the array is pickled as a `pickle.PickleBuffer`,
+    which can be transferred out-of-band without being copied into the
+    pickle stream.
+
+    >>> TypedList([3, 5, 2])
+    TypedList([3, 5, 2], typecode='q')
+    >>> L[3.0, 5.5].typed()
+    TypedList([3.0, 5.5], typecode='d')
+    >>> TypedList([3, 5, 2]).append("hello")
+    *- TypeError: 'str' object cannot be interpreted as an integer -*
+    """
+
+    data: array.array[_NumberT]  # pyright: ignore[reportIncompatibleVariableOverride]
+
+    __hash__ = None
+
+    def __init__(
+        self,
+        initlist: collections.abc.Iterable[_NumberT] | None = None,
+        typecode: str | None = None,
+    ) -> None:
+        if isinstance(initlist, collections.UserList):
+            initlist = typing.cast("collections.UserList[_NumberT]", initlist).data
+
+        if typecode is None and isinstance(initlist, array.array):
+            typecode = initlist.typecode
+
+        if typecode is None:
+            items = builtins.list(initlist or ())
+            typecode = _infer_typecode(items)
+
+            if typecode is None:
+                msg = "typed list items must be integers or floats"
+                raise TypeError(msg)
+
+            initlist = items or ()
+            typecode = typecode if items else _DEFAULT_TYPECODE
+
+        self.data = array.array(typecode, initlist or ())
+
+    @property
+    def typecode(self) -> str:
+        """
+        Typecode of the underlying array.
+
+        >>> TypedList([3.0, 5.5]).typecode
+        'd'
+        """
+
+        return self.data.typecode
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({self.data.tolist()!r}, "
+            f"typecode={self.typecode!r})"
+        )
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        return (self.__class__, (self.data,))
+
+    def __reduce_ex__(self, protocol: typing.SupportsIndex) -> typing.Any:
+        # the array is sent as an out-of-band buffer from protocol 5
+        if protocol >= 5:
+            return _binary.reduce_buffer(self)
+
+        return self.__reduce__()
+
+    def _with_items(
+        self,
+        items: collections.abc.Iterable[_NumberT],
+    ) -> typing_extensions.Self:
+        return self.__class__(array.array(self.typecode, items))
+
+    # *- buffer protocol -* #
+
+    def __buffer__(self, flags: int, /) -> builtins.memoryview:
+        # only used by Python 3.12+ (PEP 688)
+        return memoryview(self.data)
+
+    def memoryview(self) -> builtins.memoryview:
+        """
+        Return a memoryview of the underlying buffer, without copying it.
+
+        >>> TypedList([3, 5, 2]).memoryview().nbytes
+        24
+        """
+
+        return memoryview(self.data)
+
+    # *- sequence protocol -* #
+
+    def __setitem__(self, i: typing.Any, item: typing.Any) -> None:
+        if isinstance(i, slice):
+            item = array.array(self.typecode, item)
+
+        self.data[i] = item
+
+    # *- comparisons and arithmetic -* #
+
+    def _cast(self, other: typing.Any) -> typing.Any:
+        if isinstance(other, collections.UserList):
+            other = typing.cast("collections.UserList[typing.Any]", other).data
+
+        if isinstance(other, array.array):
+            return other.tolist()
+
+        return other
+
+    def __eq__(self, other: object) -> bool:
+        return self.data.tolist() == self._cast(other)
+
+    def __lt__(self, other: typing.Any) -> bool:
+        return self.data.tolist() < self._cast(other)
+
+    def __le__(self, other: typing.Any) -> bool:
+        return self.data.tolist() <= self._cast(other)
+
+    def __gt__(self, other: typing.Any) -> bool:
+        return self.data.tolist() > self._cast(other)
+
+    def __ge__(self, other: typing.Any) -> bool:
+        return self.data.tolist() >= self._cast(other)
+
+    def __add__(
+        self,
+        other: collections.abc.Iterable[_NumberT],
+    ) -> typing_extensions.Self:
+        result = self.copy()
+        result.extend(other)
+
+        return result
+
+    def __radd__(
+        self,
+        other: collections.abc.Iterable[_NumberT],
+    ) -> typing_extensions.Self:
+        result = self._with_items(other)
+        result.extend(self)
+
+        return result
+
+    def __iadd__(
+        self,
+        other: collections.abc.Iterable[_NumberT],
+    ) -> typing_extensions.Self:
+        self.extend(other)
+
+        return self
+
+    # *- pre-existing methods -* #
+
+    def extend(self, other: collections.abc.Iterable[_NumberT]) -> None:
+        if isinstance(other, collections.UserList):
+            other = typing.cast("collections.UserList[_NumberT]", other).data
+
+        # arrays can only be extended with arrays of the same typecode
+        self.data.extend(iter(other))
+
+    def clear(self) -> None:
+        del self.data[:]
+
+    def sort(self, /, *args: typing.Any, **kwds: typing.Any) -> None:
+        self.data = array.array(self.typecode, sorted(self.data, *args, **kwds))
+
+    # *- magic methods -* #
+
+    def reversed(self) -> typing_extensions.Self:
+        """
+        Return a reversed version of the list.
+
+        >>> TypedList([1, 2, 3]).reversed()
+        TypedList([3, 2, 1], typecode='q')
+        """
+
+        return self[::-1]
+
+    def sorted(
+        self,
+        *,
+        key: collections.abc.Callable[[_NumberT], _typeshed.SupportsRichComparison]
+        | None = None,
+        reverse: bool = False,
+        keep_sorted: bool = False,
+    ) -> typing_extensions.Self | SortedList[_NumberT]:
+        """
+        Return a sorted version of the list.
+
+        >>> TypedList([3, 5, 2]).sorted()
+        TypedList([2, 3, 5], typecode='q')
+        """
+
+        if keep_sorted:
+            return super().sorted(key=key, reverse=reverse, keep_sorted=True)
+
+        return self._with_items(sorted(self.data, key=key, reverse=reverse))  # pyright: ignore[reportCallIssue, reportArgumentType]
+
+    def map(
+        self,
+        function: collections.abc.Callable[[_NumberT], _U],
+        *,
+        executor: concurrent.futures.Executor | None = None,
+        chunksize: int | None = None,
+        ordered: bool = True,
+    ) -> list[_U]:
+        """
+        Apply `function` on each item of the list.
+
+        The result keeps the typecode if the results are numbers of the same
+        kind as the items (integers or floats), and is otherwise a typed list
+        with an inferred typecode. It is a regular magic list if the results
+        are not all integers or all floats (booleans are not integers here).
+
+        >>> TypedList([3, 5, 2]).map(lambda n: n * 2)
+        TypedList([6, 10, 4], typecode='q')
+        >>> TypedList([3, 5, 2]).map(lambda n: n / 2)
+        TypedList([1.5, 2.5, 1.0], typecode='d')
+        >>> TypedList([1.5, 2.5]).map(round)
+        TypedList([2, 2], typecode='q')
+        >>> TypedList([3, 5, 2]).map(str)
+        ["3", "5", "2"]
+        """
+
+        if executor is not None:
+            results = _parallel.map_items(
+                function,
+                self.data,
+                executor,
+                chunksize,
+                ordered=ordered,
+            )
+        else:
+            results = builtins.list(map(function, self.data))
+
+        return self._with_results(results)
+
+    async def amap(
+        self,
+        function: collections.abc.Callable[[_NumberT], collections.abc.Awaitable[_U]],
+        *,
+        concurrency: int | None = None,
+    ) -> list[_U]:
+        """
+        Await the coroutine function `function` on each item of the list.
+
+        The result is typed the same way as with `map`.
+
+        >>> async def fetch(n):
+        ...     await asyncio.sleep(0.1)
+        ...     return n / 2
+        >>> await TypedList([3, 5, 2]).amap(fetch, concurrency=2)
+        TypedList([1.5, 2.5, 1.0], typecode='d')
+        """
+
+        return self._with_results(
+            await _parallel.gather_bounded(function, self.data, concurrency),
+        )
+
+    def _with_results(self, results: builtins.list[_U]) -> list[_U]:
+        # typed list of the mapped `results`, see `map`
+        if not results:
+            return typing.cast("list[_U]", self._with_items(()))
+
+        try:
+            # only exact integers and floats are packed, so that the results
+            # are never silently converted
+            packed = _binary.pack(results)
+        except OverflowError:
+            packed = None
+
+        if packed is None:
+            return list(results)
+
+        if (packed.typecode in _FLOAT_TYPECODES) == (self.typecode in _FLOAT_TYPECODES):
+            try:
+                return typing.cast(
+                    "list[_U]",
+                    self.__class__(array.array(self.typecode, results)),  # pyright: ignore[reportArgumentType]
+                )
+            except OverflowError:
+                pass
+
+        return typing.cast("list[_U]", self.__class__(packed))  # pyright: ignore[reportArgumentType]
+
+    def filter(
+        self,
+        function: collections.abc.Callable[[_NumberT], bool],
+        *,
+        executor: concurrent.futures.Executor | None = None,
+        chunksize: int | None = None,
+        ordered: bool = True,
+    ) -> typing_extensions.Self:
+        """
+        Discard each item `i` of the list if `function(i)` is `False`.
+
+        >>> TypedList([3, 5, 2]).filter(lambda n: n % 2 == 1)
+        TypedList([3, 5], typecode='q')
+        """
+
+        if executor is not None:
+            return self._with_items(
+                _parallel.filter_items(
+                    function,
+                    self.data,
+                    executor,
+                    chunksize,
+                    ordered=ordered,
+                ),
+            )
+
+        return self._with_items(filter(function, self.data))
+
+    def mask(
+        self,
+        mask_seq: collections.abc.Sequence[bool],
+    ) -> typing_extensions.Self:
+        """
+        Keep every item at index `i` of the list if the corresponding
+        item at index `i` of the mask sequence is `True` ; else, discard
+        it. Return the filtered list.
+
+        .. warning:: The mask sequence must be of the same length as the list.
+
+        >>> TypedList([3, 5, 2]).mask([True, False, True])
+        TypedList([3, 2], typecode='q')
+        """
+
+        if len(self) != len(mask_seq):
+            msg = "mask length must be the same as the list"
+            raise TypeError(msg)
+
+        return self._with_items(itertools.compress(self.data, mask_seq))
+
+    def select(
+        self,
+        indexes: collections.abc.Sequence[int],
+    ) -> typing_extensions.Self:
+        """
+        Select items at provided indexes. If an index is present several
+        times, this will be reflected in the resulting list.
+
+        .. warning:: All the indexes must be in bounds.
+
+        >>> TypedList([3, 5, 2]).select([1, 2, 0, 0])
+        TypedList([5, 2, 3, 3], typecode='q')
+        """
+
+        try:
+            return self._with_items(map(self.data.__getitem__, indexes))
+        except IndexError:
+            # let the generic implementation report the faulty index
+            return super().select(indexes)
+
+    def deduplicate(
+        self,
+        *,
+        key: collections.abc.Callable[[_NumberT], typing.Any] | None = None,
+    ) -> typing_extensions.Self:
+        """
+        Remove duplicate elements from left to right (and keep original ones).
+        Return the deduplicated list.
+
+        >>> TypedList([3, 0, 0, 1, 18], "i").deduplicate()
+        TypedList([3, 0, 1, 18], typecode='i')
+        """
+
+        return self._with_items(self._ideduplicate(key))
+
+    def scan(
+        self,
+        function: collections.abc.Callable[[_NumberT, _NumberT], _NumberT],
+        initial_value: _NumberT,
+    ) -> typing_extensions.Self:
+        """
+        "Insert" an operator (called a reducing function) between each item
+        from left to right and return the intermediate values followed by the
+        result.
+
+        The result is typed the same way as with `map`.
+
+        >>> TypedList([3, 5, 2], "i").scan(operator.add, 0)
+        TypedList([0, 3, 8, 10], typecode='i')
+        """
+
+        return typing.cast(
+            "typing_extensions.Self",
+            self._with_results(builtins.list(self.iscan(function, initial_value))),
+        )
+
+    def scan_right(
+        self,
+        function: collections.abc.Callable[[_NumberT, _NumberT], _NumberT],
+        initial_value: _NumberT,
+    ) -> typing_extensions.Self:
+        """
+        "Insert" an operator (called a reducing function) between each item
+        from right to left and return the intermediate values followed by the
+        result.
+
+        The result is typed the same way as with `map`.
+
+        >>> TypedList([3, 5, 2], "i").scan_right(operator.add, 0)
+        TypedList([0, 2, 7, 10], typecode='i')
+        """
+
+        return typing.cast(
+            "typing_extensions.Self",
+            self._with_results(
+                builtins.list(self.iscan_right(function, initial_value)),
+            ),
+        )
+
+    def merge(
+        self,
+        function: collections.abc.Callable[[_NumberT, _U], _V],
+        other: collections.abc.Sequence[_U],
+    ) -> list[_V]:
+        """
+        Build a new list from the result of each `function(s_i, o_i)` where
+        `s_i` and `o_i` are the items at index `i` of `self` and `other`
+        respectively.
+
+        The result is typed the same way as with `map`.
+
+        >>> TypedList([3, 5, 2], "i").merge(operator.add, [-1, 4, -9])
+        TypedList([2, 9, -7], typecode='i')
+        """
+
+        if len(self) != len(other):
+            msg = "the length of the two sequences must be equal"
+            raise TypeError(msg)
+
+        return self._with_results(
+            builtins.list(map(function, self.data, other)),
+        )
+
+    def sum(
+        self,
+        *,
+        start: _NumberT = _sum.NO_START,
+        strategy: _sum.Strategy | None = None,
+        associative: bool = False,
+        workers: int | None = None,
+        executor: concurrent.futures.Executor | None = None,
+    ) -> _NumberT:
+        """
+        Return the sum of the list.
+
+        .. warning:: The list must be non-empty if there is no `start`.
+
+        >>> TypedList([3, 5, 2]).sum()
+        10
+        >>> TypedList([0.1] * 10).sum()
+        1.0
+        """
+
+        if strategy is None and not (
+            associative or workers is not None or executor is not None
+        ):
+            # the typecode tells the type of the items without reading them
+            strategy = "fsum" if self.typecode in _FLOAT_TYPECODES else "builtin"
+
+        return super().sum(
+            start=start,
+            strategy=strategy,
+            associative=associative,
+            workers=workers,
+            executor=executor,
+        )
+
+    def mean(self) -> float:  # pyright: ignore[reportIncompatibleMethodOverride]
+        """
+        Return the mean of the list.
+
+        .. warning:: The list must be non-empty.
+
+        >>> TypedList([3, 5, 2]).mean()
+        3.3333333333333335
+        """
+
+        if not self:
+            msg = "cannot calculate mean of empty list"
+            raise TypeError(msg)
+
+        return sum(self.data) / len(self.data)
+
+    def min(self) -> _NumberT:  # pyright: ignore[reportIncompatibleMethodOverride]
+        """
+        Return the minimum value of the list.
+
+        .. warning:: The list must be non-empty.
+
+        >>> TypedList([3, 5, 2]).min()
+        2
+        """
+
+        if not self:
+            msg = "empty list has no minimum"
+            raise TypeError(msg)
+
+        return min(self.data)
+
+    def max(self) -> _NumberT:  # pyright: ignore[reportIncompatibleMethodOverride]
+        """
+        Return the maximum value of the list.
+
+        .. warning:: The list must be non-empty.
+
+        >>> TypedList([3, 5, 2]).max()
+        5
+        """
+
+        if not self:
+            msg = "empty list has no maximum"
+            raise TypeError(msg)
+
+        return max(self.data)
@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+import builtins
+import collections.abc
+import operator
+import sys
+import typing
+
+from magic_list.prelude import list
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import typing_extensions
+
+__all__ = [
+    "ListView",
+]
+
+_T = typing.TypeVar("_T")
+
+
+class _Window(collections.abc.Sequence[_T]):
+    """
+    Read-only window on a sequence, described by the range of indexes it
+    covers (i.e. an offset, a length and a step).
+
+    Slicing a window produces another window on the same sequence.
+    """
+
+    __slots__ = ("_buffer", "_indexes")
+
+    __hash__ = None
+
+    def __init__(self, buffer: collections.abc.Sequence[_T], indexes: range) -> None:
+        self._buffer = buffer
+        self._indexes = indexes
+
+    def __repr__(self) -> str:
+        return repr(builtins.list(self))
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        # only the covered items are pickled, not the whole buffer
+        return (builtins.list, (builtins.list(self),))
+
+    def __len__(self) -> int:
+        return len(self._indexes)
+
+    @typing.overload
+    def __getitem__(self, i: int) -> _T: ...
+    @typing.overload
+    def __getitem__(self, i: slice) -> _Window[_T]: ...
+    def __getitem__(self, i: int | slice) -> _T | _Window[_T]:
+        if isinstance(i, slice):
+            return _Window(self._buffer, self._indexes[i])
+
+        try:
+            return self._buffer[self._indexes[i]]
+        except IndexError:
+            msg = "list index out of range"
+            raise IndexError(msg) from None
+
+    def __iter__(self) -> collections.abc.Iterator[_T]:
+        return map(self._buffer.__getitem__, self._indexes)
+
+    def __reversed__(self) -> collections.abc.Iterator[_T]:
+        return map(self._buffer.__getitem__, reversed(self._indexes))
+
+    def __contains__(self, item: object) -> bool:
+        return item in iter(self)
+
+    def count(self, item: typing.Any) -> int:
+        return operator.countOf(iter(self), item)
+
+    def index(
+        self,
+        item: typing.Any,
+        start: typing.SupportsIndex = 0,
+        stop: typing.SupportsIndex = sys.maxsize,
+    ) -> int:
+        offset = range(len(self))[start:stop]
+
+        try:
+            return offset.start + operator.indexOf(
+                iter(self[offset.start : offset.stop]),
+                item,
+            )
+        except ValueError:
+            msg = f"{item!r} is not in list"
+            raise ValueError(msg) from None
+
+    # windows behave like built-in lists when compared or concatenated
+
+    @staticmethod
+    def _cast(other: object) -> builtins.list[typing.Any] | None:
+        if isinstance(other, _Window):
+            return builtins.list(typing.cast("_Window[typing.Any]", other))
+
+        if isinstance(other, builtins.list):
+            return typing.cast("builtins.list[typing.Any]", other)
+
+        return None
+
+    def __eq__(self, other: object) -> bool:
+        other_list = self._cast(other)
+
+        if other_list is None:
+            return NotImplemented
+
+        return builtins.list(self) == other_list
+
+    def __lt__(self, other: object) -> bool:
+        other_list = self._cast(other)
+
+        if other_list is None:
+            return NotImplemented
+
+        return builtins.list(self) < other_list
+
+    def __le__(self, other: object) -> bool:
+        other_list = self._cast(other)
+
+        if other_list is None:
+            return NotImplemented
+
+        return builtins.list(self) <= other_list
+
+    def __gt__(self, other: object) -> bool:
+        other_list = self._cast(other)
+
+        if other_list is None:
+            return NotImplemented
+
+        return builtins.list(self) > other_list
+
+    def __ge__(self, other: object) -> bool:
+        other_list = self._cast(other)
+
+        if other_list is None:
+            return NotImplemented
+
+        return builtins.list(self) >= other_list
+
+    def __add__(self, other: object) -> builtins.list[_T]:
+        other_list = self._cast(other)
+
+        if other_list is None:
+            return NotImplemented
+
+        return builtins.list(self) + other_list
+
+    def __radd__(self, other: object) -> builtins.list[_T]:
+        other_list = self._cast(other)
+
+        if other_list is None:
+            return NotImplemented
+
+        return other_list + builtins.list(self)
+
+    def __mul__(self, n: typing.SupportsIndex) -> builtins.list[_T]:
+        return builtins.list(self) * n
+
+    __rmul__ = __mul__
+
+
+class ListView(list[_T]):
+    """
+    Magic list that reads its items from another list without copying them.
+
+    Views are obtained through `list.view()`. Slicing a view, as well as
+    `tail`, `init`, `take`, `take_right`, `drop`, `drop_right`, `slice`,
+    `partition`, `bisect` and `trisect`, produce other views of the same
+    underlying list, in constant time.
+
+    The items are copied the first time the view is mutated, or when
+    `materialize` is called ; from then on, the view is a regular list that
+    does not depend on the original one anymore.
+
+    .. warning:: The viewed list must not be resized while its views are in \
+        use. Items assigned in place are visible through the views.
+
+    >>> l = L[2, 4, 8, 16, 32]
+    >>> v = l.view().tail
+    >>> v
+    [4, 8, 16, 32]
+    >>> l[1] = 5
+    >>> v
+    [5, 8, 16, 32]
+    >>> v.append(64)
+    >>> l[1] = 6
+    >>> v
+    [5, 8, 16, 32, 64]
+    """
+
+    data: builtins.list[_T] | _Window[_T]  # pyright: ignore[reportIncompatibleVariableOverride]
+
+    def __init__(self, initlist: collections.abc.Iterable[_T] | None = None) -> None:
+        if isinstance(initlist, _Window):
+            self.data = typing.cast("_Window[_T]", initlist)
+        elif isinstance(initlist, ListView) and isinstance(initlist.data, _Window):
+            # windows are immutable, so they can be shared safely
+            self.data = typing.cast("ListView[_T]", initlist).data
+        else:
+            super().__init__(initlist)
+
+    @classmethod
+    def over(cls, sequence: collections.abc.Sequence[_T]) -> ListView[_T]:
+        """
+        Return a view covering the whole `sequence`.
+
+        >>> ListView.over([3, 5, 2])
+        [3, 5, 2]
+        """
+
+        if isinstance(sequence, _Window):
+            return cls(sequence)
+
+        return cls(_Window(sequence, range(len(sequence))))
+
+    @property
+    def is_materialized(self) -> bool:
+        """
+        Whether the view owns a copy of its items.
+
+        >>> v = L[3, 5, 2].view()
+        >>> v.is_materialized
+        False
+        >>> v.materialize()
+        >>> v.is_materialized
+        True
+        """
+
+        return not isinstance(self.data, _Window)
+
+    def materialize(self) -> None:
+        """
+        Copy the items of the view, detaching it from the viewed list.
+
+        This is done automatically before any mutation.
+
+        >>> l = L[3, 5, 2]
+        >>> v = l.view()
+        >>> v.materialize()
+        >>> l[0] = 4
+        >>> v
+        [3, 5, 2]
+        """
+
+        if isinstance(self.data, _Window):
+            self.data = builtins.list(self.data)
+
+    def _owned_data(self) -> builtins.list[_T]:
+        self.materialize()
+
+        return typing.cast("builtins.list[_T]", self.data)
+
+    # *- mutating methods: they all copy the items first -* #
+
+    def __setitem__(self, i: typing.Any, item: typing.Any) -> None:
+        self._owned_data()[i] = item
+
+    def __delitem__(self, i: typing.SupportsIndex | slice) -> None:
+        del self._owned_data()[i]
+
+    def __iadd__(self, other: collections.abc.Iterable[_T]) -> typing_extensions.Self:
+        self.materialize()
+
+        return super().__iadd__(other)
+
+    def __imul__(self, n: int) -> typing_extensions.Self:
+        self.materialize()
+
+        return super().__imul__(n)
+
+    def append(self, item: _T) -> None:
+        self._owned_data().append(item)
+
+    def insert(self, i: int, item: _T) -> None:
+        self._owned_data().insert(i, item)
+
+    def pop(self, i: int = -1) -> _T:
+        return self._owned_data().pop(i)
+
+    def remove(self, item: _T) -> None:
+        self._owned_data().remove(item)
+
+    def clear(self) -> None:
+        # no need to copy the items only to discard them
+        self.data = []
+
+    def reverse(self) -> None:
+        self._owned_data().reverse()
+
+    def sort(self, /, *args: typing.Any, **kwds: typing.Any) -> None:
+        self._owned_data().sort(*args, **kwds)
+
+    def extend(self, other: collections.abc.Iterable[_T]) -> None:
+        self.materialize()
+        super().extend(other)
+
+    def rotate_inplace(self, n: int = 1) -> None:
+        self.materialize()
+        super().rotate_inplace(n)
@@ -3,14 +3,36 @@ from __future__ import annotations
 import collections
 import collections.abc
 import functools
+import itertools
 import operator
 import random
 import typing
 
+from magic_list import _binary
+from magic_list import _files
+from magic_list import _numpy
+from magic_list import _parallel
+from magic_list import _sum
+from magic_list._lazy import LazyList
+
+# the modules of the subclasses import this one, so the methods that build
+# instances of them import these modules when they are called
 if typing.TYPE_CHECKING:  # pragma: no cover
+    import builtins
+    import concurrent.futures
+    import os
+
     import _typeshed
     import typing_extensions
 
+    from magic_list._cached import CachedList
+    from magic_list._indexed import IndexedList
+    from magic_list._paged import PagedList
+    from magic_list._shared import SharedList
+    from magic_list._sorted import SortedList
+    from magic_list._typed import TypedList
+    from magic_list._view import ListView
+
 __all__ = [
     "list",
     "L",
@@ -27,6 +49,46 @@ class list(collections.UserList[_T]):  # noqa: A001, N801
     Drop-in replacement for the built-in `list` type.
     """
 
+    # `UserList` leaves iteration to `Sequence`, which goes through
+    # `__getitem__` for each item, and copies the items twice when slicing
+    # or copying: these go straight to the underlying storage instead
+
+    def __iter__(self) -> collections.abc.Iterator[_T]:
+        return iter(self.data)
+
+    def __reversed__(self) -> collections.abc.Iterator[_T]:
+        return reversed(self.data)
+
+    @typing.overload
+    def __getitem__(self, i: typing.SupportsIndex) -> _T: ...
+    @typing.overload
+    def __getitem__(self, i: slice) -> typing_extensions.Self: ...
+    def __getitem__(
+        self,
+        i: typing.SupportsIndex | slice,
+    ) -> _T | typing_extensions.Self:
+        if isinstance(i, slice):
+            return self._with_data(self.data[i])
+
+        return self.data[i]
+
+    def copy(self) -> typing_extensions.Self:
+        return self.__copy__()
+
+    def _with_data(self, data: typing.Any) -> typing_extensions.Self:
+        # `data` must be a new storage of the same type as `self.data`
+        result = self.__class__.__new__(self.__class__)
+        result.__dict__.update(self.__dict__)
+        result.data = data
+
+        return result
+
+    def _with_items(
+        self,
+        items: collections.abc.Iterable[_T],
+    ) -> typing_extensions.Self:
+        return self.__class__(items)
+
     @property
     def head(self) -> _T:
         """
@@ -44,7 +106,7 @@ class list(collections.UserList[_T]):  # noqa: A001, N801
             msg = "empty list has no head"
             raise TypeError(msg)
 
-        return self[0]
+        return self.data[0]
 
     @property
     def tail(self) -> typing_extensions.Self:
@@ -63,7 +125,7 @@ class list(collections.UserList[_T]):  # noqa: A001, N801
             msg = "empty list has no tail"
             raise TypeError(msg)
 
-        return self.__class__(self[1:])
+        return self[1:]
 
     @property
     def init(self) -> typing_extensions.Self:
@@ -82,7 +144,7 @@ class list(collections.UserList[_T]):  # noqa: A001, N801
             msg = "empty list has no init"
             raise TypeError(msg)
 
-        return self.__class__(self[:-1])
+        return self[:-1]
 
     @property
     def last(self) -> _T:
@@ -101,7 +163,7 @@ class list(collections.UserList[_T]):  # noqa: A001, N801
             msg = "empty list has no last"
             raise TypeError(msg)
 
-        return self[-1]
+        return self.data[-1]
 
     def prepend(self, item: _T) -> None:
         """
@@ -132,16 +194,39 @@ class list(collections.UserList[_T]):  # noqa: A001, N801
         key: collections.abc.Callable[[_T], _typeshed.SupportsRichComparison]
         | None = None,
         reverse: bool = False,
-    ) -> typing_extensions.Self:
+        keep_sorted: bool = False,
+    ) -> typing_extensions.Self | SortedList[_T]:
         """
         Return a sorted version of the list.
 
+        If `keep_sorted` is true, the result is a `SortedList`, which keeps
+        its items sorted as they are added and supports binary search.
+
         >>> L[3, 5, 2].sorted()
         [2, 3, 5]
         >>> list("gala").sorted(key=ord)
         ["a", "a", "g", "l"]
+        >>> L[3, 5, 2].sorted(keep_sorted=True)
+        SortedList([2, 3, 5])
+        >>> L[3, 5, 2].sorted(reverse=True, keep_sorted=True)
+        *- ValueError: a sorted list cannot be kept in reverse order -*
         """
 
+        if keep_sorted:
+            if reverse:
+                msg = "a sorted list cannot be kept in reverse order"
+                raise ValueError(msg)
+
+            from magic_list._sorted import SortedList
+
+            return SortedList(self.data, key=key)
+
+        if key is None:
+            result = _numpy.sorted(self.data, reverse=reverse)
+
+            if result is not None:
+                return self.__class__(result)
+
         return self.__class__(sorted(self, key=key, reverse=reverse))  # pyright: ignore[reportCallIssue, reportArgumentType]
 
     def shuffled(self) -> typing_extensions.Self:
@@ -156,29 +241,349 @@ class list(collections.UserList[_T]):  # noqa: A001, N801
         []
         """
 
+        items = _numpy.shuffled(self.data)
+
+        if items is not None:
+            return self.__class__(items)
+
         result = self.copy()
         random.shuffle(result)
 
         return result
 
-    def map(self, function: collections.abc.Callable[[_T], _U]) -> list[_U]:
+    def lazy(self) -> LazyList[_T]:
+        """
+        Return a lazy version of the list, on which transformations are
+        recorded and fused into a single pass when it gets materialized.
+
+        >>> L[3, 5, 2].lazy().map(lambda n: n * 2).take(2).collect()
+        [6, 10]
+        """
+
+        return LazyList(self)
+
+    def view(self) -> ListView[_T]:
+        """
+        Return a view of the list, which reads the items of the list without
+        copying them.
+
+        Slicing a view, as well as `tail`, `init`, `take`, `take_right`,
+        `drop`, `drop_right`, `slice`, `partition`, `bisect` and `trisect`,
+        return views too. A view only copies its items when it is mutated or
+        when `materialize` is called.
+
+        .. warning:: The list must not be resized while its views are in use.
+
+        >>> l = L[2, 4, 8, 16, 32]
+        >>> l.view().drop(1).take(3)
+        [4, 8, 16]
+        """
+
+        from magic_list._view import ListView
+
+        return ListView.over(self.data)
+
+    def typed(self, typecode: str | None = None) -> TypedList[typing.Any]:
+        """
+        Return a compact copy of the list, whose numbers are stored unboxed
+        in an `array.array` of the given `typecode`.
+
+        If `typecode` is not provided, it is inferred from the items.
+
+        .. warning:: The list must only contain numbers that fit in the typecode.
+
+        >>> L[3, 5, 2].typed()
+        TypedList([3, 5, 2], typecode='q')
+        >>> L[3, 5, 2].typed("d")
+        TypedList([3.0, 5.0, 2.0], typecode='d')
+        >>> L["hello", "world"].typed()
+        *- TypeError: typed list items must be integers or floats -*
+        """
+
+        from magic_list._typed import TypedList
+
+        return TypedList(self.data, typecode)
+
+    def cached(self, maxsize: int | None = 128) -> CachedList[_T]:
+        """
+        Return a copy of the list that memoizes the results of `sorted`,
+        `deduplicate`, `min`, `max`, `sum` and `mean` until it is mutated.
+
+        At most `maxsize` results are kept (no limit if it is `None`).
+
+        >>> l = L[3, 5, 2].cached()
+        >>> l.max() is l.max()
+        True
+        >>> L[3, 5, 2].cached(-1)
+        *- ValueError: the cache size cannot be negative -*
+        """
+
+        from magic_list._cached import CachedList
+
+        return CachedList(self.data, maxsize)
+
+    def indexed(self) -> IndexedList[_T]:
+        """
+        Return a copy of the list that keeps a map from its items to their
+        positions, making `in`, `index`, `count` and `remove` take constant
+        time on average.
+
+        >>> l = L[3, 5, 2].indexed()
+        >>> l.append(5)
+        >>> l.count(5), l.index(2)
+        (2, 2)
+        """
+
+        from magic_list._indexed import IndexedList
+
+        return IndexedList(self.data)
+
+    def paged(
+        self,
+        *,
+        page_size: int = 10_000,
+        cache_size: int = 8,
+        directory: str | os.PathLike[str] | None = None,
+    ) -> PagedList[_T]:
+        """
+        Return a copy of the list that spills its items to disk, in pickled
+        pages of `page_size` items written in a temporary directory (created
+        in `directory`, or in the default one). At most `cache_size` pages
+        are kept in memory, so that the list can grow larger than it.
+
+        >>> l = L[3, 5, 2].paged(page_size=2, cache_size=1)
+        >>> l.append(8)
+        >>> l.map(lambda n: n * 2).take(3)
+        [6, 10, 4]
+        >>> L[3, 5, 2].paged(page_size=0)
+        *- ValueError: the page size must be positive -*
+        """
+
+        from magic_list._paged import PagedList
+
+        return PagedList(self.data, page_size, cache_size, directory)
+
+    def to_bytes(self) -> bytes:
+        """
+        Return the items of the list packed in a compact binary layout,
+        which `from_bytes` reads back.
+
+        .. warning:: The list must only contain `int` (that fit in 64 \
+            bits), only `float` or only `bytes`.
+
+        >>> L[3, 5, 2].to_bytes()
+        b'MLST\\x01q\\x08\\x03\\x00...'
+        >>> L["hello"].to_bytes()
+        *- TypeError: only lists of int, float or bytes can be converted to bytes -*
+        """
+
+        return _binary.to_bytes(self.data)
+
+    @classmethod
+    def from_bytes(cls, data: _typeshed.ReadableBuffer) -> typing_extensions.Self:
+        """
+        Return the list packed in `data` by `to_bytes`.
+
+        >>> list.from_bytes(L[3, 5, 2].to_bytes())
+        [3, 5, 2]
+        >>> list.from_bytes(b"hello")
+        *- ValueError: invalid magic list bytes -*
+        """
+
+        return cls(_binary.from_bytes(data))
+
+    def to_shared(self, name: str | None = None) -> SharedList[typing.Any]:
+        """
+        Return a copy of the list stored in a new shared memory block,
+        which other processes can read without copying it by passing its
+        name to `attach_shared` (or by pickling the result, which only
+        sends the name).
+
+        If `name` is not provided, a unique one is generated. The block must
+        be freed with `unlink` once it is not needed anymore.
+
+        .. warning:: The list must only contain `int` (that fit in 64 \
+            bits) or only `float`.
+
+        >>> shared = L[3, 5, 2].to_shared()
+        >>> list.attach_shared(shared.name).mean()
+        3.3333333333333335
+        >>> L["hello"].to_shared()
+        *- TypeError: only lists of int or float can be shared -*
+        """
+
+        from magic_list import _shared
+
+        return _shared.create(self.data, name)
+
+    @classmethod
+    def attach_shared(
+        cls,
+        name: str,
+        *,
+        writable: bool = False,
+    ) -> SharedList[typing.Any]:
+        """
+        Return the list stored in the shared memory block called `name` by
+        `to_shared`, without copying it.
+
+        If `writable` is true, assigning its items writes in the block, and
+        is visible to every process. Otherwise, assigning them copies the
+        items first, like any mutation (see `ListView`).
+
+        >>> shared = L[3, 5, 2].to_shared()
+        >>> list.attach_shared(shared.name).select([2, 0])
+        [2, 3]
+        """
+
+        from magic_list._shared import SharedList
+
+        return SharedList.attach(name, writable=writable)
+
+    @classmethod
+    def from_lines(
+        cls,
+        path: str | os.PathLike[str],
+        *,
+        parse: collections.abc.Callable[[str], typing.Any] | None = None,
+        encoding: str = "utf-8",
+        lazy: bool = False,
+        buffer_size: int = _files.DEFAULT_BUFFER_SIZE,
+    ) -> typing.Any:
+        """
+        Return the lines of the text file at `path`, without their line
+        terminator. If `parse` is provided, it is applied on each line.
+
+        The file is read in chunks of about `buffer_size` bytes. If `lazy`
+        is true, a lazy list is returned instead, which reads the file again
+        each time it is materialized: `map`, `filter`, `take`, etc. then run
+        over the file while only holding a chunk of it in memory.
+
+        >>> list.from_lines("numbers.txt", parse=int)
+        [3, 5, 2]
+        >>> list.from_lines("access.log", lazy=True).filter(is_error).take(10)
+        LazyList(LineSource('access.log'), stages=2)
+        """
+
+        source = _files.LineSource(path, parse, encoding, buffer_size)
+
+        if lazy:
+            return LazyList(source)
+
+        return cls(source)
+
+    @classmethod
+    def from_csv(  # noqa: PLR0913
+        cls,
+        path: str | os.PathLike[str],
+        *,
+        parse: collections.abc.Callable[[typing.Any], typing.Any] | None = None,
+        header: bool = False,
+        encoding: str = "utf-8",
+        lazy: bool = False,
+        buffer_size: int = _files.DEFAULT_BUFFER_SIZE,
+        **options: typing.Any,
+    ) -> typing.Any:
+        """
+        Return the rows of the CSV file at `path`, as lists of strings. If
+        `header` is true, the first row gives the field names and the rows
+        are dictionaries instead. If `parse` is provided, it is applied on
+        each row. The other keyword arguments are passed to `csv.reader`
+        (e.g. `delimiter`).
+
+        The file is read in chunks of about `buffer_size` bytes. If `lazy`
+        is true, a lazy list is returned instead (see `from_lines`).
+
+        >>> list.from_csv("points.csv", parse=lambda row: (int(row[0]), int(row[1])))
+        [(3, 5), (2, 8)]
+        >>> list.from_csv("points.csv", header=True)
+        [{"x": "3", "y": "5"}, {"x": "2", "y": "8"}]
+        """
+
+        source = _files.CsvSource(
+            path,
+            parse,
+            encoding=encoding,
+            buffer_size=buffer_size,
+            header=header,
+            options=options,
+        )
+
+        if lazy:
+            return LazyList(source)
+
+        return cls(source)
+
+    def map(
+        self,
+        function: collections.abc.Callable[[_T], _U],
+        *,
+        executor: concurrent.futures.Executor | None = None,
+        chunksize: int | None = None,
+        ordered: bool = True,
+    ) -> list[_U]:
         """
         Apply `function` on each item of the list.
 
+        If an `executor` is provided, the items are split in chunks of
+        `chunksize` items (by default, a few chunks per CPU) that are
+        processed concurrently. A `ThreadPoolExecutor` suits functions that
+        wait for I/O, while a `ProcessPoolExecutor` suits CPU-bound ones (the
+        function and the items must then be picklable). If `ordered` is
+        `False`, the chunks are gathered as soon as they are done instead.
+
         >>> L[3, 5, 2].map(str)
         ["3", "5", "2"]
         >>> L[3, 5, 2].map(lambda n: n * 2)
         [6, 10, 4]
         >>> list().map(lambda n: n * 20)
         []
+        >>> with ThreadPoolExecutor() as executor:
+        ...     L[3, 5, 2].map(lambda n: n * 2, executor=executor)
+        [6, 10, 4]
         """
 
         # subclasses' `map` return type is also marked as `list` because we
         # cannot make the container generic -- this requires Higher-Kinded
         # Types, which Python does not support (yet? hopefully!)
 
+        if executor is not None:
+            results = _parallel.map_items(
+                function,
+                self,
+                executor,
+                chunksize,
+                ordered=ordered,
+            )
+
+            return typing.cast("list[_U]", self.__class__(results))
+
         return typing.cast(list[_U], self.__class__(map(function, self)))
 
+    async def amap(
+        self,
+        function: collections.abc.Callable[[_T], collections.abc.Awaitable[_U]],
+        *,
+        concurrency: int | None = None,
+    ) -> list[_U]:
+        """
+        Await the coroutine function `function` on each item of the list.
+
+        At most `concurrency` calls run at the same time (by default, all of
+        them). The results keep the order of the list. If a call fails, the
+        pending ones are cancelled and the exception is propagated.
+
+        >>> async def fetch(n):
+        ...     await asyncio.sleep(0.1)
+        ...     return n * 2
+        >>> await L[3, 5, 2].amap(fetch, concurrency=2)
+        [6, 10, 4]
+        """
+
+        results = await _parallel.gather_bounded(function, self.data, concurrency)
+
+        return typing.cast("list[_U]", self._with_items(results))  # pyright: ignore[reportArgumentType]
+
     def rotate(self, n: int = 1) -> typing_extensions.Self:
         """
         Shift the list `n` times to the right. The items that overflow get prepended.
@@ -201,30 +606,94 @@ class list(collections.UserList[_T]):  # noqa: A001, N801
             msg = "empty list cannot be rotated"
             raise TypeError(msg)
 
-        if n == 0:
-            return self
+        data = self.data
+        shift = n % len(data)
 
-        returned_list = self.copy()
+        if shift == 0:
+            return self.copy()
 
-        if n > 0:
-            xpend_method = returned_list.prepend
-            popped_index = -1
+        return self._with_data(data[-shift:] + data[:-shift])
+
+    def rotate_inplace(self, n: int = 1) -> None:
+        """
+        Shift the list `n` times to the right in place. The items that
+        overflow get prepended.
+
+        If `n` is negative, the shift goes to the left.
+
+        .. warning:: The list must be non-empty.
+
+        >>> l = L[3, 5, 2]
+        >>> l.rotate_inplace()
+        >>> print(l)
+        [2, 3, 5]
+        >>> l.rotate_inplace(-2)
+        >>> print(l)
+        [5, 2, 3]
+        >>> list().rotate_inplace()
+        *- TypeError: empty list cannot be rotated -*
+        """
+
+        if not self:
+            msg = "empty list cannot be rotated"
+            raise TypeError(msg)
+
+        data = self.data
+        split = len(data) - n % len(data)
+
+        # only the smallest side of the list gets copied
+        if split >= len(data) - split:
+            overflow = data[split:]
+            del data[split:]
+            data[:0] = overflow
         else:
-            xpend_method = returned_list.append
-            popped_index = 0
+            overflow = data[:split]
+            del data[:split]
+            data.extend(overflow)
 
-        for _ in range(abs(n)):
-            xpend_method(returned_list.pop(popped_index))
+    def irotate(self, n: int = 1) -> collections.abc.Iterator[_T]:
+        """
+        Return an iterator over the list shifted `n` times to the right,
+        without copying it.
 
-        return returned_list
+        If `n` is negative, the shift goes to the left.
+
+        .. warning:: The list must be non-empty, and must not be resized \
+            while the iterator is in use.
+
+        >>> [*L[3, 5, 2].irotate()]
+        [2, 3, 5]
+        >>> [*L[3, 5, 2].irotate(-1)]
+        [5, 2, 3]
+        >>> list().irotate()
+        *- TypeError: empty list cannot be rotated -*
+        """
+
+        if not self:
+            msg = "empty list cannot be rotated"
+            raise TypeError(msg)
+
+        size = len(self.data)
+        start = size - n % size
+
+        return map(
+            self.data.__getitem__,
+            itertools.chain(range(start, size), range(start)),
+        )
 
     def filter(
         self,
         function: collections.abc.Callable[[_T], bool],
+        *,
+        executor: concurrent.futures.Executor | None = None,
+        chunksize: int | None = None,
+        ordered: bool = True,
     ) -> typing_extensions.Self:
         """
         Discard each item `i` of the list if `function(i)` is `False`.
 
+        `executor`, `chunksize` and `ordered` work the same as with `map`.
+
         >>> L[3, 5, 2].filter(lambda n: n % 2 == 1)
         [3, 5]
         >>> L["hello", "hola", "bonjour"].filter(lambda s: "l" in s)
@@ -233,8 +702,41 @@ class list(collections.UserList[_T]):  # noqa: A001, N801
         []
         """
 
+        if executor is not None:
+            return self.__class__(
+                _parallel.filter_items(
+                    function,
+                    self,
+                    executor,
+                    chunksize,
+                    ordered=ordered,
+                ),
+            )
+
         return self.__class__(filter(function, self))
 
+    async def afilter(
+        self,
+        function: collections.abc.Callable[[_T], collections.abc.Awaitable[bool]],
+        *,
+        concurrency: int | None = None,
+    ) -> typing_extensions.Self:
+        """
+        Discard each item `i` of the list if `await function(i)` is `False`.
+
+        `concurrency` works the same as with `amap`.
+
+        >>> async def is_available(n):
+        ...     await asyncio.sleep(0.1)
+        ...     return n % 2 == 1
+        >>> await L[3, 5, 2].afilter(is_available, concurrency=2)
+        [3, 5]
+        """
+
+        bits = await _parallel.gather_bounded(function, self.data, concurrency)
+
+        return self._with_items(itertools.compress(self.data, bits))
+
     def mask(
         self,
         mask_seq: collections.abc.Sequence[bool],
@@ -260,28 +762,70 @@ class list(collections.UserList[_T]):  # noqa: A001, N801
 
         return self.__class__(item for item, bit in zip(self, mask_seq) if bit)
 
-    def deduplicate(self) -> typing_extensions.Self:
+    def deduplicate(
+        self,
+        *,
+        key: collections.abc.Callable[[_T], typing.Any] | None = None,
+    ) -> typing_extensions.Self:
         """
         Remove duplicate elements from left to right (and keep original ones).
         Return the deduplicated list.
 
+        If `key` is provided, two elements are considered duplicates when
+        their keys are equal.
+
+        Hashable elements (or keys) are tracked in a set, which makes the
+        deduplication linear ; unhashable ones are kept in a list that every
+        element is compared against, which makes it quadratic if there are
+        many of them.
+
         >>> L[3, 0, 0, 1, 18].deduplicate()
         [3, 0, 1, 18]
         >>> L["hello", "hello", "world", "world"].deduplicate()
         ["hello", "world"]
+        >>> L["hello", "hola", "bonjour", "ciao"].deduplicate(key=len)
+        ["hello", "hola", "bonjour"]
+        >>> L[[3, 5], [2], [3, 5]].deduplicate()
+        [[3, 5], [2]]
         >>> list().deduplicate()
         []
         """
 
-        returned_list: typing_extensions.Self = self.__class__()
+        return self.__class__(self._ideduplicate(key))
+
+    def _ideduplicate(
+        self,
+        key: collections.abc.Callable[[_T], typing.Any] | None,
+    ) -> collections.abc.Iterator[_T]:
+        seen: set[typing.Any] = set()
+        seen_unhashable: typing.Any = []
 
         for elem in self:
-            if elem not in returned_list:
-                returned_list.append(elem)
+            marker = elem if key is None else key(elem)
 
-        return returned_list
+            # hashable and unhashable markers can be equal (e.g. a frozenset
+            # and a set), so each kind is also looked up among the other
+            try:
+                if marker in seen or (seen_unhashable and marker in seen_unhashable):
+                    continue
+
+                seen.add(marker)
+            except TypeError:
+                if marker in seen_unhashable or any(other == marker for other in seen):
+                    continue
+
+                seen_unhashable.append(marker)
 
-    def reduce(self, function: collections.abc.Callable[[_T, _T], _T]) -> _T:
+            yield elem
+
+    def reduce(
+        self,
+        function: collections.abc.Callable[[_T, _T], _T],
+        *,
+        associative: bool = False,
+        workers: int | None = None,
+        executor: concurrent.futures.Executor | None = None,
+    ) -> _T:
         """
         "Insert" an operator (called a reducing function) between each item
         from left to right and return the result.
@@ -289,18 +833,38 @@ class list(collections.UserList[_T]):  # noqa: A001, N801
         The first item of the list is used as the leftmost value ;
         therefore, if the list is empty, it will raise an exception.
 
+        If `associative` is `True`, the items are combined pairwise as a
+        balanced tree instead, which gives the same result for associative
+        functions (and more accurate float sums). The list can then be split
+        in chunks reduced in parallel, either by an `executor` or by a pool of
+        `workers` processes (the function and the items must be picklable).
+
         .. warning:: The list must be non-empty.
 
         >>> L[3, 5, 2].reduce(operator.add)  # (3 + 5) + 2
         10
+        >>> L[3, 5, 2, 4].reduce(operator.add, associative=True)  # (3 + 5) + (2 + 4)
+        14
         >>> list().reduce(operator.mul)
         *- TypeError: the list to reduce cannot be empty -*
+        >>> L[3, 5, 2].reduce(operator.add, workers=4)
+        *- ValueError: parallel reduction requires an associative function -*
         """
 
         if not self:
             msg = "the list to reduce cannot be empty"
             raise TypeError(msg)
 
+        _check_reduction_mode(associative, workers, executor)
+
+        if associative:
+            return _parallel.reduce_items(
+                function,
+                self,
+                workers=workers,
+                executor=executor,
+            )
+
         return functools.reduce(function, self)
 
     def reduce_right(
@@ -334,6 +898,10 @@ class list(collections.UserList[_T]):  # noqa: A001, N801
         self,
         function: collections.abc.Callable[[_T, _T], _T],
         initial_value: _T,
+        *,
+        associative: bool = False,
+        workers: int | None = None,
+        executor: concurrent.futures.Executor | None = None,
     ) -> _T:
         """
         "Insert" an operator (called a reducing function) between each item
@@ -342,12 +910,28 @@ class list(collections.UserList[_T]):  # noqa: A001, N801
         The `initial_value` is used as the leftmost value, and is the returned
         value if the list is empty.
 
+        `associative`, `workers` and `executor` work the same as with
+        `reduce`.
+
         >>> L[3, 5, 2].fold(operator.add, -3)  # ((-3 + 3) + 5) + 2
         7
         >>> list().fold(operator.mul, 0)
         0
         """
 
+        _check_reduction_mode(associative, workers, executor)
+
+        if associative and self:
+            return function(
+                initial_value,
+                _parallel.reduce_items(
+                    function,
+                    self,
+                    workers=workers,
+                    executor=executor,
+                ),
+            )
+
         return functools.reduce(function, self, initial_value)
 
     def fold_right(
@@ -394,18 +978,7 @@ class list(collections.UserList[_T]):  # noqa: A001, N801
         [0]
         """
 
-        result_tail = self.__class__()
-
-        if self:
-            head, *tail = self
-            result_tail.extend(
-                self.__class__(tail).scan(
-                    function,
-                    function(initial_value, head),
-                ),
-            )
-
-        return self.__class__([initial_value]) + result_tail
+        return self.__class__(self.iscan(function, initial_value))
 
     def scan_right(
         self,
@@ -427,7 +1000,45 @@ class list(collections.UserList[_T]):  # noqa: A001, N801
         [0]
         """
 
-        return self.reversed().scan(lambda a, b: function(b, a), initial_value)
+        return self.__class__(self.iscan_right(function, initial_value))
+
+    def iscan(
+        self,
+        function: collections.abc.Callable[[_T, _T], _T],
+        initial_value: _T,
+    ) -> collections.abc.Iterator[_T]:
+        """
+        Lazy version of `scan`: return an iterator over the intermediate
+        values followed by the result, computed as they are consumed.
+
+        >>> it = L[3, 5, 2].iscan(operator.add, 0)
+        >>> next(it), next(it)
+        (0, 3)
+        >>> [*it]
+        [8, 10]
+        """
+
+        return itertools.accumulate(self, function, initial=initial_value)
+
+    def iscan_right(
+        self,
+        function: collections.abc.Callable[[_T, _T], _T],
+        initial_value: _T,
+    ) -> collections.abc.Iterator[_T]:
+        """
+        Lazy version of `scan_right`: return an iterator over the
+        intermediate values followed by the result, computed as they are
+        consumed.
+
+        >>> [*L[3, 5, 2].iscan_right(operator.add, 0)]
+        [0, 2, 7, 10]
+        """
+
+        return itertools.accumulate(
+            self.__reversed__(),
+            lambda a, b: function(b, a),
+            initial=initial_value,
+        )
 
     def merge(
         self,
@@ -458,15 +1069,29 @@ class list(collections.UserList[_T]):  # noqa: A001, N801
             self.__class__(function(a, b) for a, b in zip(self, other)),
         )
 
-    def flatten(self, *, _base: list[typing.Any] | None = None) -> list[typing.Any]:
+    def flatten(
+        self,
+        *,
+        depth: int | None = None,
+        atomic_types: tuple[type, ...] = (str, bytes),
+    ) -> list[typing.Any]:
         """
         Flatten the contents to a 1-dimension list. If the list contains
         itself, it cannot be flattened and a `ValueError` is raised.
 
-        .. warning:: The list cannot contain recursive elements.
+        If `depth` is provided, only that many levels of nesting are
+        flattened. Instances of `atomic_types` are never flattened, even if
+        they are iterable (by default, strings and bytes).
+
+        .. warning:: The list cannot contain recursive elements, and `depth` \
+            must be non-negative.
 
         >>> L[[3, 5, 2], [8, 4, 1], [7, 6, 9]].flatten()
         [3, 5, 2, 8, 4, 1, 7, 6, 9]
+        >>> L[[3, [5, [2]]], "hello"].flatten(depth=1)
+        [3, [5, [2]], "hello"]
+        >>> L[[3, (5, 2)], [8]].flatten(atomic_types=(tuple,))
+        [3, (5, 2), 8]
         >>> list().flatten()
         []
         >>> l = list()
@@ -475,54 +1100,120 @@ class list(collections.UserList[_T]):  # noqa: A001, N801
         *- ValueError: cannot flatten list because it contains recursive elements -*
         """
 
-        err = ValueError("cannot flatten list because it contains recursive elements")
+        return list(self.iflatten(depth=depth, atomic_types=atomic_types))
 
-        result: list[typing.Any] = list()
+    def iflatten(
+        self,
+        *,
+        depth: int | None = None,
+        atomic_types: tuple[type, ...] = (str, bytes),
+    ) -> collections.abc.Iterator[typing.Any]:
+        """
+        Lazy version of `flatten`: return an iterator over the items of the
+        flattened list, found as they are consumed.
 
-        for item in self:
-            if item is self or item is _base:
-                raise err
+        The nested iterables are walked with an explicit stack, so the
+        nesting is not limited by the recursion limit.
 
-            base = self if _base is None else _base
+        >>> it = L[[3, [5]], [2]].iflatten()
+        >>> next(it)
+        3
+        >>> [*it]
+        [5, 2]
+        >>> [*L[[3, 5], 2].iflatten(depth=-1)]
+        *- ValueError: the flattening depth cannot be negative -*
+        """
 
-            if isinstance(item, list):
-                result.extend(item.flatten(_base=base))
-            elif isinstance(item, collections.abc.Iterable):
-                try:
-                    result.extend(
-                        list(
-                            typing.cast(collections.abc.Iterable[typing.Any], item),
-                        ).flatten(_base=base),
-                    )
-                except RecursionError:
-                    # a bit dirty but I can't think of any other solution 😅
-                    raise err from None
-            else:
-                result.append(item)
+        if depth is not None and depth < 0:
+            msg = "the flattening depth cannot be negative"
+            raise ValueError(msg)
 
-        return result
+        return _iflatten(self, depth, atomic_types)
 
-    def sum(self) -> _T:
+    def sum(
+        self,
+        *,
+        start: _T = _sum.NO_START,
+        strategy: _sum.Strategy | None = None,
+        associative: bool = False,
+        workers: int | None = None,
+        executor: concurrent.futures.Executor | None = None,
+    ) -> _T:
         """
         Return the sum of the list. The elements must support addition,
         otherwise an exception is raised.
 
+        If `start` is provided, it is added before the items, and returned if
+        the list is empty.
+
+        The way the items are added depends on their type, unless a
+        `strategy` is provided:
+        - `"join"` (strings and bytes) concatenates them at once ;
+        - `"chain"` (lists and tuples) concatenates them at once ;
+        - `"fsum"` (floats) uses `math.fsum`, which avoids rounding errors ;
+        - `"builtin"` (lists that start with an integer) uses the built-in
+          `sum` ;
+        - `"reduce"` (anything else) adds the items one by one.
+
+        `associative`, `workers` and `executor` work the same as with
+        `reduce`, and imply the `"reduce"` strategy.
+
         .. warning:: The list must contain values that support the `+` \
-            operator, and be non-empty.
+            operator, and be non-empty if there is no `start`.
 
         >>> L[3, 5, 2].sum()
         10
         >>> L["hello", "world"].sum()
         "helloworld"
+        >>> (L[0.1] * 10).sum()
+        1.0
+        >>> L[[3], [5, 2]].sum(start=[0])
+        [0, 3, 5, 2]
+        >>> list().sum(start=0)
+        0
         >>> list().sum()
         *- TypeError: cannot perform summation on an empty list -*
+        >>> L[3, 5, 2].sum(strategy="magic")
+        *- ValueError: unknown summation strategy 'magic' -*
         """
 
+        if strategy is not None and strategy not in _sum.STRATEGIES:
+            msg = f"unknown summation strategy {strategy!r}"
+            raise ValueError(msg)
+
         if not self:
+            if start is not _sum.NO_START:
+                return start
+
             msg = "cannot perform summation on an empty list"
             raise TypeError(msg)
 
-        return self.reduce(operator.add)
+        if associative or workers is not None or executor is not None:
+            if strategy not in {None, "reduce"}:
+                msg = f"the {strategy!r} strategy cannot be parallelized"
+                raise ValueError(msg)
+
+            if start is _sum.NO_START:
+                return self.reduce(
+                    operator.add,
+                    associative=associative,
+                    workers=workers,
+                    executor=executor,
+                )
+
+            return self.fold(
+                operator.add,
+                start,
+                associative=associative,
+                workers=workers,
+                executor=executor,
+            )
+
+        return _sum.sum_items(
+            self.data,
+            strategy or _sum.detect_strategy(self.data),
+            start,
+        )
 
     def mean(self: list[int] | list[float] | list[complex]) -> float | complex:
         """
@@ -542,13 +1233,13 @@ class list(collections.UserList[_T]):  # noqa: A001, N801
             msg = "cannot calculate mean of empty list"
             raise TypeError(msg)
 
-        if not hasattr(self[0], "__truediv__"):
-            msg = f"cannot calculate mean of list of {self[0].__class__.__name__}"
+        if not hasattr(self.data[0], "__truediv__"):
+            msg = f"cannot calculate mean of list of {self.data[0].__class__.__name__}"
             raise TypeError(
                 msg,
             )
 
-        return sum(self) / len(self)
+        return sum(self.data) / len(self.data)
 
     def min(self: list[int] | list[float]) -> int | float:
         """
@@ -627,8 +1318,13 @@ class list(collections.UserList[_T]):  # noqa: A001, N801
 
         returned_list = self.copy()
 
+        if not callable(filler):
+            returned_list[:0] = itertools.repeat(filler, n)
+
+            return returned_list
+
         for _ in range(n):
-            returned_list.prepend(filler(returned_list) if callable(filler) else filler)
+            returned_list.prepend(filler(returned_list))
 
         return returned_list
 
@@ -661,8 +1357,13 @@ class list(collections.UserList[_T]):  # noqa: A001, N801
 
         returned_list = self.copy()
 
+        if not callable(filler):
+            returned_list.extend(itertools.repeat(filler, n))
+
+            return returned_list
+
         for _ in range(n):
-            returned_list.append(filler(returned_list) if callable(filler) else filler)
+            returned_list.append(filler(returned_list))
 
         return returned_list
 
@@ -692,15 +1393,14 @@ class list(collections.UserList[_T]):  # noqa: A001, N801
             msg = "list has no gap to be filled"
             raise ValueError(msg)
 
-        returned_list = self.__class__([self.head])
+        data = self.data
+        items = [data[0]]
 
-        for i in range(1, len(self)):
-            returned_list.append(
-                filler(self[i - 1], self[i]) if callable(filler) else filler,
-            )
-            returned_list.append(self[i])
+        for previous, item in zip(data, itertools.islice(data, 1, None)):
+            items.append(filler(previous, item) if callable(filler) else filler)
+            items.append(item)
 
-        return returned_list
+        return self._with_items(items)
 
     gap_fill = interleave
     """
@@ -727,16 +1427,18 @@ class list(collections.UserList[_T]):  # noqa: A001, N801
         *- IndexError: index 4 is out of bounds -*
         """
 
-        returned_list = self.__class__()
+        data = self.data
+        size = len(data)
+        items: builtins.list[_T] = []
 
         for index in indexes:
-            if index >= len(self) or index < -len(self):
+            if index >= size or index < -size:
                 msg = f"index {index} is out of bounds"
                 raise IndexError(msg)
 
-            returned_list.append(self[index])
+            items.append(data[index])
 
-        return returned_list
+        return self._with_items(items)
 
     def take(self, n: int) -> typing_extensions.Self:
         """
@@ -762,7 +1464,7 @@ class list(collections.UserList[_T]):  # noqa: A001, N801
             msg = "cannot take more items than the list contains"
             raise ValueError(msg)
 
-        return self.__class__(self[i] for i in range(n))
+        return self[:n]
 
     def take_right(self, n: int) -> typing_extensions.Self:
         """
@@ -790,7 +1492,7 @@ class list(collections.UserList[_T]):  # noqa: A001, N801
             msg = "cannot take more items than the list contains"
             raise ValueError(msg)
 
-        return self.__class__(item for item in self[len(self) - n :])
+        return self[len(self) - n :]
 
     def drop(self, n: int) -> typing_extensions.Self:
         """
@@ -816,7 +1518,7 @@ class list(collections.UserList[_T]):  # noqa: A001, N801
             msg = "cannot drop more items than the list contains"
             raise ValueError(msg)
 
-        return self.__class__(self[n:])
+        return self[n:]
 
     def drop_right(self, n: int) -> typing_extensions.Self:
         """
@@ -842,7 +1544,7 @@ class list(collections.UserList[_T]):  # noqa: A001, N801
             msg = "cannot drop more items than the list contains"
             raise ValueError(msg)
 
-        return self.__class__(self[: len(self) - n])
+        return self[: len(self) - n]
 
     def slice(self, start: int, stop: int) -> typing_extensions.Self:
         """
@@ -880,7 +1582,7 @@ class list(collections.UserList[_T]):  # noqa: A001, N801
             msg = "slice out of bounds"
             raise ValueError(msg)
 
-        return self.__class__(self[start : stop + 1])
+        return self[start : stop + 1]
 
     def partition(
         self,
@@ -973,15 +1675,166 @@ class list(collections.UserList[_T]):  # noqa: A001, N801
 
         return self.take(_left), self[_left:_right], self.drop(_right)
 
+    def chunks(self, n: int) -> collections.abc.Iterator[ListView[_T]]:
+        """
+        Return an iterator over consecutive chunks of `n` items of the list
+        (the last one may be shorter).
+
+        The chunks are views of the list, produced lazily: they do not copy
+        the items (see `view`).
+
+        .. warning:: `n` must be positive.
+
+        >>> [*L[3, 5, 2, 8, 13].chunks(2)]
+        [[3, 5], [2, 8], [13]]
+        >>> L[3, 5, 2].chunks(0)
+        *- ValueError: the chunk size must be positive -*
+        """
+
+        if n <= 0:
+            msg = "the chunk size must be positive"
+            raise ValueError(msg)
+
+        view = self.view()
+
+        return (view[start : start + n] for start in range(0, len(view), n))
+
+    def windows(
+        self,
+        size: int,
+        step: int = 1,
+    ) -> collections.abc.Iterator[ListView[_T]]:
+        """
+        Return an iterator over the windows of `size` consecutive items of
+        the list, each one starting `step` items after the previous one.
+        There are none if the list is shorter than `size`.
+
+        The windows are views of the list, produced lazily: they do not copy
+        the items (see `view`).
+
+        .. warning:: `size` and `step` must be positive.
+
+        >>> [*L[3, 5, 2, 8].windows(2)]
+        [[3, 5], [5, 2], [2, 8]]
+        >>> [*L[3, 5, 2, 8, 13].windows(3, step=2)]
+        [[3, 5, 2], [2, 8, 13]]
+        >>> L[3, 5, 2].windows(2, step=0)
+        *- ValueError: the window step must be positive -*
+        """
+
+        if size <= 0:
+            msg = "the window size must be positive"
+            raise ValueError(msg)
+
+        if step <= 0:
+            msg = "the window step must be positive"
+            raise ValueError(msg)
+
+        view = self.view()
+
+        return (
+            view[start : start + size] for start in range(0, len(view) - size + 1, step)
+        )
+
+    def split_even(self, k: int) -> collections.abc.Iterator[ListView[_T]]:
+        """
+        Return an iterator over `k` consecutive parts of the list whose
+        lengths differ by at most one, the longest ones first.
+
+        The parts are views of the list, produced lazily: they do not copy
+        the items (see `view`).
+
+        .. warning:: `k` must be positive.
+
+        >>> [*L[3, 5, 2, 8, 13].split_even(3)]
+        [[3, 5], [2, 8], [13]]
+        >>> [*L[3, 5].split_even(3)]
+        [[3], [5], []]
+        >>> L[3, 5, 2].split_even(0)
+        *- ValueError: the number of parts must be positive -*
+        """
+
+        if k <= 0:
+            msg = "the number of parts must be positive"
+            raise ValueError(msg)
+
+        view = self.view()
+        size, remainder = divmod(len(view), k)
+
+        return (
+            view[i * size + min(i, remainder) : (i + 1) * size + min(i + 1, remainder)]
+            for i in range(k)
+        )
+
 
 class _ListBuilder:
     def __getitem__(self, key: _T | slice | tuple[_T, ...], /) -> list[_T] | list[int]:
         if isinstance(key, slice) and _is_range_slice(key):
-            return list(range(key.start or 0, key.stop, key.step or 1))
+            from magic_list._range import RangeList
+
+            return RangeList(range(key.start or 0, key.stop, key.step or 1))
 
         return list(typing.cast(tuple[_T], key if isinstance(key, tuple) else (key,)))
 
 
+def _check_reduction_mode(
+    associative: bool,  # noqa: FBT001
+    workers: int | None,
+    executor: concurrent.futures.Executor | None,
+) -> None:
+    if not associative and (workers is not None or executor is not None):
+        msg = "parallel reduction requires an associative function"
+        raise ValueError(msg)
+
+
+def _iflatten(
+    items: collections.abc.Iterable[typing.Any],
+    depth: int | None,
+    atomic_types: tuple[type, ...],
+) -> collections.abc.Iterator[typing.Any]:
+    # whether items of a given type are leaves, cached because there can be
+    # millions of them
+    is_leaf: dict[type, bool] = {}
+    max_depth = -1 if depth is None else depth
+
+    # `iterators[i]` walks the container `containers[i]`, whose identity is
+    # in `seen` as long as it is being walked
+    iterators = [iter(items)]
+    containers = [id(items)]
+    seen = {id(items)}
+
+    while iterators:
+        for item in iterators[-1]:
+            leaf = is_leaf.get(type(item))
+
+            if leaf is None:
+                leaf = is_leaf[type(item)] = issubclass(
+                    type(item),
+                    atomic_types,
+                ) or not issubclass(type(item), collections.abc.Iterable)
+
+            if (
+                leaf
+                or len(iterators) == max_depth + 1
+                # a character iterates over itself, it cannot be flattened
+                or (isinstance(item, str) and len(item) == 1)
+            ):
+                yield item
+                continue
+
+            if id(item) in seen:
+                msg = "cannot flatten list because it contains recursive elements"
+                raise ValueError(msg)
+
+            iterators.append(iter(item))
+            containers.append(id(item))
+            seen.add(id(item))
+            break
+        else:
+            iterators.pop()
+            seen.discard(containers.pop())
+
+
 def _is_range_slice(value: typing.Any, /) -> bool:
     return (
         isinstance(value, slice)
@@ -3,7 +3,9 @@
 Stub file for the module.
 """
 
+import builtins as _builtins
 import collections
+import concurrent.futures
 import sys
 import typing
 
@@ -11,12 +13,28 @@ import _collections_abc
 import _typeshed
 import typing_extensions
 
+from magic_list._cached import CachedList
+from magic_list._indexed import IndexedList
+from magic_list._lazy import LazyList
+from magic_list._paged import PagedList
+from magic_list._range import RangeList
+from magic_list._shared import SharedList
+from magic_list._sorted import SortedList
+from magic_list._typed import TypedList
+from magic_list._view import ListView
+
 __all__ = [
     "list",
     "L",
 ]
 
 class list[_T](collections.UserList[_T]):  # noqa: A001, N801
+    def __iter__(self) -> _collections_abc.Iterator[_T]: ...
+    def __reversed__(self) -> _collections_abc.Iterator[_T]: ...
+    @typing.overload
+    def __getitem__(self, i: typing.SupportsIndex) -> _T: ...
+    @typing.overload
+    def __getitem__(self, i: slice) -> typing_extensions.Self: ...
     @property
     def head(self) -> _T: ...
     @property
@@ -33,6 +51,7 @@ class list[_T](collections.UserList[_T]):  # noqa: A001, N801
         *,
         key: None = None,
         reverse: bool = False,
+        keep_sorted: typing.Literal[False] = False,
     ) -> list[_typeshed.SupportsRichComparisonT]: ...
     @typing.overload
     def sorted(
@@ -40,32 +59,222 @@ class list[_T](collections.UserList[_T]):  # noqa: A001, N801
         *,
         key: _collections_abc.Callable[[_T], _typeshed.SupportsRichComparison],
         reverse: bool = False,
+        keep_sorted: typing.Literal[False] = False,
     ) -> typing_extensions.Self: ...
+    @typing.overload
+    def sorted(
+        self,
+        *,
+        key: _collections_abc.Callable[[_T], _typeshed.SupportsRichComparison]
+        | None = None,
+        reverse: typing.Literal[False] = False,
+        keep_sorted: typing.Literal[True],
+    ) -> SortedList[_T]: ...
     def shuffled(self) -> typing_extensions.Self: ...
+    def lazy(self) -> LazyList[_T]: ...
+    def view(self) -> ListView[_T]: ...
+    @typing.overload
+    def typed(self: list[int], typecode: str | None = None) -> TypedList[int]: ...
+    @typing.overload
+    def typed(self: list[float], typecode: str | None = None) -> TypedList[float]: ...
+    @typing.overload
+    def typed(self, typecode: str | None = None) -> typing_extensions.Never: ...
+    def cached(self, maxsize: int | None = 128) -> CachedList[_T]: ...
+    def indexed(self) -> IndexedList[_T]: ...
+    def paged(
+        self,
+        *,
+        page_size: int = 10_000,
+        cache_size: int = 8,
+        directory: _typeshed.StrPath | None = None,
+    ) -> PagedList[_T]: ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: _typeshed.ReadableBuffer) -> typing_extensions.Self: ...
+    def to_shared(
+        self: list[int] | list[float],
+        name: str | None = None,
+    ) -> SharedList[typing.Any]: ...
+    @classmethod
+    def attach_shared(
+        cls,
+        name: str,
+        *,
+        writable: bool = False,
+    ) -> SharedList[typing.Any]: ...
+    @typing.overload
+    @classmethod
+    def from_lines(
+        cls,
+        path: _typeshed.StrPath,
+        *,
+        parse: None = None,
+        encoding: str = "utf-8",
+        lazy: typing.Literal[False] = False,
+        buffer_size: int = ...,
+    ) -> list[str]: ...
+    @typing.overload
+    @classmethod
+    def from_lines[_U](
+        cls,
+        path: _typeshed.StrPath,
+        *,
+        parse: _collections_abc.Callable[[str], _U],
+        encoding: str = "utf-8",
+        lazy: typing.Literal[False] = False,
+        buffer_size: int = ...,
+    ) -> list[_U]: ...
+    @typing.overload
+    @classmethod
+    def from_lines(
+        cls,
+        path: _typeshed.StrPath,
+        *,
+        parse: None = None,
+        encoding: str = "utf-8",
+        lazy: typing.Literal[True],
+        buffer_size: int = ...,
+    ) -> LazyList[str]: ...
+    @typing.overload
+    @classmethod
+    def from_lines[_U](
+        cls,
+        path: _typeshed.StrPath,
+        *,
+        parse: _collections_abc.Callable[[str], _U],
+        encoding: str = "utf-8",
+        lazy: typing.Literal[True],
+        buffer_size: int = ...,
+    ) -> LazyList[_U]: ...
+    @typing.overload
+    @classmethod
+    def from_csv(
+        cls,
+        path: _typeshed.StrPath,
+        *,
+        parse: None = None,
+        header: typing.Literal[False] = False,
+        encoding: str = "utf-8",
+        lazy: typing.Literal[False] = False,
+        buffer_size: int = ...,
+        **options: typing.Any,
+    ) -> list[_builtins.list[str]]: ...
+    @typing.overload
+    @classmethod
+    def from_csv(
+        cls,
+        path: _typeshed.StrPath,
+        *,
+        parse: None = None,
+        header: typing.Literal[True],
+        encoding: str = "utf-8",
+        lazy: typing.Literal[False] = False,
+        buffer_size: int = ...,
+        **options: typing.Any,
+    ) -> list[dict[str, str]]: ...
+    @typing.overload
+    @classmethod
+    def from_csv[_U](
+        cls,
+        path: _typeshed.StrPath,
+        *,
+        parse: _collections_abc.Callable[[typing.Any], _U],
+        header: bool = False,
+        encoding: str = "utf-8",
+        lazy: typing.Literal[False] = False,
+        buffer_size: int = ...,
+        **options: typing.Any,
+    ) -> list[_U]: ...
+    @typing.overload
+    @classmethod
+    def from_csv(
+        cls,
+        path: _typeshed.StrPath,
+        *,
+        parse: None = None,
+        header: bool = False,
+        encoding: str = "utf-8",
+        lazy: typing.Literal[True],
+        buffer_size: int = ...,
+        **options: typing.Any,
+    ) -> LazyList[typing.Any]: ...
+    @typing.overload
+    @classmethod
+    def from_csv[_U](
+        cls,
+        path: _typeshed.StrPath,
+        *,
+        parse: _collections_abc.Callable[[typing.Any], _U],
+        header: bool = False,
+        encoding: str = "utf-8",
+        lazy: typing.Literal[True],
+        buffer_size: int = ...,
+        **options: typing.Any,
+    ) -> LazyList[_U]: ...
     # subclasses' `map` return type is also marked as `list` because we cannot make
     # the container generic -- this requires Higher-Kinded Types, which Python does
     # not support (yet? hopefully!)
-    def map[_U](self, function: _collections_abc.Callable[[_T], _U]) -> list[_U]: ...
+    def map[_U](
+        self,
+        function: _collections_abc.Callable[[_T], _U],
+        *,
+        executor: concurrent.futures.Executor | None = None,
+        chunksize: int | None = None,
+        ordered: bool = True,
+    ) -> list[_U]: ...
+    async def amap[_U](
+        self,
+        function: _collections_abc.Callable[[_T], _collections_abc.Awaitable[_U]],
+        *,
+        concurrency: int | None = None,
+    ) -> list[_U]: ...
     @typing.overload
     def rotate(self) -> typing_extensions.Self: ...
     @typing.overload
     def rotate(self, n: int = 1) -> typing_extensions.Self: ...
+    def rotate_inplace(self, n: int = 1) -> None: ...
+    def irotate(self, n: int = 1) -> _collections_abc.Iterator[_T]: ...
     # *- filter-like HOFs -* #
     def filter(
         self,
         function: _collections_abc.Callable[[_T], bool],
+        *,
+        executor: concurrent.futures.Executor | None = None,
+        chunksize: int | None = None,
+        ordered: bool = True,
+    ) -> typing_extensions.Self: ...
+    async def afilter(
+        self,
+        function: _collections_abc.Callable[[_T], _collections_abc.Awaitable[bool]],
+        *,
+        concurrency: int | None = None,
     ) -> typing_extensions.Self: ...
     def mask(
         self, mask_seq: _collections_abc.Sequence[bool]
     ) -> typing_extensions.Self: ...
-    def deduplicate(self) -> typing_extensions.Self: ...
+    def deduplicate(
+        self,
+        *,
+        key: _collections_abc.Callable[[_T], typing.Any] | None = None,
+    ) -> typing_extensions.Self: ...
     # *- reduction-based HOFs -* #
-    def reduce(self, function: _collections_abc.Callable[[_T, _T], _T]) -> _T: ...
+    def reduce(
+        self,
+        function: _collections_abc.Callable[[_T, _T], _T],
+        *,
+        associative: bool = False,
+        workers: int | None = None,
+        executor: concurrent.futures.Executor | None = None,
+    ) -> _T: ...
     def reduce_right(self, function: _collections_abc.Callable[[_T, _T], _T]) -> _T: ...
     def fold(
         self,
         function: _collections_abc.Callable[[_T, _T], _T],
         initial_value: _T,
+        *,
+        associative: bool = False,
+        workers: int | None = None,
+        executor: concurrent.futures.Executor | None = None,
     ) -> _T: ...
     def fold_right(
         self,
@@ -82,13 +291,43 @@ class list[_T](collections.UserList[_T]):  # noqa: A001, N801
         function: _collections_abc.Callable[[_T, _T], _T],
         initial_value: _T,
     ) -> typing_extensions.Self: ...
+    def iscan(
+        self,
+        function: _collections_abc.Callable[[_T, _T], _T],
+        initial_value: _T,
+    ) -> _collections_abc.Iterator[_T]: ...
+    def iscan_right(
+        self,
+        function: _collections_abc.Callable[[_T, _T], _T],
+        initial_value: _T,
+    ) -> _collections_abc.Iterator[_T]: ...
     def merge[_U, _V](
         self,
         function: _collections_abc.Callable[[_T, _U], _V],
         other: _collections_abc.Sequence[_U],
     ) -> list[_V]: ...
-    def flatten(self) -> list[typing.Any]: ...
-    def sum(self) -> _T: ...
+    def flatten(
+        self,
+        *,
+        depth: int | None = None,
+        atomic_types: tuple[type, ...] = ...,
+    ) -> list[typing.Any]: ...
+    def iflatten(
+        self,
+        *,
+        depth: int | None = None,
+        atomic_types: tuple[type, ...] = ...,
+    ) -> _collections_abc.Iterator[typing.Any]: ...
+    def sum(
+        self,
+        *,
+        start: _T = ...,
+        strategy: typing.Literal["join", "chain", "fsum", "builtin", "reduce"]
+        | None = None,
+        associative: bool = False,
+        workers: int | None = None,
+        executor: concurrent.futures.Executor | None = None,
+    ) -> _T: ...
     @typing.overload
     def mean(self: list[int]) -> float: ...
     @typing.overload
@@ -161,6 +400,13 @@ class list[_T](collections.UserList[_T]):  # noqa: A001, N801
     ) -> tuple[
         typing_extensions.Self, typing_extensions.Self, typing_extensions.Self
     ]: ...
+    def chunks(self, n: int) -> _collections_abc.Iterator[ListView[_T]]: ...
+    def windows(
+        self,
+        size: int,
+        step: int = 1,
+    ) -> _collections_abc.Iterator[ListView[_T]]: ...
+    def split_even(self, k: int) -> _collections_abc.Iterator[ListView[_T]]: ...
 
     # *- pre-existing methods (added for documentation) -*
 
@@ -330,7 +576,7 @@ class list[_T](collections.UserList[_T]):  # noqa: A001, N801
 @typing.final
 class _ListBuilder:
     @typing.overload
-    def __getitem__(self, key: slice, /) -> list[int]: ...
+    def __getitem__(self, key: slice, /) -> RangeList: ...
     @typing.overload
     def __getitem__[_T](self, key: _T | slice | tuple[_T, ...], /) -> list[_T]: ...
 
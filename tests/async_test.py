@@ -0,0 +1,160 @@
+# type: ignore
+
+import asyncio
+
+import pytest
+
+from magic_list import L
+from magic_list import PagedList
+from magic_list import SortedList
+from magic_list import TypedList
+from magic_list import deque
+from magic_list import list
+
+
+async def async_double(n):
+    await asyncio.sleep(0)
+    return n * 2
+
+
+async def async_half(n):
+    await asyncio.sleep(0)
+    return n / 2
+
+
+async def async_is_odd(n):
+    await asyncio.sleep(0)
+    return n % 2 == 1
+
+
+@pytest.mark.parametrize("concurrency", [None, 1, 3, 1000])
+def test_amap_ok(concurrency):
+    items = list(range(50))
+    mapped = asyncio.run(items.amap(async_double, concurrency=concurrency))
+
+    assert mapped == items.map(lambda n: n * 2)
+    assert type(mapped) is list
+
+
+@pytest.mark.parametrize("concurrency", [None, 1, 3, 1000])
+def test_afilter_ok(concurrency):
+    items = list(range(50))
+    filtered = asyncio.run(items.afilter(async_is_odd, concurrency=concurrency))
+
+    assert filtered == items.filter(lambda n: n % 2 == 1)
+    assert type(filtered) is list
+
+
+def test_empty():
+    assert asyncio.run(list().amap(async_double)) == list()
+    assert asyncio.run(list().afilter(async_is_odd)) == list()
+
+
+def test_order_is_preserved():
+    async def sleepy(n):
+        # later items complete first
+        await asyncio.sleep(0.001 * (10 - n))
+        return n
+
+    assert asyncio.run(list(range(10)).amap(sleepy)) == list(range(10))
+
+
+@pytest.mark.parametrize("concurrency", [1, 4, 16])
+def test_concurrency_is_bounded(concurrency):
+    running = 0
+    peak = 0
+
+    async def track(n):
+        nonlocal running, peak
+
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+
+        return n
+
+    asyncio.run(list(range(40)).amap(track, concurrency=concurrency))
+
+    assert peak == concurrency
+
+
+def test_failure_cancels_others():
+    started = []
+    cancelled = []
+
+    async def fail(n):
+        started.append(n)
+
+        if n == 0:
+            msg = "boom"
+            raise RuntimeError(msg)
+
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(n)
+            raise
+
+    with pytest.raises(RuntimeError, match="boom"):
+        asyncio.run(list(range(100)).amap(fail, concurrency=4))
+
+    assert started == [0, 1, 2, 3]
+    assert cancelled == [1, 2, 3]
+
+
+def test_outer_cancellation():
+    cancelled = []
+
+    async def wait(n):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(n)
+            raise
+
+    async def main():
+        task = asyncio.ensure_future(list(range(3)).amap(wait))
+        await asyncio.sleep(0.01)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+
+    assert sorted(cancelled) == [0, 1, 2]
+
+
+@pytest.mark.parametrize(
+    ["build", "result"],
+    [
+        [lambda: deque((3, 5, 20)).amap(async_double), deque((6, 10, 40))],
+        [lambda: TypedList((3, 5, 20), "i").amap(async_double), TypedList((6, 10, 40))],
+        [lambda: TypedList((3, 5, 20), "i").afilter(async_is_odd), TypedList((3, 5))],
+        [lambda: TypedList((3, 5, 20)).amap(async_half), TypedList((1.5, 2.5, 10.0))],
+        [lambda: TypedList((3, 5)).amap(async_is_odd), list((True, True))],
+        [
+            lambda: L[20, 3, 5].sorted(keep_sorted=True).afilter(async_is_odd),
+            SortedList((3, 5)),
+        ],
+        [
+            lambda: L[20, 3, 5].sorted(keep_sorted=True).amap(async_double),
+            list((6, 10, 40)),
+        ],
+        [
+            lambda: L[3, 5, 20].paged(page_size=2).afilter(async_is_odd),
+            PagedList((3, 5)),
+        ],
+    ],
+)
+def test_subclasses(build, result):
+    built = asyncio.run(build())
+
+    assert built == result
+    assert type(built) is type(result)
+
+
+def test_concurrency_err():
+    with pytest.raises(ValueError, match="concurrency must be positive"):
+        asyncio.run(list((3, 5)).amap(async_double, concurrency=0))
@@ -0,0 +1,120 @@
+# type: ignore
+
+import collections
+import json
+
+import pytest
+
+from benchmarks import CASES
+from benchmarks import Measure
+from benchmarks.__main__ import main
+from benchmarks.runner import compare
+from benchmarks.runner import load_report
+from benchmarks.runner import time_function
+from magic_list import list
+
+
+def test_every_method_has_a_case():
+    methods = {
+        name
+        for name in dir(list)
+        if not name.startswith("_") and name not in dir(collections.UserList)
+    }
+
+    assert methods <= {case.name for case in CASES}
+
+
+@pytest.mark.parametrize("case", CASES, ids=lambda case: case.name)
+def test_case_agrees_with_baselines(case):
+    items = case.make_input(100)
+    expected = case.magic(list(items))
+
+    for baseline in case.baselines.values():
+        result = baseline(items)
+
+        if case.name in {"shuffled", "lazy"}:
+            assert sorted(result) == sorted(expected)
+        elif case.name not in {"view", "typed", "to_bytes"}:
+            assert result == expected
+
+
+def test_time_function():
+    calls = []
+
+    seconds = time_function(calls.append, None, repeat=3, min_time=0.001)
+
+    assert seconds > 0
+    assert len(calls) >= 3
+
+
+def test_main(tmp_path, capsys):
+    report = tmp_path / "report.json"
+
+    assert (
+        main(
+            [
+                "sum",
+                "fill_left",
+                "--sizes",
+                "10",
+                "200000",
+                "--repeat",
+                "1",
+                "--min-time",
+                "0",
+                "-o",
+                str(report),
+            ]
+        )
+        == 0
+    )
+
+    measures = load_report(report)
+    output = capsys.readouterr().out
+
+    assert {(m.case, m.implementation, m.size) for m in measures} == {
+        ("sum", "magic_list", 10),
+        ("sum", "builtin", 10),
+        ("sum", "magic_list", 200_000),
+        ("sum", "builtin", 200_000),
+        ("fill_left", "magic_list", 10),
+        ("fill_left", "builtin", 10),
+    }
+    assert "fill_left" in output
+    assert sorted(json.loads(report.read_text())["environment"]) == [
+        "implementation",
+        "machine",
+        "magic_list",
+        "numpy",
+        "python",
+    ]
+
+    assert (
+        main(
+            [
+                "sum",
+                "--sizes",
+                "10",
+                "--repeat",
+                "1",
+                "--min-time",
+                "0",
+                "--compare",
+                str(report),
+            ]
+        )
+        == 0
+    )
+    assert "x\n" in capsys.readouterr().out
+
+
+def test_main_unknown_case(capsys):
+    assert main(["sum", "magic"]) == 2
+    assert "unknown cases: magic" in capsys.readouterr().err
+
+
+def test_compare():
+    old = [Measure("sum", "magic_list", 10, 2.0), Measure("sum", "builtin", 10, 1.0)]
+    new = [Measure("sum", "magic_list", 10, 1.0), Measure("max", "builtin", 10, 1.0)]
+
+    assert compare(old, new) == [(new[0], 2.0)]
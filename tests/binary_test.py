@@ -0,0 +1,126 @@
+# type: ignore
+
+import array
+import pickle
+import struct
+import sys
+
+import pytest
+
+from magic_list import L
+from magic_list import TypedList
+from magic_list import deque
+from magic_list import list
+from magic_list import _binary
+
+
+@pytest.mark.parametrize(
+    "l",
+    [
+        list((3, 5, 20, -1)),
+        list((3.5, -0.0, float("inf"))),
+        list((b"hello", b"", b"\x00world")),
+        list(),
+        deque((3, 5, 2)),
+        L[3, 5, 2].view().tail,
+        L[0:10:3],
+    ],
+)
+def test_round_trip(l):
+    data = l.to_bytes()
+
+    assert isinstance(data, bytes)
+    assert list.from_bytes(data) == l
+    assert list.from_bytes(bytearray(data)) == l
+    assert list.from_bytes(memoryview(data)) == l
+    assert type(list.from_bytes(data)) is list
+
+
+def test_layout():
+    assert L[3, 5].to_bytes() == (b"MLST\x01q\x08" + struct.pack("<QQQ", 2, 3, 5))
+    assert L[b"ab", b"c"].to_bytes() == (
+        b"MLST\x01y\x08" + struct.pack("<QQQ", 2, 2, 1) + b"abc"
+    )
+
+
+def test_round_trip_types():
+    assert type(list.from_bytes(L[3.5].to_bytes())[0]) is float
+    assert type(list.from_bytes(L[3].to_bytes())[0]) is int
+    assert isinstance(deque.from_bytes(L[3, 5].to_bytes()), deque)
+
+
+@pytest.mark.parametrize("typecode", ["b", "h", "q", "f", "d"])
+def test_round_trip_typed(typecode):
+    typed = TypedList([3, 5, 2], typecode)
+    result = TypedList.from_bytes(typed.to_bytes())
+
+    assert result == typed
+    assert result.typecode == typecode
+    assert list.from_bytes(typed.to_bytes()) == [3, 5, 2]
+
+
+@pytest.mark.parametrize(
+    ["l", "exception", "message"],
+    [
+        [L[3, 5.0], TypeError, "only lists of int, float or bytes"],
+        [L[True, False], TypeError, "only lists of int, float or bytes"],
+        [L["hello"], TypeError, "only lists of int, float or bytes"],
+        [L[b"hello", 3], TypeError, "only lists of int, float or bytes"],
+        [L[2**64], ValueError, "do not fit in 64 bits"],
+    ],
+)
+def test_to_bytes_err(l, exception, message):
+    with pytest.raises(exception, match=message):
+        l.to_bytes()
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"hello",
+        b"MLSX\x01q\x08" + bytes(8),
+        b"MLST\x02q\x08" + bytes(8),
+        b"MLST\x01z\x08" + bytes(8),
+        b"MLST\x01\xff\x08" + bytes(8),
+        b"MLST\x01q\x04" + bytes(8),
+        b"MLST\x01q\x08" + struct.pack("<Q", 2) + bytes(8),
+        b"MLST\x01q\x08" + struct.pack("<Q", 1) + bytes(9),
+        b"MLST\x01y\x08" + struct.pack("<QQ", 1, 3) + b"ab",
+    ],
+)
+def test_from_bytes_err(data):
+    with pytest.raises(ValueError, match="invalid magic list bytes"):
+        list.from_bytes(data)
+
+
+@pytest.mark.parametrize("typecode", ["q", "f"])
+def test_pickle_typed_out_of_band(typecode):
+    typed = TypedList([3, 5, 2], typecode)
+    buffers = []
+    data = pickle.dumps(typed, protocol=5, buffer_callback=buffers.append)
+    result = pickle.loads(data, buffers=buffers)
+
+    assert len(buffers) == 1
+    assert len(data) < typed.data.itemsize * len(typed) + 100
+    assert result == typed
+    assert result.typecode == typecode
+
+
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_pickle_typed(protocol):
+    typed = TypedList([3.5, 5.0])
+    result = pickle.loads(pickle.dumps(typed, protocol=protocol))
+
+    assert result == typed
+    assert isinstance(result, TypedList)
+
+
+def test_rebuild_byteorder():
+    items = array.array("q", [3, 5])
+    items.byteswap()
+    other = "big" if sys.byteorder == "little" else "little"
+
+    result = _binary.rebuild(TypedList, "q", other, items.tobytes(), {})
+
+    assert result == TypedList([3, 5])
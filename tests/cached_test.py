@@ -0,0 +1,219 @@
+# type: ignore
+
+import copy
+import pickle
+import threading
+
+import pytest
+
+from magic_list import CachedList
+from magic_list import CacheInfo
+from magic_list import L
+from magic_list import list
+
+
+@pytest.fixture
+def cached():
+    return list((3, 5, 20, -1, 5)).cached()
+
+
+@pytest.mark.parametrize(
+    ["call", "result"],
+    [
+        [lambda l: l.sorted(), list((-1, 3, 5, 5, 20))],
+        [lambda l: l.sorted(reverse=True), list((20, 5, 5, 3, -1))],
+        [lambda l: l.sorted(key=abs), list((-1, 3, 5, 5, 20))],
+        [lambda l: l.deduplicate(), list((3, 5, 20, -1))],
+        [lambda l: l.deduplicate(key=abs), list((3, 5, 20, -1))],
+        [lambda l: l.min(), -1],
+        [lambda l: l.max(), 20],
+        [lambda l: l.sum(), 32],
+        [lambda l: l.sum(start=10), 42],
+        [lambda l: l.mean(), 6.4],
+    ],
+)
+def test_cached_results(cached, call, result):
+    assert call(cached) == result
+    assert call(cached) == result
+    assert cached.cache_info() == CacheInfo(1, 1, 128, 1)
+
+
+def test_cached_returns_copies(cached):
+    result = cached.sorted()
+    result.append(0)
+
+    assert cached.sorted() == list((-1, 3, 5, 5, 20))
+    assert cached.sorted() is not cached.sorted()
+    assert isinstance(result, CachedList)
+    assert result.cache_info() == CacheInfo(0, 0, 128, 0)
+
+
+def test_cached_sum_returns_copies():
+    cached = L[[1], [2]].cached()
+    result = cached.sum()
+    result.append(9)
+
+    assert cached.sum() == [1, 2]
+    assert cached.cache_info() == CacheInfo(1, 1, 128, 1)
+
+
+@pytest.mark.parametrize(
+    ["mutate", "result"],
+    [
+        [lambda l: l.__setitem__(0, 100), 129],
+        [lambda l: l.__delitem__(0), 29],
+        [lambda l: l.__iadd__([1]), 33],
+        [lambda l: l.__imul__(2), 64],
+        [lambda l: l.append(1), 33],
+        [lambda l: l.insert(0, 1), 33],
+        [lambda l: l.prepend(1), 33],
+        [lambda l: l.pop(), 27],
+        [lambda l: l.remove(20), 12],
+        [lambda l: l.clear(), 0],
+        [lambda l: l.extend([1, 2]), 35],
+    ],
+)
+def test_cached_mutations_invalidate(cached, mutate, result):
+    assert cached.sum(start=0) == 32
+
+    mutate(cached)
+
+    assert cached.version >= 1
+    assert cached.cache_info().currsize == 0
+    assert cached.sum(start=0) == result
+
+
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        lambda l: l.reverse(),
+        lambda l: l.sort(),
+        lambda l: l.rotate_inplace(),
+    ],
+)
+def test_cached_reordering_invalidates(cached, mutate):
+    assert cached.sorted() == list((-1, 3, 5, 5, 20))
+
+    mutate(cached)
+
+    assert cached.version == 1
+    assert cached.cache_info().currsize == 0
+
+
+def test_cached_failed_mutation_invalidates(cached):
+    cached.min()
+
+    with pytest.raises(ValueError):
+        cached.remove(42)
+
+    assert cached.version == 1
+    assert cached.cache_info().currsize == 0
+
+
+def test_cached_eviction():
+    cached = list((3, 5, 2)).cached(2)
+    cached.min()
+    cached.max()
+    cached.min()
+    cached.sum()
+
+    assert cached.cache_info() == CacheInfo(1, 3, 2, 2)
+
+    cached.min()
+
+    assert cached.cache_info() == CacheInfo(2, 3, 2, 2)
+
+    cached.max()
+
+    assert cached.cache_info() == CacheInfo(2, 4, 2, 2)
+
+
+@pytest.mark.parametrize(
+    ["maxsize", "currsize"],
+    [[0, 0], [None, 3]],
+)
+def test_cached_maxsize(maxsize, currsize):
+    cached = list((3, 5, 2)).cached(maxsize)
+    cached.min()
+    cached.max()
+    cached.sum()
+
+    assert cached.cache_info() == CacheInfo(0, 3, maxsize, currsize)
+
+
+def test_cached_unhashable_arguments():
+    cached = list(([3], [5])).cached()
+
+    assert cached.sum(start=[]) == [3, 5]
+    assert cached.cache_info() == CacheInfo(0, 0, 128, 0)
+
+
+def test_cached_errors_are_not_memoized():
+    cached = list().cached()
+
+    with pytest.raises(TypeError):
+        cached.min()
+
+    assert cached.cache_info() == CacheInfo(0, 1, 128, 0)
+
+
+def test_cached_mutation_during_computation(cached):
+    def key(n):
+        if n == 20:
+            cached[0] = 3
+
+        return n
+
+    cached.sorted(key=key)
+
+    assert cached.cache_info().currsize == 0
+
+
+def test_cached_clear(cached):
+    cached.min()
+    cached.min()
+    cached.cache_clear()
+
+    assert cached.cache_info() == CacheInfo(0, 0, 128, 0)
+
+
+def test_cached_copy_and_pickle(cached):
+    cached.min()
+
+    for other in (
+        copy.copy(cached),
+        cached.copy(),
+        cached.tail,
+        pickle.loads(pickle.dumps(cached)),
+    ):
+        assert isinstance(other, CachedList)
+        assert other.cache_info().currsize == 0
+        other.append(1)
+
+    assert cached.version == 0
+    assert cached.cache_info().currsize == 1
+    assert pickle.loads(pickle.dumps(list().cached(4))).cache_info().maxsize == 4
+
+
+def test_cached_threads(cached):
+    def work():
+        for _ in range(200):
+            cached.sum()
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    info = cached.cache_info()
+
+    assert info.hits + info.misses == 800
+    assert info.currsize == 1
+
+
+def test_cached_err():
+    with pytest.raises(ValueError, match="the cache size cannot be negative"):
+        L[3, 5, 2].cached(-1)
@@ -0,0 +1,225 @@
+# type: ignore
+
+import collections
+import copy
+import random
+
+import pytest
+
+from magic_list import deque
+from magic_list import list
+
+_RANDOM_SEED = 0
+
+
+@pytest.fixture
+def prebuild_deque(request):
+    if request.param == "deque_int_filled":
+        return deque((3, 5, 20, -1))
+    elif request.param == "deque_empty":
+        return deque()
+
+
+def test_deque_storage():
+    dq = deque((3, 5, 20, -1))
+
+    assert isinstance(dq, list)
+    assert isinstance(dq.data, collections.deque)
+    assert isinstance(deque(list((3, 5))).data, collections.deque)
+    assert repr(dq) == "deque([3, 5, 20, -1])"
+
+
+@pytest.mark.parametrize(
+    ["left", "right", "result"],
+    [
+        [deque((3, 5)), deque((3, 5)), True],
+        [deque((3, 5)), list((3, 5)), True],
+        [list((3, 5)), deque((3, 5)), True],
+        [deque((3, 5)), [3, 5], True],
+        [[3, 5], deque((3, 5)), True],
+        [deque((3, 5)), collections.deque((3, 5)), True],
+        [deque((3, 5)), list((5, 3)), False],
+        [deque(), list(), True],
+    ],
+)
+def test_deque_eq(left, right, result):
+    assert (left == right) is result
+
+
+def test_deque_ordering():
+    assert deque((3, 5)) < list((3, 6))
+    assert deque((3, 5)) <= [3, 5]
+    assert deque((3, 6)) > deque((3, 5))
+    assert deque((3, 5)) >= list((3, 5))
+
+
+@pytest.mark.parametrize(
+    ["key", "result"],
+    [
+        [0, 3],
+        [-1, -1],
+        [slice(1, 3), deque((5, 20))],
+        [slice(None, None, 2), deque((3, 20))],
+        [slice(None, None, -1), deque((-1, 20, 5, 3))],
+        [slice(-1, 0, -2), deque((-1, 5))],
+        [slice(10, 20), deque()],
+    ],
+)
+def test_deque_getitem(key, result):
+    item = deque((3, 5, 20, -1))[key]
+
+    assert item == result
+    assert type(item) is type(result)
+
+
+def test_deque_setitem_delitem():
+    dq = deque((3, 5, 20, -1))
+
+    dq[0] = 4
+    dq[1:3] = [7, 8, 9]
+    assert dq == list((4, 7, 8, 9, -1))
+    assert isinstance(dq.data, collections.deque)
+
+    del dq[0]
+    del dq[::2]
+    assert dq == list((8, -1))
+    assert isinstance(dq.data, collections.deque)
+
+
+def test_deque_arithmetic():
+    dq = deque((3, 5))
+
+    assert dq + [20] == deque((3, 5, 20))
+    assert isinstance(dq + list((20,)), deque)
+    assert [20] + dq == deque((20, 3, 5))
+    assert isinstance([20] + dq, deque)
+    assert dq * 2 == deque((3, 5, 3, 5))
+
+    dq += (1,)
+    assert dq == deque((3, 5, 1))
+
+
+def test_deque_copy():
+    dq = deque((3, 5))
+
+    for duplicate in (dq.copy(), copy.copy(dq)):
+        assert duplicate == dq
+        assert duplicate is not dq
+        assert duplicate.data is not dq.data
+        assert isinstance(duplicate, deque)
+
+
+@pytest.mark.parametrize(
+    ["args", "result", "rest"],
+    [
+        [(), -1, deque((3, 5, 20))],
+        [(3,), -1, deque((3, 5, 20))],
+        [(0,), 3, deque((5, 20, -1))],
+        [(-4,), 3, deque((5, 20, -1))],
+        [(2,), 20, deque((3, 5, -1))],
+    ],
+)
+def test_deque_pop(args, result, rest):
+    dq = deque((3, 5, 20, -1))
+
+    assert dq.pop(*args) == result
+    assert dq == rest
+
+
+def test_deque_sort():
+    dq = deque((3, 5, 20, -1))
+    dq.sort(reverse=True)
+
+    assert dq == deque((20, 5, 3, -1))
+    assert isinstance(dq.data, collections.deque)
+
+
+@pytest.mark.parametrize(
+    ["prebuild_deque", "element", "result"],
+    [
+        ["deque_int_filled", 14, deque((14, 3, 5, 20, -1))],
+        ["deque_empty", -5, deque((-5,))],
+    ],
+    indirect=["prebuild_deque"],
+)
+def test_prepend_ok(prebuild_deque, element, result):
+    prebuild_deque.prepend(element)
+    assert prebuild_deque == result
+
+
+@pytest.mark.parametrize(
+    ["prebuild_deque", "filler", "n", "result"],
+    [
+        ["deque_int_filled", 0, 3, deque((0, 0, 0, 3, 5, 20, -1))],
+        ["deque_int_filled", sum, 3, deque((108, 54, 27, 3, 5, 20, -1))],
+        ["deque_empty", len, 4, deque((3, 2, 1, 0))],
+    ],
+    indirect=["prebuild_deque"],
+)
+def test_fill_left_ok(prebuild_deque, filler, n, result):
+    filled = prebuild_deque.fill_left(filler, n)
+
+    assert filled == result
+    assert isinstance(filled, deque)
+
+
+@pytest.mark.parametrize(
+    ["prebuild_deque", "attribute", "result"],
+    [
+        ["deque_int_filled", "head", 3],
+        ["deque_int_filled", "tail", deque((5, 20, -1))],
+        ["deque_int_filled", "init", deque((3, 5, 20))],
+        ["deque_int_filled", "last", -1],
+    ],
+    indirect=["prebuild_deque"],
+)
+def test_properties_ok(prebuild_deque, attribute, result):
+    assert getattr(prebuild_deque, attribute) == result
+
+
+@pytest.mark.parametrize(
+    ["prebuild_deque", "args", "result"],
+    [
+        ["deque_int_filled", (), deque((-1, 3, 5, 20))],
+        ["deque_int_filled", (-2,), deque((20, -1, 3, 5))],
+        ["deque_int_filled", (10**12 + 2,), deque((20, -1, 3, 5))],
+    ],
+    indirect=["prebuild_deque"],
+)
+def test_rotate_ok(prebuild_deque, args, result):
+    rotated = prebuild_deque.rotate(*args)
+
+    assert rotated == result
+    assert isinstance(rotated, deque)
+    assert prebuild_deque == deque((3, 5, 20, -1))
+
+    assert [*prebuild_deque.irotate(*args)] == result
+
+    prebuild_deque.rotate_inplace(*args)
+    assert prebuild_deque == result
+
+
+@pytest.mark.parametrize(
+    ["prebuild_deque", "method", "exception", "message"],
+    [
+        ["deque_empty", "rotate", TypeError, "empty list cannot be rotated"],
+        ["deque_empty", "rotate_inplace", TypeError, "empty list cannot be rotated"],
+        ["deque_empty", "irotate", TypeError, "empty list cannot be rotated"],
+    ],
+    indirect=["prebuild_deque"],
+)
+def test_rotate_err(prebuild_deque, method, exception, message):
+    with pytest.raises(exception, match=message):
+        getattr(prebuild_deque, method)()
+
+
+def test_shuffled_ok():
+    random.seed(_RANDOM_SEED)
+    shuffled = deque((3, 5, 20, -1)).shuffled()
+
+    assert shuffled == list((20, 3, 5, -1))
+    assert isinstance(shuffled, deque)
+
+
+def test_reversed_ok():
+    assert deque((3, 5, 20)).reversed() == deque((20, 5, 3))
@@ -0,0 +1,141 @@
+# type: ignore
+
+import pytest
+
+from magic_list import LazyList
+from magic_list import TypedList
+from magic_list import deque
+from magic_list import list
+
+
+@pytest.fixture
+def lines_file(tmp_path):
+    path = tmp_path / "numbers.txt"
+    path.write_bytes(b"3\n5\r\n20\n\n-1")
+
+    return path
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / "points.csv"
+    path.write_text('x,y\n3,5\n"2,5",8\n', encoding="utf-8", newline="")
+
+    return path
+
+
+@pytest.mark.parametrize("buffer_size", [1, 2, 3, 4096])
+def test_from_lines(lines_file, buffer_size):
+    result = list.from_lines(lines_file, buffer_size=buffer_size)
+
+    assert type(result) is list
+    assert result == ["3", "5", "20", "", "-1"]
+
+
+@pytest.mark.parametrize("buffer_size", [1, 4096])
+def test_from_lines_parse(lines_file, buffer_size):
+    result = list.from_lines(lines_file, parse=len, buffer_size=buffer_size)
+
+    assert result == [1, 1, 2, 0, 2]
+
+
+def test_from_lines_trailing_terminator(tmp_path):
+    path = tmp_path / "lines.txt"
+    path.write_text("héllo\nwörld\n", encoding="latin-1")
+
+    assert list.from_lines(path, encoding="latin-1") == ["héllo", "wörld"]
+    assert list.from_lines(str(path), encoding="latin-1", parse=str.upper) == [
+        "HÉLLO",
+        "WÖRLD",
+    ]
+
+
+def test_from_lines_empty(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_text("")
+
+    assert list.from_lines(path) == []
+
+
+def test_from_lines_subclasses(lines_file):
+    assert isinstance(deque.from_lines(lines_file), deque)
+    assert TypedList.from_lines(lines_file, parse=lambda line: int(line or 0)) == [
+        3,
+        5,
+        20,
+        0,
+        -1,
+    ]
+
+
+def test_from_lines_lazy(lines_file):
+    result = list.from_lines(lines_file, parse=lambda line: int(line or 0), lazy=True)
+
+    assert isinstance(result, LazyList)
+    assert repr(result).startswith("LazyList(LineSource(")
+
+    pipeline = result.filter(lambda n: n > 0).map(str).take(2)
+
+    assert pipeline.collect() == ["3", "5"]
+
+    # the file is read again on each materialization
+    lines_file.write_text("8\n13\n")
+
+    assert pipeline.collect() == ["8", "13"]
+
+
+@pytest.mark.parametrize(
+    ["call", "message"],
+    [
+        [lambda path: list.from_lines(path, buffer_size=0), "must be positive"],
+        [lambda path: list.from_csv(path, buffer_size=-1), "must be positive"],
+    ],
+)
+def test_buffer_size_err(lines_file, call, message):
+    with pytest.raises(ValueError, match=message):
+        call(lines_file)
+
+
+def test_from_lines_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        list.from_lines(tmp_path / "missing.txt")
+
+
+def test_from_csv(csv_file):
+    assert list.from_csv(csv_file) == [["x", "y"], ["3", "5"], ["2,5", "8"]]
+
+
+def test_from_csv_header(csv_file):
+    assert list.from_csv(csv_file, header=True) == [
+        {"x": "3", "y": "5"},
+        {"x": "2,5", "y": "8"},
+    ]
+
+
+def test_from_csv_parse(csv_file):
+    result = list.from_csv(
+        csv_file,
+        header=True,
+        parse=lambda row: float(row["x"].replace(",", ".")),
+    )
+
+    assert result == [3.0, 2.5]
+
+
+def test_from_csv_options(tmp_path):
+    path = tmp_path / "points.tsv"
+    path.write_text("3\t5\n2\t8\n")
+
+    assert list.from_csv(path, delimiter="\t", buffer_size=1) == [
+        ["3", "5"],
+        ["2", "8"],
+    ]
+
+
+def test_from_csv_lazy(csv_file):
+    result = list.from_csv(csv_file, lazy=True, header=True)
+
+    assert isinstance(result, LazyList)
+    assert repr(result).startswith("LazyList(CsvSource(")
+    assert result.map(lambda row: row["y"]).collect() == ["5", "8"]
+    assert result.head == {"x": "3", "y": "5"}
@@ -0,0 +1,191 @@
+# type: ignore
+
+import copy
+import pickle
+import random
+
+import pytest
+
+from magic_list import IndexedList
+from magic_list import L
+from magic_list import list
+
+
+@pytest.fixture
+def indexed():
+    return list((3, 5, 20, -1, 5)).indexed()
+
+
+def test_indexed(indexed):
+    assert isinstance(indexed, IndexedList)
+    assert indexed == [3, 5, 20, -1, 5]
+    assert L[[3], [5]].indexed() == [[3], [5]]
+
+
+@pytest.mark.parametrize(
+    ["call", "result"],
+    [
+        [lambda l: 5 in l, True],
+        [lambda l: 4 in l, False],
+        [lambda l: [5] in l, False],
+        [lambda l: l.index(5), 1],
+        [lambda l: l.index(5, 2), 4],
+        [lambda l: l.index(5, -1), 4],
+        [lambda l: l.count(5), 2],
+        [lambda l: l.count(4), 0],
+        [lambda l: l.count([5]), 0],
+        [lambda l: l.positions(5), [1, 4]],
+        [lambda l: l.positions(4), []],
+        [lambda l: l.deduplicate(), [3, 5, 20, -1]],
+        [lambda l: l.deduplicate(key=abs), [3, 5, 20, -1]],
+        [lambda l: l.select(l.positions(5)), [5, 5]],
+    ],
+)
+def test_lookups(indexed, call, result):
+    assert call(indexed) == result
+
+
+@pytest.mark.parametrize(
+    ["start", "stop"],
+    [[2, 4], [0, 1], [5, None]],
+)
+def test_index_out_of_bounds(indexed, start, stop):
+    with pytest.raises(ValueError, match="5 is not in list"):
+        indexed.index(5, start, stop or len(indexed))
+
+
+def test_deduplicate_type(indexed):
+    assert isinstance(indexed.deduplicate(), IndexedList)
+
+
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        lambda l, item: l.append(item),
+        lambda l, item: l.prepend(item),
+        lambda l, item: l.insert(2, item),
+        lambda l, item: l.insert(-100, item),
+        lambda l, item: l.insert(100, item),
+        lambda l, item: l.extend([item, item]),
+        lambda l, item: l.__iadd__([item]),
+        lambda l, item: l.__setitem__(1, item),
+        lambda l, item: l.__setitem__(-1, item),
+        lambda l, item: l.__setitem__(slice(0, 2), [item]),
+        lambda l, item: l.pop(),
+        lambda l, item: l.pop(0),
+        lambda l, item: l.pop(-5),
+        lambda l, item: l.pop(2),
+        lambda l, item: l.__delitem__(0),
+        lambda l, item: l.__delitem__(slice(1, 3)),
+        lambda l, item: l.remove(5),
+        lambda l, item: l.__imul__(2),
+        lambda l, item: l.clear(),
+        lambda l, item: l.reverse(),
+        lambda l, item: l.sort(),
+        lambda l, item: l.rotate_inplace(2),
+    ],
+)
+@pytest.mark.parametrize("item", [5, 7])
+def test_mutations(indexed, mutate, item):
+    # the index is built before mutating the list
+    assert 5 in indexed
+
+    expected = list(indexed)
+    mutate(indexed, item)
+    mutate(expected, item)
+
+    assert indexed == expected
+
+    for value in (3, 5, 7, 20, -1):
+        assert (value in indexed) == (value in expected)
+        assert indexed.count(value) == expected.count(value)
+        assert indexed.positions(value) == [
+            i for i, other in enumerate(expected) if other == value
+        ]
+
+
+def test_random_operations():
+    generator = random.Random(0)
+    indexed = IndexedList(generator.randrange(10) for _ in range(20))
+    expected = [*indexed]
+
+    for _ in range(1000):
+        operation = generator.randrange(6)
+        item = generator.randrange(10)
+
+        if operation == 0:
+            indexed.append(item)
+            expected.append(item)
+        elif operation == 1:
+            indexed.prepend(item)
+            expected.insert(0, item)
+        elif operation == 2 and expected:
+            assert indexed.pop() == expected.pop()
+        elif operation == 3 and expected:
+            assert indexed.pop(0) == expected.pop(0)
+        elif operation == 4 and expected:
+            i = generator.randrange(len(expected))
+            indexed[i] = item
+            expected[i] = item
+        elif item in expected:
+            assert indexed.index(item) == expected.index(item)
+
+            indexed.remove(item)
+            expected.remove(item)
+
+        assert indexed.count(item) == expected.count(item)
+        assert (item in indexed) == (item in expected)
+
+    assert indexed == expected
+
+
+def test_unhashable_items():
+    indexed = L[[3], 5, [3]].indexed()
+
+    assert [3] in indexed
+    assert 5 in indexed
+    assert indexed.index([3], 1) == 2
+    assert indexed.count([3]) == 2
+    assert indexed.positions([3]) == [0, 2]
+    assert indexed.deduplicate() == [[3], 5]
+
+    with pytest.raises(ValueError, match="is not in list"):
+        indexed.index(4)
+
+    indexed.pop(0)
+    indexed.pop()
+
+    assert indexed.positions(5) == [0]
+    assert indexed._index == {5: [0]}
+
+
+def test_unhashable_mutations(indexed):
+    assert 5 in indexed
+
+    indexed.append([5])
+
+    assert [5] in indexed
+    assert indexed._index is None
+
+    indexed[-1] = 5
+
+    assert indexed.positions(5) == [1, 4, 5]
+
+
+def test_copy_and_pickle(indexed):
+    assert 5 in indexed
+
+    for clone in (
+        indexed.copy(),
+        copy.copy(indexed),
+        indexed[:],
+        pickle.loads(pickle.dumps(indexed)),
+    ):
+        assert isinstance(clone, IndexedList)
+        assert clone._index is None
+
+        clone.append(5)
+
+        assert clone.count(5) == 3
+
+    assert indexed.count(5) == 2
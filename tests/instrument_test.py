@@ -0,0 +1,197 @@
+# type: ignore
+
+import asyncio
+import sys
+import threading
+
+import pytest
+
+from magic_list import L
+from magic_list import MethodStats
+from magic_list import deque
+from magic_list import instrument
+from magic_list import list
+from magic_list import stats
+
+from .utils import double
+from .utils import greater_than_four
+
+
+def snapshot(cls):
+    return dict(vars(cls))
+
+
+def test_disabled_by_default():
+    before = {cls: snapshot(cls) for cls in (list, deque)}
+
+    with instrument():
+        assert list.map is not before[list]["map"]
+        assert "append" in vars(list)
+
+    assert {cls: snapshot(cls) for cls in (list, deque)} == before
+    assert "append" not in vars(list)
+
+
+def test_records_chains():
+    with instrument():
+        items = list(range(10)).map(double).filter(greater_than_four).tail
+
+    recorded = stats()
+
+    assert recorded["list.map"].calls == 1
+    assert recorded["list.map"].elements == 10
+    assert recorded["list.map"].allocations == 1
+    assert recorded["list.filter"].elements == 10
+    assert recorded["list.tail"].elements == 7
+    assert recorded["list.tail"].allocations == 1
+    assert recorded["list.tail"].bytes_copied == sys.getsizeof(items.data)
+    assert recorded["list.tail"].seconds > 0
+    assert "list.head" not in recorded
+
+
+def test_records_tuples_and_in_place_methods():
+    with instrument():
+        items = L[3, 5, 20, -1]
+        items.partition(1)
+        items.append(8)
+        items.rotate_inplace()
+        items.head
+
+    recorded = stats()
+
+    assert recorded["list.partition"].allocations == 2
+    assert recorded["list.append"] == MethodStats(
+        1,
+        4,
+        0,
+        0,
+        recorded["list.append"].seconds,
+    )
+    assert recorded["list.rotate_inplace"].allocations == 0
+    assert recorded["list.head"].calls == 1
+
+
+def test_records_nested_calls_and_subclasses():
+    with instrument():
+        deque((3, 5, 20)).prepend(0)
+        deque((3, 5, 20)).rotate()
+
+    recorded = stats()
+
+    assert recorded["deque.prepend"].calls == 1
+    assert recorded["deque.rotate"].calls == 1
+    assert recorded["deque.rotate_inplace"].calls == 1
+    assert recorded["list.copy"].calls == 1
+
+
+def test_records_failures():
+    with instrument(), pytest.raises(TypeError):
+        list().head
+
+    assert stats()["list.head"].calls == 1
+
+
+def test_records_coroutines():
+    async def async_double(n):
+        await asyncio.sleep(0)
+        return n * 2
+
+    with instrument():
+        assert asyncio.run(list((3, 5)).amap(async_double)) == list((6, 10))
+
+    recorded = stats()
+
+    assert recorded["list.amap"].calls == 1
+    assert recorded["list.amap"].allocations == 1
+    assert recorded["list.amap"].seconds > 0
+
+
+def test_nesting_and_reset():
+    with instrument():
+        list((3,)).reversed()
+
+        with instrument():
+            list((3,)).reversed()
+
+        assert list.reversed.__wrapped__ is not None
+        list((3,)).reversed()
+
+    assert stats()["list.reversed"].calls == 3
+    assert not hasattr(list.reversed, "__wrapped__")
+
+    with instrument():
+        pass
+
+    assert stats() == {}
+
+
+def test_restores_after_exception():
+    original = list.map
+
+    with pytest.raises(RuntimeError), instrument():
+        raise RuntimeError
+
+    assert list.map is original
+
+
+def test_threads_are_not_recorded():
+    async def async_double(n):
+        await asyncio.sleep(0)
+        return n * 2
+
+    def work():
+        for _ in range(100):
+            list((3, 5)).reversed()
+
+        asyncio.run(list((3, 5)).amap(async_double))
+
+    with instrument():
+        threads = [threading.Thread(target=work) for _ in range(4)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        list((3, 5)).reversed()
+
+    assert stats()["list.reversed"].calls == 1
+    assert "list.amap" not in stats()
+
+
+def test_concurrent_blocks():
+    barrier = threading.Barrier(2)
+    recorded = {}
+
+    def work(calls):
+        with instrument():
+            # both blocks are active at the same time
+            barrier.wait()
+
+            for _ in range(calls):
+                list((3, 5)).reversed()
+
+            barrier.wait()
+
+        recorded[calls] = stats()
+
+    threads = [threading.Thread(target=work, args=(calls,)) for calls in (3, 5)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert recorded[3]["list.reversed"].calls == 3
+    assert recorded[5]["list.reversed"].calls == 5
+    assert not hasattr(list.reversed, "__wrapped__")
+
+
+def test_stats_order():
+    with instrument():
+        list((3,)).reversed()
+        list((3,)).copy()
+
+    assert [*stats()] == ["list.copy", "list.reversed"]
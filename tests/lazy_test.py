@@ -0,0 +1,164 @@
+# type: ignore
+
+import operator
+
+import pytest
+
+from magic_list import L
+from magic_list import LazyList
+from magic_list import list
+
+from .utils import double
+from .utils import greater_than_four
+
+
+def test_lazy_ok():
+    lazy = L[3, 5, 20, -1].lazy()
+
+    assert isinstance(lazy, LazyList)
+    assert lazy.collect() == list((3, 5, 20, -1))
+    assert isinstance(lazy.collect(), list)
+
+
+def test_lazy_repr_ok():
+    assert repr(L[3, 5].lazy().map(double)) == "LazyList([3, 5], stages=1)"
+
+
+def test_lazy_is_deferred():
+    calls = []
+
+    def spy(x):
+        calls.append(x)
+        return x
+
+    lazy = L[3, 5, 20, -1].lazy().map(spy)
+
+    assert calls == []
+    assert lazy.collect() == list((3, 5, 20, -1))
+    assert calls == [3, 5, 20, -1]
+
+
+def test_lazy_take_stops_early():
+    calls = []
+
+    def spy(x):
+        calls.append(x)
+        return x
+
+    result = L[3, 5, 20, -1, 8, 9].lazy().map(spy).filter(greater_than_four).take(2)
+
+    assert result.collect() == list((5, 20))
+    assert calls == [3, 5, 20]
+
+
+def test_lazy_head_stops_early():
+    calls = []
+
+    def spy(x):
+        calls.append(x)
+        return x
+
+    assert L[3, 5, 20].lazy().map(spy).head == 3
+    assert calls == [3]
+
+
+def test_lazy_len_ok():
+    assert len(L[3, 5, 20, -1].lazy().filter(greater_than_four)) == 2
+    assert len(list().lazy()) == 0
+
+
+def test_lazy_is_reiterable():
+    lazy = L[3, 5, 20].lazy().map(double)
+
+    assert [*lazy] == [*lazy] == [6, 10, 40]
+
+
+@pytest.mark.parametrize(
+    ["build", "result"],
+    [
+        [lambda lz: lz.map(double), list((6, 10, 40, -2))],
+        [lambda lz: lz.filter(greater_than_four), list((5, 20))],
+        [lambda lz: lz.mask([0, 1, 0, 1]), list((5, -1))],
+        [lambda lz: lz.take(2), list((3, 5))],
+        [lambda lz: lz.take(0), list()],
+        [lambda lz: lz.drop(2), list((20, -1))],
+        [lambda lz: lz.drop(0), list((3, 5, 20, -1))],
+        [lambda lz: lz.tail, list((5, 20, -1))],
+        [lambda lz: lz.reversed(), list((-1, 20, 5, 3))],
+        [lambda lz: lz.interleave(0), list((3, 0, 5, 0, 20, 0, -1))],
+        [
+            lambda lz: lz.interleave(operator.add),
+            list((3, 8, 5, 25, 20, 19, -1)),
+        ],
+        [
+            lambda lz: lz.map(double).filter(greater_than_four).drop(1).take(2),
+            list((10, 40)),
+        ],
+        [
+            lambda lz: lz.reversed().map(double).take(1),
+            list((-2,)),
+        ],
+    ],
+)
+def test_lazy_chain_ok(build, result):
+    assert build(L[3, 5, 20, -1].lazy()).collect() == result
+
+
+@pytest.mark.parametrize(
+    ["prebuild_list", "build", "exception", "message"],
+    [
+        [list(), lambda lz: lz.head, TypeError, "empty list has no head"],
+        [list(), lambda lz: lz.tail.collect(), TypeError, "empty list has no tail"],
+        [
+            L[3, 5],
+            lambda lz: lz.mask([1]).collect(),
+            TypeError,
+            "mask length must be the same as the list",
+        ],
+        [
+            L[3],
+            lambda lz: lz.mask([1, 0]).collect(),
+            TypeError,
+            "mask length must be the same as the list",
+        ],
+        [
+            L[3, 5],
+            lambda lz: lz.take(-1),
+            ValueError,
+            "cannot take a negative amount of items",
+        ],
+        [
+            L[3, 5],
+            lambda lz: lz.take(3).collect(),
+            ValueError,
+            "cannot take more items than the list contains",
+        ],
+        [
+            L[3, 5],
+            lambda lz: lz.drop(-1),
+            ValueError,
+            "cannot drop a negative amount of items",
+        ],
+        [
+            L[3, 5],
+            lambda lz: lz.drop(3).collect(),
+            ValueError,
+            "cannot drop more items than the list contains",
+        ],
+        [
+            L[3],
+            lambda lz: lz.interleave(0).collect(),
+            ValueError,
+            "list has no gap to be filled",
+        ],
+        [
+            list(),
+            lambda lz: lz.interleave(0).collect(),
+            ValueError,
+            "list has no gap to be filled",
+        ],
+    ],
+)
+def test_lazy_err(prebuild_list, build, exception, message):
+    with pytest.raises(exception, match=message):
+        build(prebuild_list.lazy())
@@ -1,11 +1,13 @@
 # type: ignore
 
+import fractions
 import operator
 import random
 
 import pytest
 
 from magic_list import L
+from magic_list import ListView
 from magic_list import list
 
 from .utils import contains_letter_l
@@ -293,6 +295,99 @@ def test_rotate_err(prebuild_list, args, exception, message):
         prebuild_list.rotate(*args)
 
 
+def test_rotate_large_n():
+    lst = list(range(10))
+
+    assert (
+        lst.rotate(10**12 + 3) == lst.rotate(3) == list((7, 8, 9, 0, 1, 2, 3, 4, 5, 6))
+    )
+    assert lst.rotate(-(10**12) - 3) == lst.rotate(7)
+
+
+def test_storage_access():
+    class Tracked(list):
+        def __init__(self, initlist=None):
+            super().__init__(initlist)
+            self.tag = "tracked"
+
+    lst = Tracked((3, 5, 20, -1))
+    tail = lst.tail
+    copy = lst.copy()
+    copy.append(8)
+
+    assert [*lst] == [3, 5, 20, -1]
+    assert [*reversed(lst)] == [-1, 20, 5, 3]
+    assert lst[::2] == list((3, 20))
+    assert type(tail) is Tracked and tail.tag == "tracked"
+    assert tail.data is not lst.data
+    assert lst == list((3, 5, 20, -1))
+    assert copy.tag == "tracked"
+
+
+def test_rotate_returns_copy():
+    lst = list((3, 5, 20, -1))
+
+    assert lst.rotate(0) is not lst
+    assert lst.rotate(4) is not lst
+
+
+@pytest.mark.parametrize(
+    ["prebuild_list", "args", "result"],
+    [
+        ["list_int_filled", (), list((-1, 3, 5, 20))],
+        ["list_int_filled", (3,), list((5, 20, -1, 3))],
+        ["list_int_filled", (-3,), list((-1, 3, 5, 20))],
+        ["list_int_filled", (4,), list((3, 5, 20, -1))],
+        ["list_int_filled", (-9,), list((5, 20, -1, 3))],
+        ["list_str_filled", (0,), list(("hello", "bonjour", "holá", "ciao"))],
+        ["list_one_int", (7,), list((42,))],
+    ],
+    indirect=["prebuild_list"],
+)
+def test_rotate_inplace_ok(prebuild_list, args, result):
+    assert prebuild_list.rotate_inplace(*args) is None
+    assert prebuild_list == result
+
+
+@pytest.mark.parametrize(
+    ["prebuild_list", "args", "exception", "message"],
+    [
+        ["list_empty", [], TypeError, "empty list cannot be rotated"],
+    ],
+    indirect=["prebuild_list"],
+)
+def test_rotate_inplace_err(prebuild_list, args, exception, message):
+    with pytest.raises(exception, match=message):
+        prebuild_list.rotate_inplace(*args)
+
+
+@pytest.mark.parametrize(
+    ["prebuild_list", "args", "result"],
+    [
+        ["list_int_filled", (), [-1, 3, 5, 20]],
+        ["list_int_filled", (2,), [20, -1, 3, 5]],
+        ["list_int_filled", (-1,), [5, 20, -1, 3]],
+        ["list_int_filled", (10**12,), [3, 5, 20, -1]],
+        ["list_one_int", (3,), [42]],
+    ],
+    indirect=["prebuild_list"],
+)
+def test_irotate_ok(prebuild_list, args, result):
+    assert [*prebuild_list.irotate(*args)] == result
+
+
+@pytest.mark.parametrize(
+    ["prebuild_list", "args", "exception", "message"],
+    [
+        ["list_empty", [], TypeError, "empty list cannot be rotated"],
+    ],
+    indirect=["prebuild_list"],
+)
+def test_irotate_err(prebuild_list, args, exception, message):
+    with pytest.raises(exception, match=message):
+        prebuild_list.irotate(*args)
+
+
 @pytest.mark.parametrize(
     ["prebuild_list", "function", "result"],
     [
@@ -345,12 +440,38 @@ def test_mask_err(prebuild_list, mask_seq, exception, message):
             list(("hello", "world", "goodbye", "bye")),
         ],
         [list(), list()],
+        [list(([3, 5], [2], [3, 5], 2, [2])), list(([3, 5], [2], 2))],
+        [list(({3}, 1, {3}, 1.0, True)), list(({3}, 1))],
+        [list((frozenset({3}), {3}, 1)), list((frozenset({3}), 1))],
+        [list(({3}, frozenset({3}), 1)), list(({3}, 1))],
     ],
 )
 def test_deduplicate_ok(prebuild_list, result):
     assert prebuild_list.deduplicate() == result
 
 
+@pytest.mark.parametrize(
+    ["prebuild_list", "key", "result"],
+    [
+        [
+            list(("hello", "hola", "bonjour", "ciao")),
+            len,
+            list(("hello", "hola", "bonjour")),
+        ],
+        [
+            list(({"id": 3, "v": 5}, {"id": 2, "v": 0}, {"id": 3, "v": 1})),
+            operator.itemgetter("id"),
+            list(({"id": 3, "v": 5}, {"id": 2, "v": 0})),
+        ],
+        [list(((3, 5), (2,), (3, 2))), list, list(((3, 5), (2,), (3, 2)))],
+        [list(((3, 5), (2,), (3, 5))), list, list(((3, 5), (2,)))],
+        [list(), len, list()],
+    ],
+)
+def test_deduplicate_key_ok(prebuild_list, key, result):
+    assert prebuild_list.deduplicate(key=key) == result
+
+
 @pytest.mark.parametrize(
     ["prebuild_list", "function", "result"],
     [
@@ -530,6 +651,45 @@ def test_scan_right_ok(prebuild_list, function, initial_value, result):
     assert prebuild_list.scan_right(function, initial_value) == result
 
 
+def test_scan_long_list():
+    lst = list(range(10_000))
+
+    assert lst.scan(operator.add, 0).last == lst.sum()
+    assert lst.scan_right(operator.sub, 0)[2] == 9998 - (9999 - 0)
+
+
+@pytest.mark.parametrize(
+    ["prebuild_list", "function", "initial_value", "result"],
+    [
+        ["list_int_filled", operator.add, 0, [0, 3, 8, 28, 27]],
+        ["list_int_filled", operator.sub, 0, [0, -3, -8, -28, -27]],
+        ["list_empty", operator.add, 0, [0]],
+    ],
+    indirect=["prebuild_list"],
+)
+def test_iscan_ok(prebuild_list, function, initial_value, result):
+    iterator = prebuild_list.iscan(function, initial_value)
+
+    assert not isinstance(iterator, list)
+    assert [*iterator] == result
+
+
+@pytest.mark.parametrize(
+    ["prebuild_list", "function", "initial_value", "result"],
+    [
+        ["list_int_filled", operator.add, 0, [0, -1, 19, 24, 27]],
+        ["list_int_filled", operator.sub, 0, [0, -1, 21, -16, 19]],
+        ["list_empty", operator.add, 0, [0]],
+    ],
+    indirect=["prebuild_list"],
+)
+def test_iscan_right_ok(prebuild_list, function, initial_value, result):
+    iterator = prebuild_list.iscan_right(function, initial_value)
+
+    assert not isinstance(iterator, list)
+    assert [*iterator] == result
+
+
 @pytest.mark.parametrize(
     ["prebuild_list", "function", "other", "result"],
     [
@@ -581,6 +741,57 @@ def test_flatten_ok():
     assert l0.flatten() == l1.flatten() == l2.flatten() == l0
 
 
+@pytest.mark.parametrize(
+    ["items", "kwargs", "result"],
+    [
+        [[[3, [5, [2]]], [8]], {"depth": 0}, [[3, [5, [2]]], [8]]],
+        [[[3, [5, [2]]], [8]], {"depth": 1}, [3, [5, [2]], 8]],
+        [[[3, [5, [2]]], [8]], {"depth": 2}, [3, 5, [2], 8]],
+        [[[3, [5, [2]]], [8]], {"depth": 5}, [3, 5, 2, 8]],
+        [["hello", [b"world", ("ab",)]], {}, ["hello", b"world", "ab"]],
+        [[(3, 5), [2, (8,)]], {"atomic_types": (tuple,)}, [(3, 5), 2, (8,)]],
+        [["ab", [b"cd"]], {"atomic_types": (str,)}, ["ab", 99, 100]],
+        [[["ab"], "c"], {"atomic_types": ()}, ["a", "b", "c"]],
+        [["", ["a"]], {"atomic_types": ()}, ["a"]],
+        [[["ab"]], {"atomic_types": (), "depth": 1}, ["ab"]],
+        [[list((3, 5)), range(2), {8: None}, (4,)], {}, [3, 5, 0, 1, 8, 4]],
+    ],
+)
+def test_flatten_options_ok(items, kwargs, result):
+    assert list(items).flatten(**kwargs) == list(result)
+    assert [*list(items).iflatten(**kwargs)] == result
+
+
+def test_flatten_shared_and_deep():
+    shared = [3, 5]
+    deep = [2]
+
+    for _ in range(10_000):
+        deep = [deep]
+
+    assert list((shared, shared)).flatten() == list((3, 5, 3, 5))
+    assert list((deep,)).flatten() == list((2,))
+
+
+def test_iflatten_is_lazy():
+    def items():
+        yield [3, 5]
+        raise RuntimeError
+
+    iterator = list((items(),)).iflatten()
+
+    assert next(iterator) == 3
+    assert next(iterator) == 5
+
+    with pytest.raises(RuntimeError):
+        next(iterator)
+
+
+def test_flatten_depth_err():
+    with pytest.raises(ValueError, match="the flattening depth cannot be negative"):
+        list().iflatten(depth=-1)
+
+
 @pytest.mark.parametrize(
     ["recursive_list", "exception", "message"],
     [
@@ -606,6 +817,9 @@ def test_flatten_err(recursive_list, exception, message):
     with pytest.raises(exception, match=message):
         recursive_list.flatten()
 
+    with pytest.raises(exception, match=message):
+        [*recursive_list.iflatten(depth=10)]
+
 
 @pytest.mark.parametrize(
     ["prebuild_list", "result"],
@@ -619,6 +833,55 @@ def test_sum_ok(prebuild_list, result):
     assert prebuild_list.sum() == result
 
 
+@pytest.mark.parametrize(
+    ["items", "kwargs", "result"],
+    [
+        [["hello", " ", "world"], {}, "hello world"],
+        [[b"hello", b" ", b"world"], {}, b"hello world"],
+        [[[3, 5], [], [20]], {}, [3, 5, 20]],
+        [[(3, 5), (), (20,)], {}, (3, 5, 20)],
+        [[list((3, 5)), list((20,))], {}, list((3, 5, 20))],
+        [[0.1] * 10, {}, 1.0],
+        [[0.1] * 10, {"strategy": "reduce"}, 0.9999999999999999],
+        [[0.1] * 10, {"strategy": "builtin"}, sum([0.1] * 10)],
+        [[3, 5.5, 20], {}, 28.5],
+        [[5.5, 3, 20], {}, 28.5],
+        [[3, fractions.Fraction(1, 2)], {}, fractions.Fraction(7, 2)],
+        [[True, True], {}, 2],
+        [["hello", " ", "world"], {"start": ">"}, ">hello world"],
+        [[b"hello"], {"start": b">"}, b">hello"],
+        [[[3, 5], [20]], {"start": [0]}, [0, 3, 5, 20]],
+        [[0.1] * 10, {"start": 1.0}, 2.0],
+        [[3, 5, 20], {"start": 10}, 38],
+        [[3, 5, 20], {"start": 10, "strategy": "reduce"}, 38],
+        [[3, 5, 20], {"strategy": "fsum"}, 28.0],
+        [[[3, 5], [20]], {"strategy": "reduce"}, [3, 5, 20]],
+        [[], {"start": 0}, 0],
+        [[], {"start": "", "strategy": "join"}, ""],
+    ],
+)
+def test_sum_strategies_ok(items, kwargs, result):
+    summed = list(items).sum(**kwargs)
+
+    assert summed == result
+    assert type(summed) is type(result)
+
+
+@pytest.mark.parametrize(
+    ["items", "kwargs", "result"],
+    [
+        [[float("inf"), 1.0], {}, float("inf")],
+        [[1e308, 1e308], {}, float("inf")],
+        [[1e308], {"start": 1e308}, float("inf")],
+        [[float("inf"), float("-inf")], {}, float("nan")],
+        [[float("nan"), 1.0], {}, float("nan")],
+        [[1.0], {"start": float("nan")}, float("nan")],
+    ],
+)
+def test_sum_not_finite(items, kwargs, result):
+    assert list(items).sum(**kwargs) == pytest.approx(result, nan_ok=True)
+
+
 @pytest.mark.parametrize(
     ["prebuild_list", "exception", "message"],
     [
@@ -631,6 +894,25 @@ def test_sum_err(prebuild_list, exception, message):
         prebuild_list.sum()
 
 
+@pytest.mark.parametrize(
+    ["items", "kwargs", "exception", "message"],
+    [
+        [
+            [3, 5],
+            {"strategy": "magic"},
+            ValueError,
+            "unknown summation strategy 'magic'",
+        ],
+        [[], {"strategy": "magic"}, ValueError, "unknown summation strategy 'magic'"],
+        [[3, 5], {"strategy": "join"}, TypeError, "'int' object is not subscriptable"],
+        [[3, "5"], {}, TypeError, "unsupported operand"],
+    ],
+)
+def test_sum_strategies_err(items, kwargs, exception, message):
+    with pytest.raises(exception, match=message):
+        list(items).sum(**kwargs)
+
+
 @pytest.mark.parametrize(
     ["prebuild_list", "result"],
     [
@@ -1188,6 +1470,56 @@ def test_partition_err(prebuild_list, index, exception, message):
         prebuild_list.partition(index)
 
 
+@pytest.mark.parametrize(
+    ["prebuild_list", "call", "result"],
+    [
+        ["list_int_filled", lambda l: l.chunks(3), [[3, 5, 20], [-1]]],
+        ["list_int_filled", lambda l: l.chunks(4), [[3, 5, 20, -1]]],
+        ["list_empty", lambda l: l.chunks(2), []],
+        ["list_int_filled", lambda l: l.windows(3), [[3, 5, 20], [5, 20, -1]]],
+        ["list_int_filled", lambda l: l.windows(1, 2), [[3], [20]]],
+        ["list_int_filled", lambda l: l.windows(5), []],
+        ["list_int_filled", lambda l: l.split_even(3), [[3, 5], [20], [-1]]],
+        ["list_int_filled", lambda l: l.split_even(2), [[3, 5], [20, -1]]],
+        ["list_one_int", lambda l: l.split_even(2), [[42], []]],
+        ["list_empty", lambda l: l.split_even(1), [[]]],
+    ],
+    indirect=["prebuild_list"],
+)
+def test_batches_ok(prebuild_list, call, result):
+    batches = [*call(prebuild_list)]
+
+    assert batches == result
+    assert all(isinstance(batch, ListView) for batch in batches)
+    assert not any(batch.is_materialized for batch in batches)
+
+
+@pytest.mark.parametrize(
+    ["call", "message"],
+    [
+        [lambda l: l.chunks(0), "the chunk size must be positive"],
+        [lambda l: l.windows(0), "the window size must be positive"],
+        [lambda l: l.windows(2, -1), "the window step must be positive"],
+        [lambda l: l.split_even(0), "the number of parts must be positive"],
+    ],
+)
+def test_batches_err(call, message):
+    with pytest.raises(ValueError, match=message):
+        call(L[3, 5, 2])
+
+
+def test_batches_are_views():
+    l = L[3, 5, 2, 8]
+    first, second = l.chunks(2)
+    second.append(13)
+    l[0] = 4
+
+    assert first == [4, 5]
+    assert second == [2, 8, 13]
+    assert l == [4, 5, 2, 8]
+    assert [*l.view().tail.chunks(2)] == [[5, 2], [8]]
+
+
 # *- "combined" tests -* #
 
 
@@ -0,0 +1,84 @@
+# type: ignore
+
+import math
+import random
+
+import pytest
+
+from magic_list import _numpy
+from magic_list import list
+
+pytest.importorskip("numpy")
+
+_RANDOM_SEED = 0
+
+
+@pytest.fixture(autouse=True)
+def small_threshold(monkeypatch):
+    monkeypatch.setattr(_numpy, "THRESHOLD", 4)
+
+
+def pure(build, monkeypatch):
+    """
+    Run `build` with the NumPy kernels disabled.
+    """
+
+    with monkeypatch.context() as context:
+        context.setattr(_numpy, "THRESHOLD", math.inf)
+
+        return build()
+
+
+@pytest.mark.parametrize(
+    ["items", "expected"],
+    [
+        [[3, 5, 20, -1], True],
+        [[3.5, 5.0, -0.0, 0.0], True],
+        [[3, 5, 20], False],
+        [[3, 5.0, 20, -1], False],
+        [[3, 5, True, -1], False],
+        [[3, 5, 2**70, -1], False],
+        [["a", "b", "c", "d"], False],
+    ],
+)
+def test_as_array(items, expected):
+    assert (_numpy.as_array(items) is not None) is expected
+
+
+@pytest.mark.parametrize(
+    "items",
+    [
+        [3, 5, 20, -1, 5, 20],
+        [3.5, 0.1, 0.2, -0.0, 0.0, 1e16, 1.0, -1e16],
+        [2**61, 2**61, 2**61, 2**61, 2**61],
+        [float("nan"), 3.0, -1.0, 5.0],
+        [3, 5.0, 20, -1],
+    ],
+)
+@pytest.mark.parametrize(
+    "operation",
+    [
+        lambda l: l.sorted(),
+        lambda l: l.sorted(reverse=True),
+        lambda l: l.sorted(key=abs),
+    ],
+)
+def test_same_results(items, operation, monkeypatch):
+    expected = pure(lambda: operation(list(items)), monkeypatch)
+    result = operation(list(items))
+
+    assert repr(result) == repr(expected)
+    assert type(result) is type(expected)
+
+
+def test_shuffled():
+    items = list(range(100))
+
+    random.seed(_RANDOM_SEED)
+    shuffled = items.shuffled()
+    random.seed(_RANDOM_SEED)
+
+    assert shuffled == items.shuffled()
+    assert shuffled != items
+    assert shuffled.sorted() == items
+    assert all(type(item) is int for item in shuffled)
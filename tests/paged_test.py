@@ -0,0 +1,343 @@
+# type: ignore
+
+import concurrent.futures
+import copy
+import gc
+import operator
+import pickle
+import random
+
+import pytest
+
+from magic_list import L
+from magic_list import PagedList
+from magic_list import SortedList
+from magic_list import list
+
+from .utils import double
+from .utils import greater_than_four
+
+
+@pytest.fixture
+def paged(tmp_path):
+    return list(range(10)).paged(page_size=2, cache_size=2, directory=tmp_path)
+
+
+def _pages(l):
+    # files of the pages that were written to disk
+    return [*l.data._path(0).parent.iterdir()]
+
+
+def test_paged(paged, tmp_path):
+    assert isinstance(paged, PagedList)
+    assert paged == [*range(10)]
+    assert (paged.page_size, paged.cache_size) == (2, 2)
+    assert repr(paged) == repr([*range(10)])
+    assert len(paged.data._ids) == 5
+    assert [*tmp_path.iterdir()] == [paged.data._path(0).parent]
+
+
+@pytest.mark.parametrize(
+    ["initlist", "result"],
+    [
+        [None, []],
+        [(), []],
+        [range(5), [*range(5)]],
+        [L[3, 5, 2], [3, 5, 2]],
+        [(n for n in range(5)), [*range(5)]],
+    ],
+)
+def test_constructor(initlist, result):
+    assert PagedList(initlist) == result
+
+
+@pytest.mark.parametrize(
+    ["options", "message"],
+    [
+        [{"page_size": 0}, "the page size must be positive"],
+        [{"cache_size": -1}, "the cache size must be positive"],
+    ],
+)
+def test_paged_err(options, message):
+    with pytest.raises(ValueError, match=message):
+        L[3, 5, 2].paged(**options)
+
+
+def test_memory_is_bounded(paged):
+    paged.extend(range(10, 100))
+
+    assert sum(paged) == sum(range(100))
+    assert len(paged.data._cache) == 2
+    assert len(_pages(paged)) >= 48
+
+
+def test_directory_is_removed():
+    paged = PagedList(range(10), page_size=2, cache_size=2)
+    directory = paged.data._path(0).parent
+
+    assert directory.exists()
+
+    del paged
+    gc.collect()
+
+    assert not directory.exists()
+
+
+@pytest.mark.parametrize(
+    ["call", "result"],
+    [
+        [lambda l: l[0], 0],
+        [lambda l: l[-1], 9],
+        [lambda l: l[5], 5],
+        [lambda l: l.head, 0],
+        [lambda l: l.last, 9],
+        [lambda l: 5 in l, True],
+        [lambda l: 10 in l, False],
+        [lambda l: l.index(5), 5],
+        [lambda l: l.index(5, -6, -4), 5],
+        [lambda l: l.count(5), 1],
+        [lambda l: l[3:7], [3, 4, 5, 6]],
+        [lambda l: l[7:3], []],
+        [lambda l: l[::3], [0, 3, 6, 9]],
+        [lambda l: l[::-4], [9, 5, 1]],
+        [lambda l: l.take(3), [0, 1, 2]],
+        [lambda l: l.tail.init, [*range(1, 9)]],
+        [lambda l: l.select([9, 0, 9]), [9, 0, 9]],
+        [lambda l: l.fold(operator.add, 0), 45],
+        [lambda l: (l.sum(), l.mean(), l.min(), l.max()), (45, 4.5, 0, 9)],
+    ],
+)
+def test_reads(paged, call, result):
+    assert call(paged) == result
+
+
+@pytest.mark.parametrize(
+    ["call", "exception", "message"],
+    [
+        [lambda l: l[10], IndexError, "list index out of range"],
+        [lambda l: l[-11], IndexError, "list index out of range"],
+        [lambda l: l.index(10), ValueError, "10 is not in list"],
+        [lambda l: l.index(5, 6), ValueError, "5 is not in list"],
+        [lambda l: l.clear() or l.pop(), IndexError, "pop from empty list"],
+        [lambda l: l.remove(10), ValueError, "10 is not in list"],
+        [lambda l: l.mask([True]), TypeError, "mask length must be the same"],
+        [lambda l: l.merge(operator.add, [1]), TypeError, "length of the two"],
+    ],
+)
+def test_errors(paged, call, exception, message):
+    with pytest.raises(exception, match=message):
+        call(paged)
+
+
+def test_extended_slice_err(paged):
+    with pytest.raises(ValueError, match="extended slice of size 5"):
+        paged[::2] = [1, 2]
+
+
+@pytest.mark.parametrize(
+    ["mutation", "result"],
+    [
+        [lambda l: l.append(10), [*range(11)]],
+        [lambda l: l.prepend(-1), [-1, *range(10)]],
+        [lambda l: l.insert(3, -1), [0, 1, 2, -1, *range(3, 10)]],
+        [lambda l: l.insert(-20, -1), [-1, *range(10)]],
+        [lambda l: l.insert(20, -1), [*range(10), -1]],
+        [lambda l: l.pop(3), [0, 1, 2, *range(4, 10)]],
+        [lambda l: l.pop(), [*range(9)]],
+        [lambda l: l.remove(0), [*range(1, 10)]],
+        [lambda l: l.__setitem__(-1, 90), [*range(9), 90]],
+        [lambda l: l.__setitem__(slice(2, 8), [-1]), [0, 1, -1, 8, 9]],
+        [lambda l: l.__setitem__(slice(2, 2), [-1]), [0, 1, -1, *range(2, 10)]],
+        [
+            lambda l: l.__setitem__(slice(None, None, 4), [-1] * 3),
+            [-1, 1, 2, 3, -1, 5, 6, 7, -1, 9],
+        ],
+        [lambda l: l.__setitem__(slice(None), l), [*range(10)]],
+        [lambda l: l.__delitem__(0), [*range(1, 10)]],
+        [lambda l: l.__delitem__(slice(1, None, 2)), [0, 2, 4, 6, 8]],
+        [lambda l: l.__delitem__(slice(3, 3)), [*range(10)]],
+        [lambda l: l.extend(l), [*range(10)] * 2],
+        [lambda l: l.extend([]), [*range(10)]],
+        [lambda l: l.clear(), []],
+        [lambda l: l.reverse(), [*range(9, -1, -1)]],
+        [lambda l: l.sort(key=lambda n: n % 3), [0, 3, 6, 9, 1, 4, 7, 2, 5, 8]],
+        [lambda l: l.sort(reverse=True), [*range(9, -1, -1)]],
+        [lambda l: l.rotate_inplace(3), [7, 8, 9, *range(7)]],
+        [lambda l: l.__iadd__([10]), [*range(11)]],
+        [lambda l: l.__imul__(2), [*range(10)] * 2],
+        [lambda l: l.__imul__(0), []],
+    ],
+)
+def test_mutations(paged, mutation, result):
+    mutation(paged)
+
+    assert paged == result
+    assert len(paged) == len(result)
+    assert [paged[i] for i in range(len(result))] == result
+    assert len(paged.data._cache) <= 2
+
+
+def test_insert_splits_pages(paged):
+    for n in range(10):
+        paged.insert(1, -n)
+
+    assert paged == [0, *range(-9, 1), *range(1, 10)]
+    assert max(paged.data._lengths) <= 4
+
+
+@pytest.mark.parametrize(
+    ["call", "result"],
+    [
+        [lambda l: l.map(double), [*range(0, 20, 2)]],
+        [lambda l: l.filter(greater_than_four), [*range(5, 10)]],
+        [lambda l: l.mask([True, False] * 5), [*range(0, 10, 2)]],
+        [lambda l: (l + l).deduplicate(), [*range(10)]],
+        [lambda l: l.deduplicate(key=lambda n: n // 3), [0, 3, 6, 9]],
+        [lambda l: l.scan(operator.add, 0), [0, 0, 1, 3, 6, 10, 15, 21, 28, 36, 45]],
+        [
+            lambda l: l.scan_right(operator.add, 0),
+            [0, 9, 17, 24, 30, 35, 39, 42, 44, 45, 45],
+        ],
+        [lambda l: l.merge(operator.sub, [*range(10)]), [0] * 10],
+        [lambda l: l.reversed(), [*range(9, -1, -1)]],
+        [lambda l: l.sorted(key=lambda n: -n), [*range(9, -1, -1)]],
+        [lambda l: l.shuffled().sorted(), [*range(10)]],
+        [lambda l: l.rotate(2), [8, 9, *range(8)]],
+        [lambda l: l[2:4], [2, 3]],
+        [lambda l: l.copy(), [*range(10)]],
+        [lambda l: l + [10], [*range(11)]],
+        [lambda l: [-1] + l, [-1, *range(10)]],
+        [lambda l: l * 2, [*range(10)] * 2],
+        [lambda l: l.fill_left(-1, 2), [-1, -1, *range(10)]],
+    ],
+)
+def test_results_are_paged(paged, call, result):
+    paged_result = call(paged)
+
+    assert isinstance(paged_result, PagedList)
+    assert paged_result == result
+    assert (paged_result.page_size, paged_result.cache_size) == (2, 2)
+    assert paged_result.data.directory == paged.data.directory
+
+
+@pytest.mark.parametrize("executor", [concurrent.futures.ThreadPoolExecutor])
+def test_results_are_paged_executor(paged, executor):
+    with executor(max_workers=2) as pool:
+        mapped = paged.map(double, executor=pool)
+        filtered = paged.filter(greater_than_four, executor=pool)
+
+    assert mapped == [*range(0, 20, 2)]
+    assert filtered == [*range(5, 10)]
+    assert mapped.page_size == filtered.page_size == 2
+
+
+def test_sorted_keep_sorted(paged):
+    assert isinstance(paged.sorted(keep_sorted=True), SortedList)
+
+
+def test_sorted_is_stable():
+    items = [(random.randrange(5), n) for n in range(200)]
+    paged = PagedList(items, page_size=3, cache_size=2)
+
+    assert paged.sorted(key=operator.itemgetter(0)) == sorted(
+        items,
+        key=operator.itemgetter(0),
+    )
+    assert paged.sorted(key=operator.itemgetter(0), reverse=True) == sorted(
+        items,
+        key=operator.itemgetter(0),
+        reverse=True,
+    )
+
+
+@pytest.mark.parametrize("size", [0, 6, 200])
+def test_shuffled(size):
+    paged = PagedList(range(size), page_size=3, cache_size=2)
+    shuffled = paged.shuffled()
+
+    assert isinstance(shuffled, PagedList)
+    assert sorted(shuffled) == [*range(size)]
+
+
+@pytest.mark.parametrize(
+    ["other", "equal", "lower"],
+    [
+        [[*range(10)], True, False],
+        [[*range(11)], False, True],
+        [[*range(9)], False, False],
+        [[0, 1, 3], False, True],
+        [[0, 1, 1], False, False],
+        [PagedList(range(10)), True, False],
+        [L[0:10], True, False],
+    ],
+)
+def test_comparisons(paged, other, equal, lower):
+    assert (paged == other) is equal
+    assert (paged != other) is not equal
+    assert (paged < other) is lower
+    assert (paged <= other) is (lower or equal)
+    assert (paged > other) is not (lower or equal)
+    assert (paged >= other) is not lower
+
+
+def test_comparisons_other_types(paged):
+    assert paged != (0, 1)
+    assert paged.data.__eq__(3) is NotImplemented
+    assert paged.data.__lt__(3) is NotImplemented
+
+    with pytest.raises(TypeError):
+        paged < 3  # noqa: B015
+
+
+def test_pickle(paged):
+    result = pickle.loads(pickle.dumps(paged))
+
+    assert isinstance(result, PagedList)
+    assert result == paged
+    assert (result.page_size, result.cache_size) == (2, 2)
+    assert pickle.loads(pickle.dumps(paged.data)) == paged
+    assert copy.deepcopy(paged) == paged
+
+
+def test_against_builtin_list():
+    rng = random.Random(0)
+    paged = PagedList(page_size=3, cache_size=2)
+    items = []
+
+    for _ in range(500):
+        size = len(items)
+        start, stop = rng.randint(-size - 1, size + 1), rng.randint(-size - 1, size + 1)
+        value = rng.random()
+        operation = rng.randrange(8)
+
+        if operation == 0:
+            paged.append(value)
+            items.append(value)
+        elif operation == 1:
+            paged.insert(start, value)
+            items.insert(start, value)
+        elif operation == 2 and items:
+            assert paged.pop(start % size) == items.pop(start % size)
+        elif operation == 3 and items:
+            paged[start % size] = items[start % size] = value
+        elif operation == 4:
+            step = rng.choice([None, 2, -1, -3])
+
+            assert paged[start:stop:step] == items[start:stop:step]
+
+            del paged[start:stop:step]
+            del items[start:stop:step]
+        elif operation == 5:
+            values = [rng.random() for _ in range(rng.randrange(8))]
+            paged[start:stop] = items[start:stop] = values
+        elif operation == 6:
+            values = [rng.random() for _ in range(rng.randrange(10))]
+            paged.extend(values)
+            items.extend(values)
+        elif operation == 7 and rng.random() < 0.1:
+            paged.sort()
+            items.sort()
+
+        assert paged == items
+        assert [paged[i] for i in range(-len(items), len(items))] == items * 2
+        assert len(paged.data._cache) <= 2
@@ -0,0 +1,239 @@
+# type: ignore
+
+import concurrent.futures
+import functools
+import operator
+import threading
+
+import pytest
+
+from magic_list import TypedList
+from magic_list import _parallel
+from magic_list import deque
+from magic_list import list
+
+from .utils import double
+from .utils import greater_than_four
+
+
+@pytest.fixture(scope="module")
+def threads():
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        yield executor
+
+
+@pytest.fixture(scope="module")
+def processes():
+    with concurrent.futures.ProcessPoolExecutor(max_workers=2) as executor:
+        yield executor
+
+
+@pytest.mark.parametrize("chunksize", [None, 1, 3, 1000])
+def test_map_threads_ok(threads, chunksize):
+    items = list(range(100))
+    mapped = items.map(double, executor=threads, chunksize=chunksize)
+
+    assert mapped == items.map(double)
+    assert type(mapped) is list
+
+
+@pytest.mark.parametrize("chunksize", [None, 1, 3, 1000])
+def test_filter_threads_ok(threads, chunksize):
+    items = list(range(100))
+    filtered = items.filter(greater_than_four, executor=threads, chunksize=chunksize)
+
+    assert filtered == items.filter(greater_than_four)
+    assert type(filtered) is list
+
+
+def test_map_filter_processes_ok(processes):
+    items = list(range(50))
+
+    assert items.map(double, executor=processes) == items.map(double)
+    assert items.filter(greater_than_four, executor=processes) == items.filter(
+        greater_than_four,
+    )
+
+
+def test_unordered(threads):
+    items = list(range(100))
+
+    mapped = items.map(double, executor=threads, chunksize=7, ordered=False)
+    filtered = items.filter(
+        greater_than_four,
+        executor=threads,
+        chunksize=7,
+        ordered=False,
+    )
+
+    assert mapped.sorted() == items.map(double)
+    assert filtered.sorted() == items.filter(greater_than_four)
+
+
+def test_runs_concurrently(threads):
+    barrier = threading.Barrier(2, timeout=5)
+
+    def wait(n):
+        barrier.wait()
+        return n
+
+    # would time out if the two chunks were processed one after the other
+    assert list((3, 5)).map(wait, executor=threads, chunksize=1) == list((3, 5))
+
+
+def test_empty(threads):
+    assert list().map(double, executor=threads) == list()
+    assert list().filter(greater_than_four, executor=threads) == list()
+
+
+@pytest.mark.parametrize(
+    ["build", "result"],
+    [
+        [lambda e: deque((3, 5, 20)).map(double, executor=e), deque((6, 10, 40))],
+        [
+            lambda e: TypedList((3, 5, 20), "i").map(double, executor=e),
+            TypedList((6, 10, 40), "i"),
+        ],
+        [
+            lambda e: TypedList((3, 5, 20), "i").filter(greater_than_four, executor=e),
+            TypedList((5, 20), "i"),
+        ],
+    ],
+)
+def test_subclasses(threads, build, result):
+    built = build(threads)
+
+    assert built == result
+    assert type(built) is type(result)
+
+
+def test_chunksize_err(threads):
+    with pytest.raises(ValueError, match="chunk size must be positive"):
+        list((3, 5)).map(double, executor=threads, chunksize=0)
+
+
+def test_failure_cancels_pending_chunks():
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def fail(n):
+        calls.append(n)
+
+        if n == 0:
+            started.wait(timeout=5)
+            msg = "boom"
+            raise RuntimeError(msg)
+
+        started.set()
+        release.wait(timeout=5)
+        return n
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        with pytest.raises(RuntimeError, match="boom"):
+            list(range(10)).map(fail, executor=executor, chunksize=1)
+
+        release.set()
+
+    # each worker may have started one more chunk before the cancellation
+    assert len(calls) <= 3
+
+
+@pytest.mark.parametrize(
+    "items",
+    [[3], [3, 5], [3, 5, 20], list(range(1, 100))],
+)
+@pytest.mark.parametrize(
+    "function",
+    [operator.add, operator.mul, operator.concat, operator.or_],
+)
+def test_tree_reduce_ok(items, function):
+    if function is operator.concat:
+        items = [[item] for item in items]
+    elif function is operator.or_:
+        items = [{item} for item in items]
+
+    assert _parallel.tree_reduce(function, items) == functools.reduce(function, items)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"associative": True},
+        {"associative": True, "workers": 2},
+        {"associative": True, "executor": "threads"},
+        {"associative": True, "executor": "processes"},
+    ],
+)
+def test_reduce_fold_sum_associative(kwargs, threads, processes):
+    executors = {"threads": threads, "processes": processes}
+    kwargs = {
+        key: executors.get(value, value) if key == "executor" else value
+        for key, value in kwargs.items()
+    }
+    items = list(range(1000))
+    words = list(("hello", " ", "world", "!"))
+
+    assert items.reduce(operator.add, **kwargs) == items.reduce(operator.add)
+    assert words.reduce(operator.add, **kwargs) == "hello world!"
+    assert items.fold(operator.add, 7, **kwargs) == items.fold(operator.add, 7)
+    assert list().fold(operator.add, 7, **kwargs) == 7
+    assert items.sum(**kwargs) == items.sum()
+    assert TypedList(items).sum(**kwargs) == items.sum()
+
+
+def test_sum_associative_float():
+    items = list((0.1,)) * 10
+
+    assert items.sum(strategy="reduce") == 0.9999999999999999
+    assert items.sum(associative=True) == 1.0
+    assert TypedList(items).sum(associative=True) == 1.0
+
+
+def test_sum_associative_start(threads):
+    items = list(([3], [5], [20]))
+
+    assert items.sum(start=[0], associative=True, executor=threads) == [0, 3, 5, 20]
+
+
+def test_reduce_does_not_reorder(threads):
+    items = list(map(str, range(200)))
+
+    assert items.reduce(operator.add, associative=True, executor=threads) == (
+        "".join(items)
+    )
+
+
+@pytest.mark.parametrize(
+    ["call", "message"],
+    [
+        [
+            lambda l, e: l.reduce(operator.add, workers=2),
+            "parallel reduction requires an associative function",
+        ],
+        [
+            lambda l, e: l.fold(operator.add, 0, executor=e),
+            "parallel reduction requires an associative function",
+        ],
+        [
+            lambda l, e: l.sum(executor=e),
+            "parallel reduction requires an associative function",
+        ],
+        [
+            lambda l, e: l.sum(associative=True, workers=2, executor=e),
+            "cannot use both workers and an executor",
+        ],
+        [
+            lambda l, e: l.sum(associative=True, strategy="builtin"),
+            "the 'builtin' strategy cannot be parallelized",
+        ],
+    ],
+)
+def test_reduce_mode_err(threads, call, message):
+    with pytest.raises(ValueError, match=message):
+        call(list((3, 5)), threads)
+
+
+def test_reduce_empty_err(threads):
+    with pytest.raises(TypeError, match="the list to reduce cannot be empty"):
+        list().reduce(operator.add, associative=True, executor=threads)
@@ -0,0 +1,167 @@
+# type: ignore
+
+import copy
+import pickle
+import sys
+
+import pytest
+
+from magic_list import L
+from magic_list import ListView
+from magic_list import RangeList
+from magic_list import list
+
+
+@pytest.fixture
+def huge():
+    return L[0 : 10**15 : 3]
+
+
+def test_range_huge_sum(huge):
+    assert huge.sum() == 166_666_666_666_666_833_333_333_333_333
+
+
+def test_range_literal(huge):
+    assert isinstance(L[2:7], RangeList)
+    assert isinstance(L[2:7], list)
+    assert L[2:7] == list((2, 3, 4, 5, 6))
+    assert L[2:7].range == range(2, 7)
+    assert huge.range == range(0, 10**15, 3)
+    assert repr(L[1:9:2]) == "[1, 3, 5, 7]"
+    assert sys.getsizeof(huge.data) < 100
+
+
+def test_range_read_api(huge):
+    assert len(huge) == 333_333_333_333_334
+    assert huge[1] == 3
+    assert huge[-1] == 999_999_999_999_999
+    assert huge.head == 0
+    assert huge.last == 999_999_999_999_999
+    assert 999_999_999_999_999 in huge
+    assert 10 not in huge
+    assert 3.0 in huge
+    assert 3.5 not in huge
+    assert "hello" not in L[0:3]
+    assert L[3:0:-1].index(2) == 1
+    assert [*L[0:3]] == [0, 1, 2]
+    assert [*reversed(L[0:3])] == [2, 1, 0]
+
+
+@pytest.mark.parametrize(
+    ["build", "result"],
+    [
+        [lambda r: r[10:13], range(30, 39, 3)],
+        [lambda r: r[::-1][:2], range(999_999_999_999_999, 999_999_999_999_993, -3)],
+        [lambda r: r.tail.take(2), range(3, 9, 3)],
+        [
+            lambda r: r.init.take_right(1),
+            range(999_999_999_999_996, 999_999_999_999_999, 3),
+        ],
+        [lambda r: r.drop(2).drop_right(333_333_333_333_330), range(6, 12, 3)],
+        [lambda r: r.slice(1, 2), range(3, 9, 3)],
+        [
+            lambda r: r.reversed().take(2),
+            range(999_999_999_999_999, 999_999_999_999_993, -3),
+        ],
+        [lambda r: r.partition(1)[2].take(1), range(6, 9, 3)],
+        [lambda r: r.take(0), range(0)],
+    ],
+)
+def test_range_slicing_is_lazy(huge, build, result):
+    items = build(huge)
+
+    assert isinstance(items, RangeList)
+    assert items.range == result
+    assert items == list(result)
+
+
+@pytest.mark.parametrize(
+    ["items", "method", "result"],
+    [
+        [L[1:101], RangeList.sum, 5050],
+        [L[0:1000:3], RangeList.sum, 166_833],
+        [L[10:0:-3], RangeList.sum, 22],
+        [L[1:101], RangeList.mean, 50.5],
+        [L[10:0:-3], RangeList.mean, 5.5],
+        [L[10:0:-3], RangeList.min, 1],
+        [L[10:0:-3], RangeList.max, 10],
+        [L[0:5], RangeList.min, 0],
+        [L[0:5], RangeList.max, 4],
+    ],
+)
+def test_range_closed_forms(items, method, result):
+    assert method(items) == result
+
+    items.materialize()
+
+    assert method(items) == result
+
+
+def test_range_sum_options():
+    assert L[0:5].sum(start=10) == 20
+    assert L[0:0].sum(start=10) == 10
+    assert L[0:5].sum(strategy="reduce") == 10
+    assert L[0:5].sum(associative=True) == 10
+
+    with pytest.raises(ValueError, match="requires an associative function"):
+        L[0:5].sum(workers=2)
+
+
+@pytest.mark.parametrize(
+    ["method", "message"],
+    [
+        [RangeList.sum, "cannot perform summation on an empty list"],
+        [RangeList.mean, "cannot calculate mean of empty list"],
+        [RangeList.min, "empty list has no minimum"],
+        [RangeList.max, "empty list has no maximum"],
+    ],
+)
+def test_range_empty_err(method, message):
+    with pytest.raises(TypeError, match=message):
+        method(L[5:5])
+
+
+@pytest.mark.parametrize(
+    ["mutate", "result"],
+    [
+        [lambda r: r.append(5), list((0, 1, 2, 5))],
+        [lambda r: r.__setitem__(0, 5), list((5, 1, 2))],
+        [lambda r: r.reverse(), list((2, 1, 0))],
+        [lambda r: r.clear(), list()],
+    ],
+)
+def test_range_copy_on_write(mutate, result):
+    items = L[0:3]
+    mutate(items)
+
+    assert items.is_materialized
+    assert items.range is None
+    assert items == result
+    assert (5 in items) == (5 in result)
+    assert items.reversed() == result.reversed()
+
+
+def test_range_drives_selection():
+    items = list("abcdefgh")
+
+    assert items.select(L[1:8:3]) == list("beh")
+    assert items.mask(L[0:8].map(lambda n: n % 2 == 0)) == list("aceg")
+
+
+def test_range_copy_and_pickle(huge):
+    for items in (copy.copy(huge), pickle.loads(pickle.dumps(huge))):
+        assert isinstance(items, RangeList)
+        assert items.range == huge.range
+
+    items = L[0:3]
+    items.append(3)
+    items = pickle.loads(pickle.dumps(items))
+
+    assert items == list((0, 1, 2, 3))
+    assert items.is_materialized
+
+
+def test_range_from_iterable():
+    assert RangeList(range(3)).range == range(3)
+    assert RangeList([0, 1]).range is None
+    assert ListView(L[0:3].data) == list((0, 1, 2))
@@ -0,0 +1,291 @@
+# type: ignore
+
+import concurrent.futures
+import gc
+import multiprocessing
+import pickle
+import weakref
+from multiprocessing import shared_memory
+
+import pytest
+
+from magic_list import L
+from magic_list import SharedList
+from magic_list import TypedList
+from magic_list import deque
+from magic_list import list
+from magic_list import _shared
+
+from .utils import double_first
+
+
+@pytest.fixture
+def shared(request):
+    shared = list(request.param).to_shared()
+
+    yield shared
+
+    shared.close()
+    shared.unlink()
+
+
+@pytest.fixture
+def raw_block(request):
+    block = shared_memory.SharedMemory(create=True, size=request.param)
+
+    yield block
+
+    block.close()
+    block.unlink()
+
+
+@pytest.mark.parametrize(
+    "l",
+    [
+        list((3, 5, 20, -1)),
+        list((3.5, -0.0, float("inf"))),
+        list(),
+        deque((3, 5, 2)),
+        L[3, 5, 2].view().tail,
+        L[0:10:3],
+        TypedList([3, 5, 2], "b"),
+        TypedList([3.5, 2.0], "f"),
+    ],
+)
+def test_round_trip(l):
+    with l.to_shared() as shared, list.attach_shared(shared.name) as other:
+        assert shared == [*l]
+        assert other == [*l]
+        assert isinstance(other, SharedList)
+        assert not other.is_materialized
+        shared.unlink()
+
+
+def test_to_shared_name():
+    name = "magic_list_shared_test"
+
+    with L[3, 5, 2].to_shared(name) as shared:
+        assert shared.name == name
+        assert repr(shared) == f"SharedList([3, 5, 2], name={name!r})"
+        assert SharedList.attach(name) == [3, 5, 2]
+        shared.unlink()
+
+
+@pytest.mark.parametrize(
+    ["l", "exception", "message"],
+    [
+        [L[3, 5.0], TypeError, "only lists of int or float can be shared"],
+        [L[True, False], TypeError, "only lists of int or float can be shared"],
+        [L["hello"], TypeError, "only lists of int or float can be shared"],
+        [L[2**64], ValueError, "do not fit in 64 bits"],
+    ],
+)
+def test_to_shared_err(l, exception, message):
+    with pytest.raises(exception, match=message):
+        l.to_shared()
+
+
+@pytest.mark.parametrize("raw_block", [1, 64], indirect=True)
+def test_attach_shared_err(raw_block):
+    with pytest.raises(ValueError, match="does not hold a magic list"):
+        list.attach_shared(raw_block.name)
+
+
+def test_attach_shared_missing():
+    with pytest.raises(FileNotFoundError):
+        list.attach_shared("magic_list_missing_block")
+
+
+@pytest.mark.parametrize("shared", [[3, 5, 2, 8]], indirect=True)
+def test_slices_are_views(shared):
+    for result in (shared[1:], shared.take(2), shared.drop(1), shared[::-2]):
+        assert isinstance(result, SharedList)
+        assert not result.is_materialized
+        assert result.name == shared.name
+
+    assert shared[::-2] == [8, 5]
+    assert shared[::-1].sum() == 18
+    assert shared.tail.mean() == 5
+    assert shared[::-1].take(2).max() == 8
+
+
+@pytest.mark.parametrize("shared", [[3, 5, 2]], indirect=True)
+def test_read_only(shared):
+    with list.attach_shared(shared.name) as other:
+        assert not other.is_writable
+        assert other.select([2, 0]) == [2, 3]
+        assert other.mask([True, False, True]) == [3, 2]
+
+        other[0] = 4
+
+        assert other.is_materialized
+        assert not other.is_writable
+        assert other == [4, 5, 2]
+        assert shared == [3, 5, 2]
+
+
+@pytest.mark.parametrize("shared", [[3, 5, 2]], indirect=True)
+def test_writable(shared):
+    with list.attach_shared(shared.name, writable=True) as other:
+        other[0] = 2
+        double_first(other)
+        other[::-2] = [20, 40]
+
+        assert not other.is_materialized
+        assert shared == [40, 5, 20]
+
+        with pytest.raises(ValueError, match="cannot be resized"):
+            other[1:] = [1]
+
+        with pytest.raises(TypeError):
+            other[0] = 3.5
+
+        other.append(7)
+
+        assert other == [40, 5, 20, 7]
+        assert shared == [40, 5, 20]
+
+
+@pytest.mark.parametrize(
+    ["shared", "total", "mean", "minimum", "maximum"],
+    [
+        [[3, 5, 2], 10, 10 / 3, 2, 5],
+        [[0.1] * 10, 1.0, 0.1, 0.1, 0.1],
+    ],
+    indirect=["shared"],
+)
+def test_aggregates(shared, total, mean, minimum, maximum):
+    assert shared.sum() == total
+    assert shared.mean() == pytest.approx(mean)
+    assert shared.min() == minimum
+    assert shared.max() == maximum
+    assert shared.sum(start=1) == total + 1
+    assert shared.sum(strategy="reduce") == pytest.approx(total)
+
+
+@pytest.mark.parametrize(
+    ["shared", "total"],
+    [
+        [[1e308, 1e308], float("inf")],
+        [[float("inf"), float("-inf")], float("nan")],
+    ],
+    indirect=["shared"],
+)
+def test_sum_not_finite(shared, total):
+    assert shared.sum() == pytest.approx(total, nan_ok=True)
+
+
+@pytest.mark.parametrize("shared", [[]], indirect=True)
+def test_aggregates_empty(shared):
+    assert shared.sum(start=0) == 0
+
+    with pytest.raises(TypeError, match="empty list"):
+        shared.sum()
+
+    with pytest.raises(TypeError, match="empty list"):
+        shared.mean()
+
+    with pytest.raises(TypeError, match="no minimum"):
+        shared.min()
+
+    with pytest.raises(TypeError, match="no maximum"):
+        shared.max()
+
+
+@pytest.mark.parametrize("shared", [[3, 5, 2]], indirect=True)
+def test_aggregates_materialized(shared):
+    view = shared[:]
+    view.append(10)
+
+    assert (view.sum(), view.mean(), view.min(), view.max()) == (20, 5, 2, 10)
+
+
+@pytest.mark.parametrize("shared", [list(range(1000))], indirect=True)
+def test_pickle_sends_the_name(shared):
+    data = pickle.dumps(shared[10:20])
+
+    assert len(data) < 200
+
+    with pickle.loads(data) as result:  # noqa: S301
+        assert result == list(range(10, 20))
+        assert result.name == shared.name
+        assert result.is_writable
+
+    with list.attach_shared(shared.name) as other:
+        with pickle.loads(pickle.dumps(other)) as result:  # noqa: S301
+            assert not result.is_writable
+
+
+@pytest.mark.parametrize("shared", [[3, 5, 2]], indirect=True)
+def test_pickle_materialized(shared):
+    view = shared[:]
+    view.append(7)
+
+    assert pickle.loads(pickle.dumps(view)) == [3, 5, 2, 7]  # noqa: S301
+    assert pickle.loads(pickle.dumps(SharedList([3, 5]))) == [3, 5]  # noqa: S301
+
+
+@pytest.mark.parametrize("shared", [[3, 5, 2]], indirect=True)
+def test_other_processes(shared):
+    context = multiprocessing.get_context("spawn")
+
+    with concurrent.futures.ProcessPoolExecutor(1, mp_context=context) as executor:
+        assert executor.submit(sum, shared).result() == 10
+
+        with list.attach_shared(shared.name, writable=True) as other:
+            executor.submit(double_first, other).result()
+
+    # the block outlives the processes that attached it
+    with list.attach_shared(shared.name) as other:
+        assert other == [6, 5, 2]
+
+
+@pytest.mark.parametrize("items", [SharedList([3, 5, 2]), SharedList.over([3, 5, 2])])
+def test_not_shared(items):
+    assert items.name is None
+    assert not items.is_writable
+    assert items.sum() == 10
+
+    items.close()
+    items.unlink()
+
+
+@pytest.mark.parametrize("shared", [[3, 5, 2]], indirect=True)
+def test_close(shared):
+    other = list.attach_shared(shared.name)
+    tail = other.tail
+
+    with other:
+        pass
+
+    with pytest.raises(ValueError, match="released"):
+        tail.sum()
+
+
+@pytest.mark.parametrize("shared", [[3, 5, 2]], indirect=True)
+def test_iterator_outlives_the_list(shared):
+    iterator = iter(list.attach_shared(shared.name))
+    gc.collect()
+
+    assert next(iterator) == 3
+
+
+@pytest.mark.parametrize("shared", [[3, 5, 2]], indirect=True)
+def test_slice_outlives_the_list(shared):
+    tail = list.attach_shared(shared.name).tail
+    gc.collect()
+
+    assert tail.sum() == 7
+    assert tail == [5, 2]
+
+
+@pytest.mark.parametrize("shared", [[3, 5, 2]], indirect=True)
+def test_close_at_exit(shared):
+    # the items are still referenced when the interpreter exits
+    other = list.attach_shared(shared.name)
+    segment = other._segment
+
+    _shared._close(segment.memory, weakref.ref(segment.items))
+
+    with pytest.raises(ValueError, match="released"):
+        other.sum()
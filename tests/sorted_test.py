@@ -0,0 +1,438 @@
+# type: ignore
+
+import copy
+import pickle
+import random
+
+import pytest
+
+from magic_list import CachedList
+from magic_list import L
+from magic_list import SortedList
+from magic_list import TypedList
+from magic_list import list
+from magic_list import _sorted
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    # a few items are enough to span several chunks
+    monkeypatch.setattr(_sorted, "_LOAD", 2)
+
+
+@pytest.fixture
+def sorted_list(request):
+    return SortedList(request.param)
+
+
+@pytest.mark.parametrize(
+    ["l", "result"],
+    [
+        [list((3, 5, 2)), SortedList((2, 3, 5))],
+        [list(("b", "a")), SortedList(("a", "b"))],
+        [list(), SortedList()],
+        [SortedList((3, 5, 2)), SortedList((2, 3, 5))],
+        [L[3, 5, 2].typed(), SortedList((2, 3, 5))],
+        [L[3, 5, 2].view(), SortedList((2, 3, 5))],
+    ],
+)
+def test_keep_sorted(l, result):
+    sorted_list = l.sorted(keep_sorted=True)
+
+    assert isinstance(sorted_list, SortedList)
+    assert sorted_list == result
+
+
+def test_keep_sorted_key():
+    sorted_list = list(("hola", "hi", "hello")).sorted(key=len, keep_sorted=True)
+
+    assert sorted_list.key is len
+    assert sorted_list == ["hi", "hola", "hello"]
+    assert (
+        repr(sorted_list)
+        == "SortedList(['hi', 'hola', 'hello'], key=<built-in function len>)"
+    )
+
+
+def test_keep_sorted_reverse():
+    with pytest.raises(ValueError, match="cannot be kept in reverse order"):
+        L[3, 5, 2].sorted(reverse=True, keep_sorted=True)
+
+
+def test_keep_sorted_cached():
+    cached = L[3, 5, 2].cached()
+    result = cached.sorted(keep_sorted=True)
+
+    assert isinstance(result, SortedList)
+    assert cached.sorted(keep_sorted=True) is not result
+    assert cached.cache_info().hits == 1
+    assert isinstance(cached.sorted(), CachedList)
+
+
+def test_keep_sorted_typed():
+    assert isinstance(TypedList([3, 5, 2]).sorted(keep_sorted=True), SortedList)
+    assert isinstance(TypedList([3, 5, 2]).sorted(), TypedList)
+
+
+@pytest.mark.usefixtures("small_chunks")
+def test_random_operations():
+    generator = random.Random(0)
+    sorted_list = SortedList(generator.randrange(50) for _ in range(20))
+    expected = sorted(sorted_list)
+
+    for _ in range(500):
+        operation = generator.randrange(4)
+        item = generator.randrange(50)
+
+        if operation == 0:
+            sorted_list.add(item)
+            expected.append(item)
+            expected.sort()
+        elif operation == 1 and expected:
+            i = generator.randrange(-len(expected), len(expected))
+
+            assert sorted_list.pop(i) == expected.pop(i)
+        elif operation == 2:
+            sorted_list.discard(item)
+
+            if item in expected:
+                expected.remove(item)
+        else:
+            assert (item in sorted_list) == (item in expected)
+            assert sorted_list.count(item) == expected.count(item)
+
+        assert sorted_list == expected
+        assert [sorted_list[i] for i in range(len(expected))] == expected
+        assert [*reversed(sorted_list)] == expected[::-1]
+
+
+@pytest.mark.usefixtures("small_chunks")
+def test_key_operations():
+    sorted_list = SortedList(key=len)
+
+    for item in ("ccc", "a", "bb", "dd", "e", "ffff", "g"):
+        sorted_list.add(item)
+
+    assert sorted_list == ["a", "e", "g", "bb", "dd", "ccc", "ffff"]
+    assert "dd" in sorted_list
+    assert "zz" not in sorted_list
+    assert sorted_list.count("g") == 1
+    assert sorted_list.index("dd") == 4
+    assert sorted_list.pop(0) == "a"
+    assert sorted_list.pop() == "ffff"
+
+    sorted_list.remove("ccc")
+
+    assert sorted_list == ["e", "g", "bb", "dd"]
+
+    while sorted_list:
+        sorted_list.pop(0)
+
+    assert sorted_list.data._lists == sorted_list.data._keys == []
+
+
+@pytest.mark.parametrize(
+    ["sorted_list", "item", "result"],
+    [
+        [(2, 3, 5, 5, 8), 5, 2],
+        [(2, 3, 5, 5, 8), 2, 0],
+        [(2, 3, 5, 5, 8), 8, 4],
+    ],
+    indirect=["sorted_list"],
+)
+def test_index(sorted_list, item, result):
+    assert sorted_list.index(item) == result
+
+
+def test_index_bounds():
+    sorted_list = SortedList((2, 3, 5, 5, 8))
+
+    assert sorted_list.index(5, 3) == 3
+    assert sorted_list.index(5, -2) == 3
+
+    with pytest.raises(ValueError, match="5 is not in list"):
+        sorted_list.index(5, 4)
+
+    with pytest.raises(ValueError, match="5 is not in list"):
+        sorted_list.index(5, 0, 2)
+
+    with pytest.raises(ValueError, match="4 is not in list"):
+        sorted_list.index(4)
+
+
+def test_uncomparable_item():
+    sorted_list = SortedList((1, 2))
+
+    assert "a" not in sorted_list
+
+    with pytest.raises(ValueError, match="'a' is not in list"):
+        sorted_list.index("a")
+
+    with pytest.raises(ValueError, match="'a' is not in list"):
+        sorted_list.remove("a")
+
+    assert sorted_list == [1, 2]
+
+
+@pytest.mark.parametrize(
+    ["bounds", "inclusive", "result"],
+    [
+        [(3, 8), (True, True), [3, 5, 5, 8]],
+        [(3, 8), (False, True), [5, 5, 8]],
+        [(3, 8), (True, False), [3, 5, 5]],
+        [(3, 8), (False, False), [5, 5]],
+        [(None, 4), (True, True), [2, 3]],
+        [(4, None), (True, True), [5, 5, 8, 13]],
+        [(None, None), (True, True), [2, 3, 5, 5, 8, 13]],
+        [(6, 4), (True, True), []],
+        [(20, 30), (True, True), []],
+    ],
+)
+def test_irange(bounds, inclusive, result):
+    sorted_list = SortedList((13, 2, 3, 5, 5, 8))
+
+    assert [*sorted_list.irange(*bounds, inclusive=inclusive)] == result
+
+
+def test_irange_key():
+    sorted_list = SortedList(["hola", "hi", "hello"], key=len)
+
+    assert [*sorted_list.irange(3, 4)] == ["hola"]
+
+
+@pytest.mark.parametrize(
+    ["key", "result"],
+    [[1, 2], [2, 2], [4, 3], [6, 5], [7, 8], [100, 8]],
+)
+def test_nearest(key, result):
+    assert SortedList((2, 3, 5, 8)).nearest(key) == result
+
+
+def test_nearest_key():
+    assert SortedList(["hola", "hi", "hello"], key=len).nearest(3) == "hi"
+
+
+def test_nearest_empty():
+    with pytest.raises(TypeError, match="empty list has no nearest item"):
+        SortedList().nearest(3)
+
+
+@pytest.mark.parametrize(
+    ["sorted_list", "result"],
+    [
+        [(3, 5, 2), (2, 5)],
+        [(3.5, -1, 2), (-1, 3.5)],
+    ],
+    indirect=["sorted_list"],
+)
+def test_min_max(sorted_list, result):
+    assert (sorted_list.min(), sorted_list.max()) == result
+
+
+def test_min_max_fallback():
+    assert SortedList((-3, 5, 2), key=abs).min() == -3
+    assert SortedList((-3, 5, 2), key=abs).max() == 5
+
+    with pytest.raises(TypeError, match="empty list has no minimum"):
+        SortedList().min()
+
+    with pytest.raises(TypeError, match="list of str has no maximum"):
+        SortedList("ab").max()
+
+
+def test_contains_incomparable():
+    assert "a" not in SortedList((3, 5, 2))
+
+
+@pytest.mark.parametrize(
+    ["call", "message"],
+    [
+        [lambda l: l.append(1), "can only be added with `add` or `update`"],
+        [lambda l: l.prepend(1), "can only be added with `add` or `update`"],
+        [lambda l: l.insert(0, 1), "can only be added with `add` or `update`"],
+        [lambda l: l.extend([1]), "can only be added with `add` or `update`"],
+        [lambda l: l.__setitem__(0, 1), "cannot be assigned"],
+        [lambda l: l.reverse(), "cannot be reordered"],
+        [lambda l: l.sort(reverse=True), "cannot be reordered"],
+        [lambda l: l.rotate_inplace(), "cannot be reordered"],
+    ],
+)
+def test_order_breaking_mutations(call, message):
+    sorted_list = SortedList((3, 5, 2))
+
+    with pytest.raises(TypeError, match=message):
+        call(sorted_list)
+
+    assert sorted_list == [2, 3, 5]
+
+
+@pytest.mark.usefixtures("small_chunks")
+def test_mutations():
+    sorted_list = SortedList((3, 5, 2, 8, 13))
+    sorted_list.sort()
+
+    assert sorted_list == [2, 3, 5, 8, 13]
+
+    del sorted_list[0]
+
+    assert sorted_list == [3, 5, 8, 13]
+
+    del sorted_list[1:3]
+
+    assert sorted_list == [3, 13]
+
+    sorted_list += [4, 1]
+
+    assert sorted_list == [1, 3, 4, 13]
+
+    sorted_list *= 2
+
+    assert sorted_list == [1, 1, 3, 3, 4, 4, 13, 13]
+
+    sorted_list.remove(3)
+    sorted_list.discard(3)
+    sorted_list.discard(3)
+
+    assert sorted_list == [1, 1, 4, 4, 13, 13]
+
+    with pytest.raises(ValueError, match="3 is not in list"):
+        sorted_list.remove(3)
+
+    with pytest.raises(IndexError, match="list index out of range"):
+        sorted_list.pop(6)
+
+    sorted_list.clear()
+
+    assert sorted_list == []
+
+    sorted_list.add(5)
+
+    assert sorted_list == [5]
+
+
+def test_update():
+    sorted_list = SortedList(L[0:100])
+    sorted_list.update([50, -1])
+
+    assert sorted_list.head == -1
+    assert sorted_list.count(50) == 2
+    assert len(sorted_list) == 102
+
+
+@pytest.mark.usefixtures("small_chunks")
+def test_slicing():
+    sorted_list = SortedList((13, 2, 3, 5, 8))
+
+    assert sorted_list[1:4] == SortedList((3, 5, 8))
+    assert isinstance(sorted_list[1:4], SortedList)
+    assert sorted_list[::2] == [2, 5, 13]
+    assert sorted_list.tail == [3, 5, 8, 13]
+    assert sorted_list.init == [2, 3, 5, 8]
+    assert (sorted_list.head, sorted_list.last) == (2, 13)
+    assert sorted_list[-2] == 8
+    assert sorted_list[::-1] == [13, 8, 5, 3, 2]
+    assert type(sorted_list[::-1]) is list
+
+    with pytest.raises(ValueError, match="cannot be sliced backwards"):
+        sorted_list.data[::-1]
+
+    with pytest.raises(IndexError, match="list index out of range"):
+        sorted_list[5]
+
+
+def test_comparisons():
+    sorted_list = SortedList((3, 5, 2))
+
+    assert sorted_list == L[2, 3, 5]
+    assert sorted_list == SortedList((5, 3, 2))
+    assert sorted_list == [2, 3, 5]
+    assert sorted_list != [3, 5, 2]
+    assert sorted_list < [2, 4]
+    assert sorted_list <= SortedList((2, 3, 5))
+    assert sorted_list > [2, 3]
+    assert sorted_list >= [2, 3, 5]
+
+
+def test_arithmetic():
+    sorted_list = SortedList((3, 5, 2))
+
+    assert sorted_list + [4] == SortedList((2, 3, 4, 5))
+    assert isinstance(sorted_list + [4], SortedList)
+    assert [4] + sorted_list == SortedList((2, 3, 4, 5))
+    assert sorted_list * 2 == [2, 2, 3, 3, 5, 5]
+    assert 2 * sorted_list == [2, 2, 3, 3, 5, 5]
+    assert sorted_list == [2, 3, 5]
+
+
+@pytest.mark.parametrize(
+    ["call", "result"],
+    [
+        [lambda l: l.filter(lambda n: n % 2 == 1), SortedList((3, 5, 13))],
+        [lambda l: l.mask([True, False, True, False, True]), SortedList((2, 5, 13))],
+        [lambda l: l.deduplicate(), SortedList((2, 3, 5, 8, 13))],
+    ],
+)
+def test_order_keeping_methods(call, result):
+    sorted_list = SortedList((13, 2, 3, 5, 8, 5))
+    sorted_list.discard(5)
+    returned_list = call(sorted_list)
+
+    assert isinstance(returned_list, SortedList)
+    assert returned_list == result
+
+
+def test_filter_unordered():
+    sorted_list = SortedList((13, 2, 3, 5, 8), key=abs)
+    returned_list = sorted_list.filter(lambda n: n % 2 == 1, ordered=False)
+
+    assert returned_list == [3, 5, 13]
+    assert returned_list.key is abs
+
+
+@pytest.mark.parametrize(
+    ["call", "result"],
+    [
+        [lambda l: l.reversed(), [5, 3, 2]],
+        [lambda l: l.sorted(reverse=True), [5, 3, 2]],
+        [lambda l: l.sorted(keep_sorted=True), SortedList((2, 3, 5))],
+        [lambda l: l.rotate(), [5, 2, 3]],
+        [lambda l: l.map(lambda n: -n), [-2, -3, -5]],
+        [lambda l: l.scan(lambda a, b: a + b, 0), [0, 2, 5, 10]],
+        [lambda l: l.scan_right(lambda a, b: a + b, 0), [0, 5, 8, 10]],
+        [lambda l: l.merge(lambda a, b: a - b, [3, 2, 1]), [-1, 1, 4]],
+        [lambda l: l.fill_left(0, 1), [0, 2, 3, 5]],
+        [lambda l: l.fill_right(0, 1), [2, 3, 5, 0]],
+        [lambda l: l.interleave(0), [2, 0, 3, 0, 5]],
+        [lambda l: l.select([2, 0]), [5, 2]],
+    ],
+)
+def test_order_breaking_methods(call, result):
+    returned_list = call(SortedList((3, 5, 2)))
+
+    assert returned_list == result
+    assert isinstance(returned_list, list)
+
+
+def test_shuffled():
+    returned_list = SortedList((3, 5, 2)).shuffled()
+
+    assert type(returned_list) is list
+    assert sorted(returned_list) == [2, 3, 5]
+
+
+def test_copy_and_pickle():
+    sorted_list = SortedList(["hola", "hi", "hello"], key=len)
+
+    for clone in (
+        sorted_list.copy(),
+        copy.copy(sorted_list),
+        pickle.loads(pickle.dumps(sorted_list)),
+    ):
+        clone.add("hey")
+
+        assert clone == ["hi", "hey", "hola", "hello"]
+        assert clone.key is len
+
+    assert sorted_list == ["hi", "hola", "hello"]
+    assert repr(SortedList((3, 2))) == "SortedList([2, 3])"
+    assert repr(SortedList((3, 2)).data) == "[2, 3]"
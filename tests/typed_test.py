@@ -0,0 +1,304 @@
+# type: ignore
+
+import array
+import copy
+import math
+import operator
+import pickle
+
+import pytest
+
+from magic_list import L
+from magic_list import TypedList
+from magic_list import list
+
+from .utils import double
+from .utils import greater_than_four
+
+
+@pytest.fixture
+def prebuild_typed(request):
+    if request.param == "typed_int_filled":
+        return TypedList((3, 5, 20, -1))
+    elif request.param == "typed_float_filled":
+        return TypedList((3.5, 5.0, 20.25, -1.0))
+    elif request.param == "typed_empty":
+        return TypedList()
+
+
+@pytest.mark.parametrize(
+    ["args", "typecode", "result"],
+    [
+        [(), "d", []],
+        [((3, 5),), "q", [3, 5]],
+        [((3, 5.5),), "d", [3.0, 5.5]],
+        [((3, 5), "i"), "i", [3, 5]],
+        [((3, 5), "d"), "d", [3.0, 5.0]],
+        [(array.array("b", (3, 5)),), "b", [3, 5]],
+        [(list((3, 5)),), "q", [3, 5]],
+        [(TypedList((3, 5), "h"),), "h", [3, 5]],
+        [((n for n in (3, 5)),), "q", [3, 5]],
+    ],
+)
+def test_typed_init_ok(args, typecode, result):
+    typed = TypedList(*args)
+
+    assert typed.typecode == typecode
+    assert isinstance(typed.data, array.array)
+    assert typed.data.tolist() == result
+
+
+@pytest.mark.parametrize(
+    ["args", "exception", "message"],
+    [
+        [(("hello",),), TypeError, "typed list items must be integers or floats"],
+        [((3.5,), "q"), TypeError, "'float' object cannot be interpreted"],
+    ],
+)
+def test_typed_init_err(args, exception, message):
+    with pytest.raises(exception, match=message):
+        TypedList(*args)
+
+
+def test_typed_from_list():
+    assert L[3, 5, 2].typed() == TypedList((3, 5, 2))
+    assert L[3, 5, 2].typed("f").typecode == "f"
+
+    with pytest.raises(TypeError, match="typed list items must be integers or floats"):
+        L["hello"].typed()
+
+
+def test_typed_repr():
+    assert repr(TypedList((3, 5))) == "TypedList([3, 5], typecode='q')"
+
+
+def test_typed_buffer():
+    typed = TypedList((3, 5, 20), "q")
+    view = typed.memoryview()
+
+    assert view.format == "q"
+    assert view.nbytes == 24
+    assert view.tolist() == [3, 5, 20]
+    assert typed.__buffer__(0).obj is typed.data
+
+
+def test_typed_copy_and_pickle():
+    typed = TypedList((3, 5), "i")
+
+    for duplicate in (
+        typed.copy(),
+        copy.copy(typed),
+        pickle.loads(pickle.dumps(typed)),
+    ):
+        assert duplicate == typed
+        assert duplicate.typecode == "i"
+        assert duplicate.data is not typed.data
+
+
+def test_typed_comparisons():
+    typed = TypedList((3, 5))
+
+    assert typed == [3, 5]
+    assert typed == list((3, 5))
+    assert list((3, 5)) == typed
+    assert typed == TypedList((3.0, 5.0))
+    assert typed != (3, 5)
+    assert typed < [3, 6]
+    assert typed <= list((3, 5))
+    assert typed > TypedList((3, 4))
+    assert typed >= [3, 5]
+
+
+def test_typed_sum_strategies():
+    floats = TypedList([0.1] * 10)
+
+    assert floats.sum() == 1.0
+    assert floats.sum(strategy="reduce") == 0.9999999999999999
+    assert floats.sum(start=1.0) == 2.0
+    assert TypedList((3, 5), "i").sum(start=10) == 18
+    assert TypedList().sum(start=0) == 0
+
+
+def test_typed_sum_not_finite():
+    assert TypedList([1e308, 1e308]).sum() == float("inf")
+    assert math.isnan(TypedList([float("inf"), float("-inf")]).sum())
+
+
+def test_typed_iteration():
+    typed = TypedList((3, 5, 20))
+
+    assert [*typed] == [3, 5, 20]
+    assert [*reversed(typed)] == [20, 5, 3]
+
+
+def test_typed_mutations():
+    typed = TypedList((3, 5, 20, -1))
+
+    typed[0] = 4
+    typed[1:3] = [7, 8, 9]
+    assert typed == [4, 7, 8, 9, -1]
+
+    typed += [1]
+    typed.extend(list((2,)))
+    typed.extend(TypedList((3,)))
+    typed.prepend(0)
+    assert typed == [0, 4, 7, 8, 9, -1, 1, 2, 3]
+
+    typed.sort(reverse=True)
+    assert typed == [9, 8, 7, 4, 3, 2, 1, 0, -1]
+    assert typed.typecode == "q"
+
+    typed.clear()
+    assert typed == []
+
+    with pytest.raises(TypeError):
+        typed.append("hello")
+
+
+def test_typed_arithmetic():
+    typed = TypedList((3, 5), "i")
+
+    assert typed + [1] == [3, 5, 1]
+    assert [1] + typed == [1, 3, 5]
+    assert typed * 2 == [3, 5, 3, 5]
+
+    for result in (typed + [1], [1] + typed, typed * 2):
+        assert result.typecode == "i"
+
+
+@pytest.mark.parametrize(
+    ["prebuild_typed", "build", "result", "typecode"],
+    [
+        ["typed_int_filled", lambda t: t.map(double), [6, 10, 40, -2], "q"],
+        [
+            "typed_int_filled",
+            lambda t: t.map(lambda n: n / 2),
+            [1.5, 2.5, 10, -0.5],
+            "d",
+        ],
+        ["typed_int_filled", lambda t: t.map(lambda n: n * 2**70), None, None],
+        ["typed_float_filled", lambda t: t.map(int), [3, 5, 20, -1], "q"],
+        ["typed_float_filled", lambda t: t.map(double), [7.0, 10.0, 40.5, -2.0], "d"],
+        ["typed_int_filled", lambda t: t.map(lambda n: n > 4), None, None],
+        [
+            "typed_int_filled",
+            lambda t: t.map(lambda n: n if n > 4 else 0.5),
+            None,
+            None,
+        ],
+        ["typed_int_filled", lambda t: t.filter(greater_than_four), [5, 20], "q"],
+        ["typed_int_filled", lambda t: t.mask([0, 1, 0, 1]), [5, -1], "q"],
+        ["typed_int_filled", lambda t: t.select([3, 0, 0]), [-1, 3, 3], "q"],
+        ["typed_int_filled", lambda t: t.reversed(), [-1, 20, 5, 3], "q"],
+        ["typed_int_filled", lambda t: t.sorted(), [-1, 3, 5, 20], "q"],
+        ["typed_int_filled", lambda t: t.sorted(reverse=True), [20, 5, 3, -1], "q"],
+        ["typed_int_filled", lambda t: t.rotate(), [-1, 3, 5, 20], "q"],
+        ["typed_int_filled", lambda t: t.tail, [5, 20, -1], "q"],
+        ["typed_int_filled", lambda t: t.take(2), [3, 5], "q"],
+        ["typed_float_filled", lambda t: t.drop(3), [-1.0], "d"],
+        ["typed_empty", lambda t: t.filter(greater_than_four), [], "d"],
+    ],
+    indirect=["prebuild_typed"],
+)
+def test_typed_transformations_ok(prebuild_typed, build, result, typecode):
+    transformed = build(prebuild_typed)
+
+    if typecode is None:
+        assert not isinstance(transformed, TypedList)
+        assert isinstance(transformed, list)
+    else:
+        assert isinstance(transformed, TypedList)
+        assert transformed.typecode == typecode
+        assert transformed == result
+
+
+def test_typed_map_keeps_typecode():
+    assert TypedList((3, 5), "b").map(double).typecode == "b"
+    assert TypedList((3, 5), "b").map(lambda n: n * 100).typecode == "q"
+    assert TypedList((1.5, 2.5), "f").map(lambda n: n * 2).typecode == "f"
+    assert TypedList((1.5, 2.5)).map(round) == [2, 2]
+    assert TypedList((1.5, 2.5)).map(round).typecode == "q"
+    assert TypedList((), "b").map(double).typecode == "b"
+
+
+@pytest.mark.parametrize(
+    ["build", "result", "typecode"],
+    [
+        [lambda t: t.deduplicate(), [3, 5], "i"],
+        [lambda t: t.deduplicate(key=lambda n: n % 2), [3], "i"],
+        [lambda t: t.scan(operator.add, 0), [0, 3, 8, 13], "i"],
+        [lambda t: t.scan(operator.add, 0.5), [0.5, 3.5, 8.5, 13.5], "d"],
+        [lambda t: t.scan_right(operator.add, 0), [0, 5, 10, 13], "i"],
+        [lambda t: t.merge(operator.mul, [1, 2, 3]), [3, 10, 15], "i"],
+        [lambda t: t.merge(operator.truediv, [1, 2, 4]), [3, 2.5, 1.25], "d"],
+    ],
+)
+def test_typed_keeps_typecode(build, result, typecode):
+    transformed = build(TypedList((3, 5, 5), "i"))
+
+    assert isinstance(transformed, TypedList)
+    assert transformed.typecode == typecode
+    assert transformed == result
+
+
+def test_typed_merge_falls_back_to_list():
+    merged = TypedList((3, 5)).merge(lambda a, b: f"{a}{b}", ["a", "b"])
+
+    assert type(merged) is list
+    assert merged == list(("3a", "5b"))
+
+
+def test_typed_map_falls_back_to_list():
+    mapped = TypedList((3, 5)).map(str)
+
+    assert type(mapped) is list
+    assert mapped == list(("3", "5"))
+
+
+@pytest.mark.parametrize(
+    ["prebuild_typed", "method", "result"],
+    [
+        ["typed_int_filled", "sum", 27],
+        ["typed_float_filled", "sum", 27.75],
+        ["typed_int_filled", "sum", 27],
+        ["typed_int_filled", "mean", 6.75],
+        ["typed_int_filled", "min", -1],
+        ["typed_float_filled", "max", 20.25],
+    ],
+    indirect=["prebuild_typed"],
+)
+def test_typed_aggregates_ok(prebuild_typed, method, result):
+    assert getattr(prebuild_typed, method)() == result
+
+
+@pytest.mark.parametrize(
+    ["prebuild_typed", "call", "exception", "message"],
+    [
+        ["typed_empty", lambda t: t.sum(), TypeError, "cannot perform summation"],
+        ["typed_empty", lambda t: t.mean(), TypeError, "mean of empty list"],
+        ["typed_empty", lambda t: t.min(), TypeError, "empty list has no minimum"],
+        ["typed_empty", lambda t: t.max(), TypeError, "empty list has no maximum"],
+        [
+            "typed_int_filled",
+            lambda t: t.mask([1]),
+            TypeError,
+            "mask length must be the same as the list",
+        ],
+        [
+            "typed_int_filled",
+            lambda t: t.merge(operator.add, [1]),
+            TypeError,
+            "the length of the two sequences must be equal",
+        ],
+        [
+            "typed_int_filled",
+            lambda t: t.select([1, 4]),
+            IndexError,
+            "index 4 is out of bounds",
+        ],
+    ],
+    indirect=["prebuild_typed"],
+)
+def test_typed_err(prebuild_typed, call, exception, message):
+    with pytest.raises(exception, match=message):
+        call(prebuild_typed)
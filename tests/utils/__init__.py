@@ -11,3 +11,7 @@ def greater_than_four(x):
 
 def contains_letter_l(x):
     return "l" in x
+
+
+def double_first(x):
+    x[0] *= 2
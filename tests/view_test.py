@@ -0,0 +1,213 @@
+# type: ignore
+
+import copy
+import pickle
+
+import pytest
+
+from magic_list import L
+from magic_list import ListView
+from magic_list import deque
+from magic_list import list
+
+
+@pytest.fixture
+def parent():
+    return list((3, 5, 20, -1, 8))
+
+
+def is_view_of(value, parent):
+    return (
+        isinstance(value, ListView)
+        and not value.is_materialized
+        and value.data._buffer is parent.data
+    )
+
+
+def test_view_ok(parent):
+    view = parent.view()
+
+    assert is_view_of(view, parent)
+    assert is_view_of(ListView(view), parent)
+    assert is_view_of(view.copy(), parent)
+    assert view == parent
+    assert parent == view
+    assert repr(view) == "[3, 5, 20, -1, 8]"
+    assert len(view) == 5
+
+
+@pytest.mark.parametrize(
+    ["build", "result"],
+    [
+        [lambda v: v.tail, list((5, 20, -1, 8))],
+        [lambda v: v.init, list((3, 5, 20, -1))],
+        [lambda v: v.take(2), list((3, 5))],
+        [lambda v: v.take_right(2), list((-1, 8))],
+        [lambda v: v.drop(2), list((20, -1, 8))],
+        [lambda v: v.drop_right(2), list((3, 5, 20))],
+        [lambda v: v.slice(1, 3), list((5, 20, -1))],
+        [lambda v: v[::2], list((3, 20, 8))],
+        [lambda v: v[::-1], list((8, -1, 20, 5, 3))],
+        [lambda v: v[::-2].tail, list((20, 3))],
+        [lambda v: v.tail.tail.init, list((20, -1))],
+        [lambda v: v.copy(), list((3, 5, 20, -1, 8))],
+        [lambda v: copy.copy(v), list((3, 5, 20, -1, 8))],
+        [lambda v: v.view(), list((3, 5, 20, -1, 8))],
+    ],
+)
+def test_view_slicing_ok(parent, build, result):
+    view = build(parent.view())
+
+    assert is_view_of(view, parent)
+    assert view == result
+
+
+def test_view_split_ok(parent):
+    left, item, right = parent.view().partition(2)
+
+    assert item == 20
+    assert is_view_of(left, parent) and left == list((3, 5))
+    assert is_view_of(right, parent) and right == list((-1, 8))
+
+    for part in (*parent.view().bisect(2), *parent.view().trisect(1, 3)):
+        assert is_view_of(part, parent)
+
+    assert parent.view().trisect(1, 3) == (list((3,)), list((5, 20)), list((-1, 8)))
+
+
+def test_view_read_api(parent):
+    view = parent.view().tail
+
+    assert view[0] == 5
+    assert view[-1] == 8
+    assert [*view] == [5, 20, -1, 8]
+    assert [*reversed(view)] == [8, -1, 20, 5]
+    assert 20 in view
+    assert 3 not in view
+    assert view.count(20) == 1
+    assert view.index(-1) == 2
+    assert view.index(-1, 1, 3) == 2
+    assert view.head == 5
+    assert view.last == 8
+    assert view.sum() == 32
+    assert view.map(str) == list(("5", "20", "-1", "8"))
+    assert view.filter(lambda n: n > 4) == list((5, 20, 8))
+    assert view.sorted() == list((-1, 5, 8, 20))
+    assert view.rotate() == list((8, 5, 20, -1))
+    assert [*view.irotate()] == [8, 5, 20, -1]
+    assert not view.is_materialized
+
+
+@pytest.mark.parametrize(
+    ["key", "exception", "message"],
+    [
+        [10, IndexError, "list index out of range"],
+        [-10, IndexError, "list index out of range"],
+    ],
+)
+def test_view_getitem_err(parent, key, exception, message):
+    with pytest.raises(exception, match=message):
+        parent.view()[key]
+
+
+def test_view_index_err(parent):
+    with pytest.raises(ValueError, match="3 is not in list"):
+        parent.view().tail.index(3)
+
+    with pytest.raises(ValueError, match="5 is not in list"):
+        parent.view().index(5, 2)
+
+
+def test_view_comparisons(parent):
+    view = parent.view()
+
+    assert view.take(2) < list((3, 6))
+    assert view.take(2) <= [3, 5]
+    assert view.take(2) > parent.view().take(1)
+    assert view.take(2) >= list((3, 5))
+    assert [3, 5] == view.take(2).data
+    assert view.take(2).data != (3, 5)
+    assert view.take(2) != (3, 5)
+    assert [3, 6] > view.take(2).data
+    assert view.take(2).data.__lt__(()) is NotImplemented
+    assert view.take(2).data.__le__(()) is NotImplemented
+    assert view.take(2).data.__gt__(()) is NotImplemented
+    assert view.take(2).data.__ge__(()) is NotImplemented
+
+
+def test_view_arithmetic(parent):
+    view = parent.view().take(2)
+
+    assert view + [1] == list((3, 5, 1))
+    assert view + view == list((3, 5, 3, 5))
+    assert list((1,)) + view == list((1, 3, 5))
+    assert [1] + view == list((1, 3, 5))
+    assert view * 2 == list((3, 5, 3, 5))
+    assert 2 * view == list((3, 5, 3, 5))
+    assert view.data.__add__(()) is NotImplemented
+    assert view.data.__radd__(()) is NotImplemented
+
+
+def test_view_sees_item_assignments(parent):
+    view = parent.view().drop(1)
+    parent[1] = 42
+
+    assert view == list((42, 20, -1, 8))
+
+
+def test_view_materialize(parent):
+    view = parent.view().drop(1)
+    view.materialize()
+    parent[1] = 42
+
+    assert view.is_materialized
+    assert view == list((5, 20, -1, 8))
+
+    view.materialize()
+    assert view == list((5, 20, -1, 8))
+    assert isinstance(view.tail, ListView)
+    assert view.tail.is_materialized
+    assert view.copy() == view
+    assert view.copy().data is not view.data
+
+
+@pytest.mark.parametrize(
+    ["mutate", "result"],
+    [
+        [lambda v: v.__setitem__(0, 0), list((0, 20, -1))],
+        [lambda v: v.__delitem__(0), list((20, -1))],
+        [lambda v: v.__iadd__([1]), list((5, 20, -1, 1))],
+        [lambda v: v.__imul__(2), list((5, 20, -1, 5, 20, -1))],
+        [lambda v: v.append(1), list((5, 20, -1, 1))],
+        [lambda v: v.insert(0, 1), list((1, 5, 20, -1))],
+        [lambda v: v.pop(), list((5, 20))],
+        [lambda v: v.remove(20), list((5, -1))],
+        [lambda v: v.clear(), list()],
+        [lambda v: v.reverse(), list((-1, 20, 5))],
+        [lambda v: v.sort(), list((-1, 5, 20))],
+        [lambda v: v.extend([1, 2]), list((5, 20, -1, 1, 2))],
+        [lambda v: v.prepend(1), list((1, 5, 20, -1))],
+        [lambda v: v.rotate_inplace(), list((-1, 5, 20))],
+    ],
+)
+def test_view_copy_on_write(parent, mutate, result):
+    view = parent.view().slice(1, 3)
+    mutate(view)
+
+    assert view.is_materialized
+    assert view == result
+    assert parent == list((3, 5, 20, -1, 8))
+
+
+def test_view_pickle(parent):
+    view = pickle.loads(pickle.dumps(parent.view().tail.take(2)))
+
+    assert view == list((5, 20))
+    assert view.is_materialized
+
+
+def test_view_over():
+    assert ListView.over([3, 5]) == list((3, 5))
+    assert ListView.over(ListView.over([3, 5]).data) == list((3, 5))
+    assert ListView([3, 5]).is_materialized
+    assert L[3, 5, 2].view().tail == deque((3, 5, 2)).view().tail